@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Main entry point for PixelVault."""
 
+import logging
+import logging.handlers
+import queue
+
 import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk
@@ -10,9 +14,25 @@ from .ui.main_window import MainWindow
 
 def main():
     """Run the application."""
+    # Records are only queued on the calling thread and written to stderr by
+    # a listener thread, so logging never blocks the UI on a slow terminal
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    
+    # Prefer the dark theme variant; set before any widget is styled so
+    # nothing has to be restyled for it
+    Gtk.Settings.get_default().props.gtk_application_prefer_dark_theme = True
+    
     window = MainWindow()
     window.show_all()
-    Gtk.main()
+    try:
+        Gtk.main()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """API module for PixelVault."""
 
+import logging
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum, auto
 from .wallhaven import WallhavenAPI, Category as WallhavenCategory, Purity as WallhavenPurity
@@ -8,6 +9,28 @@ from .waifupics import WaifuPicsAPI
 from .nekosmoe import NekosMoeAPI
 from ..settings import settings
 
+log = logging.getLogger("pixelvault.api")
+
+
+def _tag_names(tags) -> List[str]:
+    """Normalize a source's tag list to plain tag names.
+    
+    Args:
+        tags: List of tag names or tag objects with a "name" key
+        
+    Returns:
+        List of tag names
+    """
+    names = []
+    for tag in tags or []:
+        if isinstance(tag, dict):
+            if tag.get("name"):
+                names.append(tag["name"])
+        elif isinstance(tag, str):
+            names.append(tag)
+    return names
+
+
 class ImageSource(Enum):
     """Enum for different image sources."""
     WALLHAVEN = auto()
@@ -114,7 +137,9 @@ class SourceManager:
             tags: List of tags to filter by
             page: Page number for pagination
             reset_seed: Whether to reset the random seed (for new searches)
-            **kwargs: Additional arguments for the API
+            **kwargs: Additional arguments for the API. For Wallhaven,
+                "seed" gives the random-sort seed to use; callers passing
+                it track the seed themselves and the shared one is untouched
             
         Returns:
             Dictionary containing images list and pagination info
@@ -139,9 +164,9 @@ class SourceManager:
                 # Check if NSFW or Sketchy content is requested and we have an API key
                 requested_purity_value = requested_purity.value if hasattr(requested_purity, 'value') else requested_purity
                 if (requested_purity_value in ["110", "111"]) and not self.wallhaven_api_key:
-                    print(f"Warning: NSFW or Sketchy content requested but no API key provided. Falling back to SFW.")
-                    print(f"Original purity request: {requested_purity_value}")
-                    print(f"API key present: {bool(self.wallhaven_api_key)}")
+                    log.warning("NSFW or Sketchy content requested but no API key provided. Falling back to SFW.")
+                    log.debug("Original purity request: %s", requested_purity_value)
+                    log.debug("API key present: %s", bool(self.wallhaven_api_key))
                     # Only fall back to SFW if no API key is available
                     wallhaven_params['purity'] = WallhavenPurity.SFW
                 
@@ -172,30 +197,35 @@ class SourceManager:
                 wallhaven_params['query'] = kwargs['query']
             
             # Reset seed if requested (for new searches)
-            if reset_seed:
+            explicit_seed = 'seed' in kwargs
+            if reset_seed and not explicit_seed:
                 self.wallhaven_random_seed = None
                 
             # Get images based on the selected method
             method = kwargs.get('method', 'latest')
             if method == 'top':
-                print(f"Fetching top wallpapers, page {page}")
+                log.debug("Fetching top wallpapers, page %s", page)
                 response = self.wallhaven.get_top(**wallhaven_params)
             elif method == 'random':
                 # For random sorting, include the seed if we have one
-                if not reset_seed and self.wallhaven_random_seed:
-                    print(f"Using existing seed for random: {self.wallhaven_random_seed}, page {page}")
-                    wallhaven_params['seed'] = self.wallhaven_random_seed
+                if explicit_seed:
+                    seed = kwargs['seed']
+                else:
+                    seed = None if reset_seed else self.wallhaven_random_seed
+                if seed:
+                    log.debug("Using existing seed for random: %s, page %s", seed, page)
+                    wallhaven_params['seed'] = seed
                 else:
-                    print(f"Fetching new random wallpapers without seed, page {page}")
+                    log.debug("Fetching new random wallpapers without seed, page %s", page)
                 
                 response = self.wallhaven.get_random(**wallhaven_params)
                 
                 # Store the seed from the response for next page
-                if 'meta' in response and 'seed' in response['meta']:
+                if not explicit_seed and 'meta' in response and 'seed' in response['meta']:
                     self.wallhaven_random_seed = response['meta']['seed']
-                    print(f"Received new seed: {self.wallhaven_random_seed}")
+                    log.debug("Received new seed: %s", self.wallhaven_random_seed)
             else:  # default to latest
-                print(f"Fetching latest wallpapers, page {page}")
+                log.debug("Fetching latest wallpapers, page %s", page)
                 response = self.wallhaven.get_latest(**wallhaven_params)
             
             # Normalize Wallhaven response
@@ -211,24 +241,25 @@ class SourceManager:
                 if len(response["data"]) == 0:
                     purity_value = wallhaven_params['purity'].value if hasattr(wallhaven_params['purity'], 'value') else wallhaven_params['purity']
                     if purity_value in ["110", "111"] and self.wallhaven_api_key:
-                        print(f"No results found with purity: {purity_value}")
-                        print("If you're looking for NSFW content, verify that:")
-                        print("1. Your Wallhaven API key is valid")
-                        print("2. Your Wallhaven account has NSFW content enabled")
-                        print("3. Your Wallhaven account has the appropriate purity levels enabled")
+                        log.warning("No results found with purity: %s", purity_value)
+                        log.warning("If you're looking for NSFW content, verify that:")
+                        log.warning("1. Your Wallhaven API key is valid")
+                        log.warning("2. Your Wallhaven account has NSFW content enabled")
+                        log.warning("3. Your Wallhaven account has the appropriate purity levels enabled")
                 
                 images = [
                     {
                         "id": item["id"],
                         "url": item["path"],
                         "preview": item["thumbs"]["large"],
+                        "color": (item.get("colors") or [""])[0],
                         "source": item.get("source", ""),
                         "width": item["dimension_x"],
                         "height": item["dimension_y"],
                         "provider": "wallhaven",
                         "category": item.get("category", ""),
                         "purity": item.get("purity", ""),
-                        "tags": [tag.get("name", "") for tag in item.get("tags", [])]
+                        "tags": _tag_names(item.get("tags"))
                     }
                     for item in response["data"]
                 ]
@@ -266,16 +297,17 @@ class SourceManager:
                             "id": str(item["image_id"]),
                             "url": item["url"],
                             "preview": item["url"],  # Use the main URL for preview
+                            "color": item.get("dominant_color") or "",
                             "source": item.get("source", ""),
                             "width": item.get("width", 0),
                             "height": item.get("height", 0),
                             "provider": "waifu.im",
-                            "tags": item.get("tags", [])
+                            "tags": _tag_names(item.get("tags"))
                         }
                         images.append(image_data)
                     except KeyError as e:
-                        print(f"Error normalizing Waifu.im image data: {e}")
-                        print(f"Image data: {item}")
+                        log.error("Error normalizing Waifu.im image data: %s", e)
+                        log.debug("Image data: %s", item)
                         continue
             
             return {
@@ -305,14 +337,14 @@ class SourceManager:
                 if category.startswith("nsfw-"):
                     category = category[5:]  # Remove "nsfw-" prefix
                     is_nsfw = True
-                    print(f"NSFW tag detected, using category: {category} with NSFW mode")
+                    log.debug("NSFW tag detected, using category: %s with NSFW mode", category)
                 else:
-                    print(f"Using category: {category} for waifu.pics (NSFW: {is_nsfw})")
+                    log.debug("Using category: %s for waifu.pics (NSFW: %s)", category, is_nsfw)
             
             # Validate that the category exists for the selected endpoint
             valid_categories = self._waifupics_nsfw_categories if is_nsfw else self._waifupics_sfw_categories
             if category not in valid_categories:
-                print(f"Warning: Category '{category}' is not valid for Waifu.pics. Using 'waifu' instead.")
+                log.warning("Category '%s' is not valid for Waifu.pics. Using 'waifu' instead.", category)
                 category = 'waifu'  # Fall back to default if not valid
                 
             # Get multiple images
@@ -332,7 +364,7 @@ class SourceManager:
                     }
                     images.append(image_data)
             else:
-                print(f"No images found for category: {category} (NSFW: {is_nsfw})")
+                log.debug("No images found for category: %s (NSFW: %s)", category, is_nsfw)
             
             return {
                 "images": images,
@@ -402,12 +434,12 @@ class SourceManager:
                         "height": 0,  # Height not provided
                         "provider": "nekos.moe",
                         "nsfw": item.get("nsfw", False),
-                        "tags": item.get("tags", [])
+                        "tags": _tag_names(item.get("tags"))
                     }
                     images.append(image_data)
                 except Exception as e:
-                    print(f"Error normalizing nekos.moe image data: {e}")
-                    print(f"Image data: {item}")
+                    log.error("Error normalizing nekos.moe image data: %s", e)
+                    log.debug("Image data: %s", item)
                     continue
             
             return {
@@ -1,7 +1,12 @@
+import logging
 import requests
 from typing import Dict, List, Optional, Any, Union
 import random
 
+from .session import create_session
+
+log = logging.getLogger("pixelvault.api")
+
 
 class NekosMoeAPI:
     """Client for the nekos.moe API."""
@@ -15,7 +20,7 @@ class NekosMoeAPI:
             token: Optional token for authenticated requests
         """
         self.token = token
-        self.session = requests.Session()
+        self.session = create_session()
         
         # Set default headers
         self.session.headers.update({
@@ -40,9 +45,9 @@ class NekosMoeAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching image from nekos.moe: {e}")
+            log.error("Error fetching image from nekos.moe: %s", e)
             if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
+                log.debug("Response: %s", e.response.text)
             return {"image": None}
     
     def get_random_images(self, nsfw: bool = False, count: int = 20) -> Dict[str, Any]:
@@ -70,9 +75,9 @@ class NekosMoeAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching random images from nekos.moe: {e}")
+            log.error("Error fetching random images from nekos.moe: %s", e)
             if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
+                log.debug("Response: %s", e.response.text)
             return {"images": []}
     
     def search_images(self, 
@@ -117,9 +122,9 @@ class NekosMoeAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error searching images from nekos.moe: {e}")
+            log.error("Error searching images from nekos.moe: %s", e)
             if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
+                log.debug("Response: %s", e.response.text)
             return {"images": []}
     
     def get_popular_tags(self, limit: int = 20) -> List[str]:
@@ -0,0 +1,34 @@
+"""Shared HTTP connection pool for the API clients."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One connection pool shared by every API client. Each client keeps its own
+# session for its headers and credentials, but connections to an API host
+# are reused across clients and survive a client being recreated (e.g.
+# after an API key change), so pages after the first skip TCP and TLS setup.
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    # Once retries run out the last response is returned as usual, so the
+    # clients' raise_for_status error handling still applies
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+)
+
+
+def create_session() -> requests.Session:
+    """Create an API session backed by the shared connection pool.
+    
+    Returns:
+        A session that keeps connections alive and retries transient errors
+    """
+    session = requests.Session()
+    session.mount("http://", _ADAPTER)
+    session.mount("https://", _ADAPTER)
+    return session
@@ -1,8 +1,13 @@
+import logging
 import requests
 from typing import Dict, List, Optional, Any, Union
 import sys
 import importlib.util
 
+from .session import create_session
+
+log = logging.getLogger("pixelvault.api")
+
 # Try to import the official waifuim.py library if available
 try:
     waifuim_spec = importlib.util.find_spec('waifuim')
@@ -14,7 +19,7 @@ if has_waifuim_lib:
     try:
         import waifuim
         import asyncio
-        print("Using official waifuim.py library")
+        log.debug("Using official waifuim.py library")
     except ImportError:
         has_waifuim_lib = False
 
@@ -44,7 +49,7 @@ class WaifuImAPI:
             asyncio.set_event_loop(self.loop)
         else:
             # Fall back to requests-based client
-            self.session = requests.Session()
+            self.session = create_session()
             
             # Set default headers
             self.session.headers.update({
@@ -102,7 +107,7 @@ class WaifuImAPI:
                 result = self.loop.run_until_complete(fetch_images())
                 return result
             except Exception as e:
-                print(f"Error using official waifuim.py library: {e}")
+                log.error("Error using official waifuim.py library: %s", e)
                 # Fall back to requests-based implementation
                 return self._get_images_with_requests(
                     included_tags, excluded_tags, is_nsfw, 
@@ -150,9 +155,9 @@ class WaifuImAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching images from Waifu.im: {e}")
+            log.error("Error fetching images from Waifu.im: %s", e)
             if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
+                log.debug("Response: %s", e.response.text)
             return {"images": []}
     
     def get_random(self, is_nsfw: bool = False, selected_tags: List[str] = None) -> Dict[str, Any]:
@@ -167,13 +172,13 @@ class WaifuImAPI:
         """
         # If specific tags are selected, use those directly
         if selected_tags and len(selected_tags) > 0:
-            print(f"Fetching Waifu.im images with selected tags: {selected_tags}")
+            log.debug("Fetching Waifu.im images with selected tags: %s", selected_tags)
             result = self.get_images(
                 included_tags=selected_tags,
                 is_nsfw=is_nsfw,
                 limit=30
             )
-            print(f"Waifu.im API response with tags {selected_tags}: {len(result.get('images', [])) if 'images' in result else 0} images")
+            log.debug("Waifu.im API response with tags %s: %s images", selected_tags, len(result.get('images', [])) if 'images' in result else 0)
             return result
             
         # Otherwise make multiple API calls and combine the results to get more images
@@ -216,12 +221,12 @@ class WaifuImAPI:
                     break
                     
             except Exception as e:
-                print(f"Error fetching images with tags {tags}: {e}")
+                log.error("Error fetching images with tags %s: %s", tags, e)
                 continue
         
         # Return the combined results
         result = {"images": all_images}
-        print(f"Waifu.im API combined response: {len(all_images)} images")
+        log.debug("Waifu.im API combined response: %s images", len(all_images))
         return result
     
     def get_favorites(self) -> Dict[str, Any]:
@@ -240,7 +245,7 @@ class WaifuImAPI:
                 
                 return self.loop.run_until_complete(fetch_favorites())
             except Exception as e:
-                print(f"Error using official waifuim.py library for favorites: {e}")
+                log.error("Error using official waifuim.py library for favorites: %s", e)
                 # Fall back to requests implementation
         
         try:
@@ -248,7 +253,7 @@ class WaifuImAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching favorites from Waifu.im: {e}")
+            log.error("Error fetching favorites from Waifu.im: %s", e)
             return {"images": []}
     
     def get_tags(self) -> Dict[str, Any]:
@@ -264,7 +269,7 @@ class WaifuImAPI:
                 
                 return self.loop.run_until_complete(fetch_tags())
             except Exception as e:
-                print(f"Error using official waifuim.py library for tags: {e}")
+                log.error("Error using official waifuim.py library for tags: %s", e)
                 # Fall back to requests implementation
         
         try:
@@ -272,7 +277,7 @@ class WaifuImAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching tags from Waifu.im: {e}")
+            log.error("Error fetching tags from Waifu.im: %s", e)
             return {"versatile": [], "nsfw": []}
 
     def get_all_tags(self) -> Dict[str, List[Dict[str, Any]]]:
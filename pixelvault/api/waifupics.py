@@ -1,6 +1,11 @@
+import logging
 import requests
 from typing import Dict, List, Optional, Any
 
+from .session import create_session
+
+log = logging.getLogger("pixelvault.api")
+
 class WaifuPicsAPI:
     """Client for the Waifu.pics API."""
     
@@ -20,7 +25,7 @@ class WaifuPicsAPI:
     
     def __init__(self):
         """Initialize the API client."""
-        self.session = requests.Session()
+        self.session = create_session()
     
     def get_random(self, category: str, is_nsfw: bool = False) -> Dict[str, Any]:
         """Get a random image from a specific category.
@@ -38,7 +43,7 @@ class WaifuPicsAPI:
         # Validate category exists for the selected endpoint
         valid_categories = self.NSFW_CATEGORIES if is_nsfw else self.SFW_CATEGORIES
         if category not in valid_categories:
-            print(f"Warning: Category '{category}' is not valid for the {type_path} endpoint.")
+            log.warning("Category '%s' is not valid for the %s endpoint.", category, type_path)
             # Fall back to 'waifu' if category doesn't exist
             category = "waifu"
         
@@ -47,9 +52,9 @@ class WaifuPicsAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching image from Waifu.pics: {e}")
+            log.error("Error fetching image from Waifu.pics: %s", e)
             if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
+                log.debug("Response: %s", e.response.text)
             return {}
     
     def get_many(self, category: str, is_nsfw: bool = False, exclude: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -69,7 +74,7 @@ class WaifuPicsAPI:
         # Validate category exists for the selected endpoint
         valid_categories = self.NSFW_CATEGORIES if is_nsfw else self.SFW_CATEGORIES
         if category not in valid_categories:
-            print(f"Warning: Category '{category}' is not valid for the {type_path} endpoint.")
+            log.warning("Category '%s' is not valid for the %s endpoint.", category, type_path)
             # Fall back to 'waifu' if category doesn't exist
             category = "waifu"
         
@@ -81,7 +86,7 @@ class WaifuPicsAPI:
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching images from Waifu.pics: {e}")
+            log.error("Error fetching images from Waifu.pics: %s", e)
             if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
+                log.debug("Response: %s", e.response.text)
             return {"files": []} 
\ No newline at end of file
@@ -1,7 +1,12 @@
+import logging
 import requests
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 
+from .session import create_session
+
+log = logging.getLogger("pixelvault.api")
+
 class Purity(Enum):
     """Purity levels for Wallhaven API."""
     SFW = "100"              # Only SFW
@@ -144,20 +149,20 @@ class WallhavenAPI:
             api_key: Optional API key for authenticated requests
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = create_session()
         # Set user agent to avoid 403 errors
         self.session.headers.update({
             "User-Agent": "PixelVault/1.0 (https://github.com/pixelvault)"
         })
         
         if api_key:
-            print(f"Initializing Wallhaven API with API key: {api_key[:4]}...{api_key[-4:] if len(api_key) > 8 else ''}")
+            log.debug("Initializing Wallhaven API with API key: %s...%s", api_key[:4], api_key[-4:] if len(api_key) > 8 else '')
             # Set the API key as a header for all requests
             self.session.headers.update({"X-API-Key": api_key})
             # Also keep the URL param method as fallback for specific endpoints
             self.session.params = {"apikey": api_key}
         else:
-            print("Initializing Wallhaven API without an API key (NSFW content will be limited)")
+            log.debug("Initializing Wallhaven API without an API key (NSFW content will be limited)")
             self.session.params = {}
     
     def search(self, 
@@ -204,8 +209,8 @@ class WallhavenAPI:
             
         # Check if NSFW content is requested without an API key
         if purity in ("110", "111") and not self.api_key:
-            print("Warning: NSFW or Sketchy content requested but no API key provided.")
-            print(f"Please set a valid Wallhaven API key in settings to access NSFW content.")
+            log.warning("NSFW or Sketchy content requested but no API key provided.")
+            log.warning("Please set a valid Wallhaven API key in settings to access NSFW content.")
             # We'll continue with the request, but it will likely return only SFW content
             
         # Process sorting
@@ -261,27 +266,27 @@ class WallhavenAPI:
             
             # Check if we got any results
             if "data" in data and len(data["data"]) == 0 and purity in ("110", "111"):
-                print(f"No results found. If you're looking for NSFW content, verify your Wallhaven API key is valid.")
-                print(f"API returned meta: {data.get('meta', {})}")
+                log.warning("No results found. If you're looking for NSFW content, verify your Wallhaven API key is valid.")
+                log.debug("API returned meta: %s", data.get('meta', {}))
             
             return data
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                print("Authentication error: Invalid API key")
+                log.error("Authentication error: Invalid API key")
                 # Return empty result set
                 return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": "Invalid API key"}
             elif e.response.status_code == 429:
-                print("Rate limit exceeded. Please try again later.")
+                log.warning("Rate limit exceeded. Please try again later.")
                 # Return empty result set
                 return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": "Rate limit exceeded"}
             elif e.response.status_code == 400:
-                print(f"Bad request: Invalid parameters - {e}")
+                log.error("Bad request: Invalid parameters - %s", e)
                 return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": "Invalid parameters"}
             else:
-                print(f"HTTP error {e.response.status_code}: {e}")
+                log.error("HTTP error %s: %s", e.response.status_code, e)
                 return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": f"HTTP error {e.response.status_code}"}
         except Exception as e:
-            print(f"Error during search: {str(e)}")
+            log.error("Error during search: %s", e)
             return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": str(e)}
     
     def get_wallpaper(self, wallpaper_id: str) -> Dict[str, Any]:
@@ -300,10 +305,10 @@ class WallhavenAPI:
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
                 if not self.api_key:
-                    print("Authentication error: API key required for this wallpaper (likely NSFW content)")
+                    log.error("Authentication error: API key required for this wallpaper (likely NSFW content)")
                     return {"data": None, "error": "API key required for NSFW content"}
                 else:
-                    print("Authentication error: Invalid API key or insufficient permissions")
+                    log.error("Authentication error: Invalid API key or insufficient permissions")
                     return {"data": None, "error": "Invalid API key or insufficient permissions"}
             else:
                 raise
@@ -338,7 +343,7 @@ class WallhavenAPI:
             return response.json()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                print("Authentication error: Invalid API key")
+                log.error("Authentication error: Invalid API key")
                 return {"data": None, "error": "Invalid API key"}
             else:
                 raise
@@ -368,10 +373,10 @@ class WallhavenAPI:
             return response.json()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                print("Authentication error: Invalid API key")
+                log.error("Authentication error: Invalid API key")
                 return {"data": [], "error": "Invalid API key"}
             elif e.response.status_code == 404:
-                print(f"User not found: {username}")
+                log.warning("User not found: %s", username)
                 return {"data": [], "error": f"User not found: {username}"}
             else:
                 raise
@@ -394,10 +399,10 @@ class WallhavenAPI:
             return response.json()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                print("Authentication error: This collection may be private and requires a valid API key")
+                log.error("Authentication error: This collection may be private and requires a valid API key")
                 return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": "Authentication required"}
             elif e.response.status_code == 404:
-                print(f"Collection not found: User={username}, Collection ID={collection_id}")
+                log.warning("Collection not found: User=%s, Collection ID=%s", username, collection_id)
                 return {"data": [], "meta": {"current_page": page, "last_page": page}, "error": "Collection not found"}
             else:
                 raise
@@ -416,7 +421,7 @@ class WallhavenAPI:
         if 'sorting' in kwargs:
             del kwargs['sorting']
             
-        print(f"Fetching latest wallpapers, page {page}")
+        log.debug("Fetching latest wallpapers, page %s", page)
         return self.search(sorting=Sorting.DATE_ADDED, page=page, **kwargs)
     
     def get_top(self, page: int = 1, top_range: Union[str, TopRange] = TopRange.ONE_MONTH, **kwargs) -> Dict[str, Any]:
@@ -436,7 +441,7 @@ class WallhavenAPI:
         if 'top_range' in kwargs:
             del kwargs['top_range']
             
-        print(f"Fetching top wallpapers, page {page}")
+        log.debug("Fetching top wallpapers, page %s", page)
         return self.search(sorting=Sorting.TOPLIST, page=page, top_range=top_range, **kwargs)
     
     def get_random(self, page: int = 1, seed: Optional[str] = None, **kwargs) -> Dict[str, Any]:
@@ -456,7 +461,7 @@ class WallhavenAPI:
         if 'seed' in kwargs:
             del kwargs['seed']
             
-        print(f"Fetching random wallpapers, page {page}")
+        log.debug("Fetching random wallpapers, page %s", page)
         return self.search(sorting=Sorting.RANDOM, page=page, seed=seed, **kwargs)
         
     def verify_api_key(self) -> bool:
@@ -466,36 +471,36 @@ class WallhavenAPI:
             True if API key is valid, False otherwise
         """
         if not self.api_key:
-            print("No API key provided to verify")
+            log.debug("No API key provided to verify")
             return False
             
         try:
             # Try to get user settings which requires authentication
             response = self.session.get(f"{self.BASE_URL}/settings")
             response.raise_for_status()
-            print("API key verification successful")
+            log.debug("API key verification successful")
             return True
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                print("API key verification failed: Invalid API key")
+                log.error("API key verification failed: Invalid API key")
                 return False
             else:
-                print(f"API key verification failed: HTTP error {e.response.status_code}")
+                log.error("API key verification failed: HTTP error %s", e.response.status_code)
                 return False
         except Exception as e:
-            print(f"API key verification failed: {str(e)}")
+            log.error("API key verification failed: %s", e)
             return False
             
     def debug_request(self, url: str, params: Dict[str, Any] = None) -> None:
         """Debug an API request by showing request and response details."""
-        print(f"\nDEBUG REQUEST: {url}")
-        print(f"Headers: {self.session.headers}")
-        print(f"Params: {params if params else self.session.params}")
+        log.debug("Debug request: %s", url)
+        log.debug("Headers: %s", self.session.headers)
+        log.debug("Params: %s", params if params else self.session.params)
         
         try:
             response = self.session.get(url, params=params)
-            print(f"Status Code: {response.status_code}")
-            print(f"Response Headers: {response.headers}")
-            print(f"Response Body: {response.text[:500]}...")  # Show first 500 chars
+            log.debug("Status Code: %s", response.status_code)
+            log.debug("Response Headers: %s", response.headers)
+            log.debug("Response Body: %s...", response.text[:500])  # Show first 500 chars
         except Exception as e:
-            print(f"Error during debug request: {e}")
+            log.error("Error during debug request: %s", e)
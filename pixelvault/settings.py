@@ -1,7 +1,10 @@
+import logging
 import os
 import json
 from pathlib import Path
 
+log = logging.getLogger("pixelvault.settings")
+
 class Settings:
     """Manages application settings and user preferences."""
     
@@ -30,7 +33,7 @@ class Settings:
         # Config file path
         self.config_file = os.path.join(self.config_dir, "settings.json")
         
-        print(f"Settings initialized, config file: {self.config_file}")
+        log.debug("Settings initialized, config file: %s", self.config_file)
         
         # Load existing settings
         self.load()
@@ -43,11 +46,11 @@ class Settings:
                     loaded = json.load(f)
                     # Update current settings with loaded values
                     self.current.update(loaded)
-                    print(f"Settings loaded: {self.current}")
+                    log.debug("Settings loaded: %s", self.current)
             else:
-                print(f"No settings file found, using defaults: {self.current}")
+                log.debug("No settings file found, using defaults: %s", self.current)
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            log.error("Error loading settings: %s", e)
     
     def save(self):
         """Save current settings to file."""
@@ -56,9 +59,9 @@ class Settings:
                 json.dump(self.current, f, indent=2)
                 f.flush()
                 os.fsync(f.fileno())  # Ensure data is written to disk
-            print(f"Settings saved: {self.current}")
+            log.debug("Settings saved: %s", self.current)
         except Exception as e:
-            print(f"Error saving settings: {e}")
+            log.error("Error saving settings: %s", e)
     
     def get(self, key, default=None):
         """Get a setting value.
@@ -83,15 +86,36 @@ class Settings:
         # Check if value changed
         old_value = self.current.get(key)
         if old_value != value:
-            print(f"Setting '{key}' changed: {old_value} -> {value}")
+            log.debug("Setting '%s' changed: %s -> %s", key, old_value, value)
             self.current[key] = value
             self.save()
         else:
-            print(f"Setting '{key}' unchanged: {value}")
+            log.debug("Setting '%s' unchanged: %s", key, value)
+    
+    def update(self, values):
+        """Set several setting values and save settings once.
+        
+        Args:
+            values: Mapping of setting keys to values
+            
+        Returns:
+            Dict mapping each key whose value changed to its (old, new) values
+        """
+        changes = {}
+        for key, value in values.items():
+            old_value = self.current.get(key)
+            if old_value != value:
+                changes[key] = (old_value, value)
+                self.current[key] = value
+        
+        if changes:
+            log.debug("Settings changed: %s", ', '.join(changes))
+            self.save()
+        return changes
     
     def reset(self):
         """Reset settings to defaults."""
-        print("Resetting all settings to defaults")
+        log.debug("Resetting all settings to defaults")
         self.current = self.defaults.copy()
         self.save()
 
@@ -0,0 +1,37 @@
+"""Desktop integration helpers for the PixelVault UI."""
+
+import functools
+import shutil
+import subprocess
+from typing import Optional
+
+# File managers to open folders with, in order of preference
+FILE_MANAGERS = ("xdg-open", "nautilus", "thunar", "dolphin")
+
+
+@functools.lru_cache(maxsize=None)
+def find_file_manager() -> Optional[str]:
+    """Find the first installed file manager, looked up once per session.
+
+    Returns:
+        Path of the file manager executable, or None if none is installed
+    """
+    return next(filter(None, map(shutil.which, FILE_MANAGERS)), None)
+
+
+def open_folder(path: str) -> bool:
+    """Open a folder in the file manager.
+
+    Args:
+        path: Folder to open
+
+    Returns:
+        True if a file manager was started, False if none is installed
+    """
+    file_manager = find_file_manager()
+    if file_manager is None:
+        return False
+    # Detach the file manager so it outlives the app and doesn't get the
+    # terminal's signals
+    subprocess.Popen([file_manager, path], start_new_session=True)
+    return True
@@ -0,0 +1,25 @@
+"""Shared icon lookups for the PixelVault UI."""
+
+import gi
+gi.require_version("Gtk", "3.0")
+from gi.repository import Gio
+from typing import Dict
+
+# Themed icons are immutable, so one instance per name can back every
+# Gtk.Image built from it across windows and dialogs.
+_ICON_CACHE: Dict[str, Gio.ThemedIcon] = {}
+
+
+def themed_icon(name: str) -> Gio.ThemedIcon:
+    """Get a cached themed icon.
+
+    Args:
+        name: Icon name from the icon theme
+
+    Returns:
+        The shared Gio.ThemedIcon for that name
+    """
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = Gio.ThemedIcon(name=name)
+    return icon
@@ -1,20 +1,958 @@
 import gi
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GdkPixbuf, Gio, GLib, Gdk
+from gi.repository import Gtk, GdkPixbuf, Gio, GLib, Gdk, GObject
 import os
+import datetime
+import hashlib
+import logging
+import hmac
+import functools
+import socket
+import struct
 import threading
+import zlib
 import requests
-from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tempfile
-import subprocess
-from typing import List, Dict, Any, Optional
+import shutil
+from collections import OrderedDict, defaultdict
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
-from PIL import Image, PngImagePlugin, ImageSequence
+from urllib.parse import urlsplit
+from PIL import Image, ImageSequence
 
 from ..api import SourceManager, ImageSource
 from ..api.wallhaven import Category as WallhavenCategory, Purity as WallhavenPurity, Sorting as WallhavenSorting
 from ..settings import settings
 from .settings_dialog import SettingsDialog
+from .desktop import open_folder
+from .icons import themed_icon
+from .workers import PriorityThreadPool
+
+log = logging.getLogger("pixelvault.ui")
+
+# API and image CDN hosts resolved in the background at startup so the
+# first requests don't pay for DNS lookups
+PRERESOLVE_HOSTS = (
+    "wallhaven.cc",
+    "w.wallhaven.cc",
+    "th.wallhaven.cc",
+    "api.waifu.im",
+    "cdn.waifu.im",
+    "api.waifu.pics",
+    "i.waifu.pics",
+    "nekos.moe",
+)
+
+# Connect/read timeouts for image requests
+THUMBNAIL_TIMEOUT = (3, 10)
+IMAGE_TIMEOUT = (5, 30)
+
+# Size of the chunks image data is streamed in; large enough that a typical
+# preview takes only a few PixbufLoader.write() round-trips
+STREAM_CHUNK_SIZE = 65536
+
+# Buffer size for saving full-size images to disk
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+# Images at least this large are downloaded as PARALLEL_DOWNLOAD_PARTS byte
+# ranges over separate connections when the server supports it
+PARALLEL_DOWNLOAD_MIN_BYTES = 4 * 1024 * 1024
+PARALLEL_DOWNLOAD_PARTS = 4
+
+# Sorting for each entry of the sort combo (Latest, Top, Random)
+WALLHAVEN_SORT_OPTIONS = (
+    (WallhavenSorting.DATE_ADDED, "latest"),
+    (WallhavenSorting.TOPLIST, "top"),
+    (WallhavenSorting.RANDOM, "random"),
+)
+NEKOSMOE_SORT_OPTIONS = ("newest", "likes", "random")
+
+# Wallhaven options for the advanced dialog's selections: categories and
+# purity by their checkbox bit strings, sorting by the source feature id
+_CATEGORY_BY_BITS = {category.value: category for category in WallhavenCategory}
+_PURITY_BY_BITS = {purity.value: purity for purity in WallhavenPurity}
+_SORTING_BY_ID = {
+    "latest": WallhavenSorting.DATE_ADDED,
+    "toplist": WallhavenSorting.TOPLIST,
+    "random": WallhavenSorting.RANDOM,
+    "views": WallhavenSorting.VIEWS,
+    "favorites": WallhavenSorting.FAVORITES,
+    "relevance": WallhavenSorting.RELEVANCE,
+}
+
+# Number of result pages fetched ahead of the one being scrolled to
+PAGE_PREFETCH_DEPTH = 2
+
+# Scroll handling runs at most once per interval while the view is moving
+SCROLL_THROTTLE_MS = 50
+
+# Fraction of the results scrolled past (measured at the bottom of the
+# viewport) at which the next page is loaded
+SCROLL_LOAD_RATIO = 0.8
+
+# Delay before a sort change reloads, so quick successive changes coalesce
+SORT_DEBOUNCE_MS = 150
+
+# Delay before a search or clear reloads, so repeated presses coalesce
+SEARCH_DEBOUNCE_MS = 150
+
+# Saved file extension for each image URL suffix; anything else is saved as .jpg
+IMAGE_EXTENSIONS = {".gif": ".gif", ".jpg": ".jpg", ".jpeg": ".jpg", ".png": ".png"}
+
+# GSettings schema holding the GNOME desktop background, set in-process
+GNOME_BACKGROUND_SCHEMA = "org.gnome.desktop.background"
+
+# Wallpaper setter commands by executable; {path} is the image file
+WALLPAPER_SETTERS = {
+    "xfconf-query": ["xfconf-query", "-c", "xfce4-desktop", "-p",
+                     "/backdrop/screen0/monitor0/workspace0/last-image", "-s", "{path}"],
+    "feh": ["feh", "--bg-fill", "{path}"],
+    "nitrogen": ["nitrogen", "--set-zoom-fill", "{path}"],
+}
+
+# Extended attribute recording the URL a download came from; the
+# freedesktop.org name, also set by browsers and wget
+ORIGIN_XATTR = "user.xdg.origin.url"
+
+# How often download progress is reported
+PROGRESS_INTERVAL = 256 * 1024
+
+# Largest thumbnail we are willing to download
+THUMBNAIL_MAX_BYTES = 5 * 1024 * 1024
+
+# Bounding box for grid thumbnails
+THUMBNAIL_MAX_WIDTH = 550
+THUMBNAIL_MAX_HEIGHT = 400
+
+# Bounding box for the image details preview; smaller images are not enlarged
+PREVIEW_MAX_WIDTH = 550
+PREVIEW_MAX_HEIGHT = 400
+
+# Number of thumbnails downloaded and decoded concurrently
+THUMBNAIL_WORKERS = 6
+
+# Number of full-size downloads and wallpaper fetches run concurrently
+IO_WORKERS = 4
+
+# Number of decoded thumbnails kept in memory
+THUMBNAIL_CACHE_SIZE = 256
+
+# Number of decoded dialog previews kept in memory
+PREVIEW_CACHE_SIZE = 16
+
+# Number of thumbnails the grid keeps decoded before it starts releasing the
+# ones more than THUMBNAIL_RELEASE_PAGES viewport heights away
+THUMBNAIL_LIVE_LIMIT = 200
+THUMBNAIL_RELEASE_PAGES = 3
+
+# Downloaded thumbnails persisted between sessions, pruned oldest-first
+THUMBNAIL_DISK_CACHE_DIR = Path(GLib.get_user_cache_dir()) / "pixelvault" / "thumbs"
+THUMBNAIL_DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+# Application style sheet, installed for the whole screen once by _install_css.
+# Rules for widget groups are scoped by a style class set on the widgets.
+APP_CSS = b"""
+    /* Fix label sizing issues */
+    label {
+        min-width: 50px;
+        min-height: 20px;
+    }
+    
+    .info-label {
+        min-width: 100px;
+    }
+    
+    .placeholder-label {
+        min-width: 100px;
+        min-height: 30px;
+    }
+    
+    /* Thumbnail grid */
+    .pixelvault-grid flowboxchild {
+        border-radius: 8px;
+        transition: all 200ms ease;
+        background-color: alpha(#000, 0.0);
+    }
+    .pixelvault-grid flowboxchild:hover {
+        background-color: alpha(#fff, 0.05);
+        box-shadow: 0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.24);
+    }
+    .pixelvault-grid flowboxchild:selected {
+        background-color: alpha(#fff, 0.1);
+        box-shadow: 0 3px 6px rgba(0,0,0,0.16), 0 3px 6px rgba(0,0,0,0.23);
+    }
+    
+    /* Tag badges */
+    .tag-badge {
+        background-color: rgba(60, 60, 70, 0.3);
+        border-radius: 12px;
+        padding: 2px 8px;
+        margin: 2px;
+        transition: all 0.2s ease;
+    }
+    
+    .tag-badge:hover {
+        background-color: rgba(70, 70, 90, 0.4);
+    }
+    
+    button.tag-remove-button {
+        padding: 0;
+        margin: 0;
+        min-height: 16px;
+        min-width: 16px;
+        opacity: 0.7;
+        transition: opacity 0.2s ease;
+    }
+    
+    button.tag-remove-button:hover {
+        opacity: 1.0;
+    }
+    
+    .tag-label {
+        color: #eee;
+        font-size: 12px;
+    }
+    
+    .mini-tag {
+        padding: 1px 4px;
+        margin: 1px;
+    }
+    
+    .mini-tag .tag-label {
+        font-size: 10px;
+    }
+    
+    /* NSFW tags */
+    .tag-nsfw {
+        background-color: rgba(231, 76, 60, 0.3);
+        border-left: 3px solid rgba(231, 76, 60, 0.8);
+    }
+    
+    /* Category-specific colors */
+    .tag-anime {
+        background-color: rgba(230, 126, 34, 0.3);
+        border-left: 3px solid rgba(230, 126, 34, 0.8);
+    }
+    
+    .tag-nature {
+        background-color: rgba(46, 204, 113, 0.3);
+        border-left: 3px solid rgba(46, 204, 113, 0.8);
+    }
+    
+    .tag-urban {
+        background-color: rgba(52, 152, 219, 0.3);
+        border-left: 3px solid rgba(52, 152, 219, 0.8);
+    }
+    
+    .tag-art {
+        background-color: rgba(155, 89, 182, 0.3);
+        border-left: 3px solid rgba(155, 89, 182, 0.8);
+    }
+    
+    .tag-fiction {
+        background-color: rgba(241, 196, 15, 0.3);
+        border-left: 3px solid rgba(241, 196, 15, 0.8);
+    }
+    
+    .tag-science {
+        background-color: rgba(41, 128, 185, 0.3);
+        border-left: 3px solid rgba(41, 128, 185, 0.8);
+    }
+    
+    .tag-technology {
+        background-color: rgba(52, 73, 94, 0.3);
+        border-left: 3px solid rgba(52, 73, 94, 0.8);
+    }
+    
+    .tag-design {
+        background-color: rgba(231, 76, 60, 0.3);
+        border-left: 3px solid rgba(231, 76, 60, 0.8);
+    }
+    
+    .tag-vehicles {
+        background-color: rgba(192, 57, 43, 0.3);
+        border-left: 3px solid rgba(192, 57, 43, 0.8);
+    }
+    
+    .tag-photography {
+        background-color: rgba(127, 140, 141, 0.3);
+        border-left: 3px solid rgba(127, 140, 141, 0.8);
+    }
+    
+    .tag-seasons {
+        background-color: rgba(26, 188, 156, 0.3);
+        border-left: 3px solid rgba(26, 188, 156, 0.8);
+    }
+    
+    .tag-other {
+        background-color: rgba(189, 195, 199, 0.3);
+        border-left: 3px solid rgba(189, 195, 199, 0.8);
+    }
+"""
+
+_css_installed = False
+
+
+def _install_css():
+    """Install APP_CSS for the default screen, once per process."""
+    global _css_installed
+    if _css_installed:
+        return
+    
+    css_provider = Gtk.CssProvider()
+    css_provider.load_from_data(APP_CSS)
+    Gtk.StyleContext.add_provider_for_screen(
+        Gdk.Screen.get_default(),
+        css_provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _css_installed = True
+
+
+def _create_http_session() -> requests.Session:
+    """Create the pooled HTTP session shared by all image requests.
+    
+    Returns:
+        A session that keeps connections alive and retries transient errors
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'PixelVault Image Downloader'})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session so thumbnails, previews and downloads reuse connections
+_SESSION = _create_http_session()
+
+
+def _preresolve_hosts(hosts):
+    """Resolve host names to prime the system resolver cache.
+    
+    Args:
+        hosts: Host names to resolve
+    """
+    for host in hosts:
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError as e:
+            log.debug("Could not pre-resolve %s: %s", host, e)
+
+
+def _fit_size(width: int, height: int, max_width: int, max_height: int, upscale: bool = True):
+    """Compute the largest size with the same aspect ratio that fits the bounds.
+    
+    Args:
+        width: Original width
+        height: Original height
+        max_width: Maximum width
+        max_height: Maximum height
+        upscale: Whether images smaller than the bounds may be enlarged
+        
+    Returns:
+        Tuple of (width, height)
+    """
+    scale = min(max_width / width, max_height / height)
+    if not upscale:
+        scale = min(scale, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def _paint_placeholder(widget: Gtk.DrawingArea, cr, rgba: Gdk.RGBA) -> bool:
+    """Fill a thumbnail placeholder with the image's dominant color.
+    
+    Args:
+        widget: The placeholder drawing area
+        cr: Cairo context to draw with
+        rgba: Color to fill with
+        
+    Returns:
+        False so default drawing continues
+    """
+    Gdk.cairo_set_source_rgba(cr, rgba)
+    cr.paint()
+    return False
+
+
+class LoadCancelled(Exception):
+    """Raised when an image load is abandoned because its widget went away."""
+
+
+def _load_scaled_image(chunks, max_width: int, max_height: int, upscale: bool = True,
+                       cancel: Optional[threading.Event] = None):
+    """Decode streamed image data, scaling it during decode.
+    
+    Chunks are fed to the loader as they arrive so decoding overlaps the
+    download, and the target size is set once the header is parsed so the
+    JPEG decoder can use its native DCT downscaling.
+    
+    Args:
+        chunks: Iterable of encoded image data, e.g. response.iter_content()
+        max_width: Maximum width of the decoded image
+        max_height: Maximum height of the decoded image
+        upscale: Whether images smaller than the bounds may be enlarged
+        cancel: Optional event that aborts the load when set
+        
+    Returns:
+        Tuple of (loader, original_width, original_height)
+        
+    Raises:
+        LoadCancelled: If cancel was set before the data was fully read
+    """
+    original_size = [0, 0]
+    
+    def on_size_prepared(loader, width, height):
+        original_size[:] = [width, height]
+        target = _fit_size(width, height, max_width, max_height, upscale)
+        if target != (width, height):
+            loader.set_size(*target)
+    
+    loader = GdkPixbuf.PixbufLoader()
+    loader.connect("size-prepared", on_size_prepared)
+    try:
+        for chunk in chunks:
+            if cancel is not None and cancel.is_set():
+                raise LoadCancelled()
+            loader.write(chunk)
+        loader.close()
+    except Exception:
+        try:
+            loader.close()
+        except GLib.Error:
+            pass
+        raise
+    
+    return loader, original_size[0], original_size[1]
+
+
+def _save_response(response, f, progress: Optional[Callable[[int, int], None]] = None,
+                   allow_ranges: bool = True):
+    """Copy a streamed response body into an open binary file.
+    
+    The file is preallocated from Content-Length where the platform allows,
+    so the filesystem can lay it out in one go, and the copy runs in large
+    blocks instead of a Python-level chunk loop. Large bodies from servers
+    that accept byte ranges are fetched in parallel parts instead.
+    
+    Args:
+        response: A requests response opened with stream=True
+        f: File to write the body to
+        progress: Optional callback taking (bytes_written, total_bytes),
+            called every PROGRESS_INTERVAL bytes; total is 0 if unknown
+        allow_ranges: Whether the body may be fetched in parallel parts
+    """
+    total = int(response.headers.get("Content-Length") or 0)
+    # With a Content-Encoding the header is the compressed size
+    if "Content-Encoding" in response.headers:
+        total = 0
+    if total > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, total)
+        except OSError:
+            pass  # Not supported by this filesystem
+    
+    response.raw.decode_content = True
+    if (allow_ranges and total >= PARALLEL_DOWNLOAD_MIN_BYTES and hasattr(os, "pwrite")
+            and response.headers.get("Accept-Ranges") == "bytes"):
+        try:
+            _save_response_ranges(response, f, total, progress)
+        except _RangesRefused as e:
+            # Some CDNs and proxies advertise ranges but answer them with
+            # the whole body; start over as a single stream
+            log.debug("Falling back to a single-stream download: %s", e)
+            with _SESSION.get(response.url, stream=True, timeout=IMAGE_TIMEOUT) as retry:
+                retry.raise_for_status()
+                f.seek(0)
+                f.truncate()
+                _save_response(retry, f, progress, allow_ranges=False)
+    elif progress is None:
+        shutil.copyfileobj(response.raw, f, DOWNLOAD_BUFFER_SIZE)
+    else:
+        written = 0
+        for block in iter(lambda: response.raw.read(PROGRESS_INTERVAL), b""):
+            f.write(block)
+            written += len(block)
+            progress(written, total)
+    # Drop any preallocated space the body didn't fill
+    f.truncate()
+
+
+class _RangesRefused(Exception):
+    """Raised when a server answers a byte range request with the whole body."""
+
+
+def _save_response_ranges(response, f, total: int,
+                          progress: Optional[Callable[[int, int], None]] = None):
+    """Download a response body in parallel byte ranges.
+    
+    The body is split into PARALLEL_DOWNLOAD_PARTS ranges. The first one is
+    read from the response itself and the others are requested over extra
+    connections, so a large image isn't held to one connection's throughput.
+    Each part is written at its own offset as it arrives. When one part
+    fails, the others stop at their next block.
+    
+    Args:
+        response: A requests response opened with stream=True whose server
+            accepts byte ranges
+        f: File to write the body to
+        total: Size of the body in bytes
+        progress: Optional callback taking (bytes_written, total_bytes)
+        
+    Raises:
+        _RangesRefused: If a range request isn't answered with that range
+        requests.RequestException: If a range request fails
+        OSError: If a part can't be read in full or written
+    """
+    fd = f.fileno()
+    part_size = -(-total // PARALLEL_DOWNLOAD_PARTS)
+    written = [0]
+    written_lock = threading.Lock()
+    abort = threading.Event()
+    
+    def copy_part(raw, start, end):
+        offset = start
+        while offset < end and not abort.is_set():
+            block = raw.read(min(PROGRESS_INTERVAL, end - offset))
+            if not block:
+                raise OSError(f"Connection closed at byte {offset} of {total}")
+            os.pwrite(fd, block, offset)
+            offset += len(block)
+            if progress is not None:
+                # Reported under the lock so the total never goes backwards
+                with written_lock:
+                    written[0] += len(block)
+                    progress(written[0], total)
+    
+    def fetch_part(start, end):
+        try:
+            headers = {"Range": f"bytes={start}-{end - 1}"}
+            with _SESSION.get(response.url, headers=headers, stream=True, timeout=IMAGE_TIMEOUT) as part:
+                part.raise_for_status()
+                if part.status_code != 206 or "Content-Encoding" in part.headers:
+                    raise _RangesRefused(f"Got status {part.status_code} for bytes {start}-{end - 1}")
+                copy_part(part.raw, start, end)
+        except BaseException:
+            abort.set()
+            raise
+    
+    with ThreadPoolExecutor(max_workers=PARALLEL_DOWNLOAD_PARTS - 1, thread_name_prefix="download") as executor:
+        futures = [
+            executor.submit(fetch_part, start, min(start + part_size, total))
+            for start in range(part_size, total, part_size)
+        ]
+        try:
+            with response:
+                copy_part(response.raw, 0, part_size)
+        except BaseException:
+            abort.set()
+            raise
+    
+    # Parts stopped by abort return quietly; the one that set it raised
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            raise error
+    
+    # Leave the file position at the end like a sequential copy would
+    f.seek(total)
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Encode a PNG chunk.
+    
+    Args:
+        chunk_type: Four-byte chunk type
+        data: Chunk payload
+        
+    Returns:
+        The chunk with its length and CRC
+    """
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+_PNG_IEND = _png_chunk(b"IEND", b"")
+
+
+def _png_metadata(image_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Get the text metadata saved into downloaded PNGs.
+    
+    Args:
+        image_data: Image data dictionary
+        
+    Returns:
+        (keyword, text) pairs for _png_add_text
+    """
+    metadata = []
+    if image_data.get('id'):
+        metadata.append(("ID", str(image_data['id'])))
+    if image_data.get('provider'):
+        metadata.append(("Provider", str(image_data['provider'])))
+    if image_data.get('source'):
+        metadata.append(("Source", str(image_data['source'])))
+    if image_data.get('width') and image_data.get('height'):
+        metadata.append(("Resolution", f"{image_data['width']}x{image_data['height']}"))
+    # Only set for animations
+    if image_data.get('frames'):
+        metadata.append(("Frames", str(image_data['frames'])))
+    if image_data.get('tags'):
+        metadata.append(("Tags", ", ".join(image_data['tags'])))
+    return metadata
+
+
+def _is_png(path: str) -> bool:
+    """Check whether a file is a PNG by its signature.
+    
+    The content decides rather than the file name, which comes from the
+    URL or the user and may not match what the server sent.
+    
+    Args:
+        path: File to check
+        
+    Returns:
+        True if the file starts with the PNG signature
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(_PNG_SIGNATURE)) == _PNG_SIGNATURE
+    except OSError:
+        return False
+
+
+def _png_add_text(path: str, items: List[Tuple[str, str]]):
+    """Add text metadata to a PNG file without re-encoding it.
+    
+    Text chunks may sit anywhere before IEND, so they are written over the
+    IEND chunk and IEND is appended again; the image data is not touched.
+    Values that aren't Latin-1 are stored as UTF-8 iTXt chunks, as PIL's
+    PngInfo.add_text does.
+    
+    Args:
+        path: PNG file to update
+        items: (keyword, text) pairs to add
+        
+    Raises:
+        ValueError: If the file isn't a PNG ending in an IEND chunk
+    """
+    chunks = []
+    for key, value in items:
+        try:
+            chunks.append(_png_chunk(b"tEXt", key.encode("latin-1") + b"\0" + value.encode("latin-1")))
+        except UnicodeEncodeError:
+            # Keyword, then no compression, no language and no translated keyword
+            chunks.append(_png_chunk(b"iTXt", key.encode("latin-1") + b"\0\0\0\0\0" + value.encode("utf-8")))
+    
+    with open(path, "r+b") as f:
+        if f.read(len(_PNG_SIGNATURE)) != _PNG_SIGNATURE:
+            raise ValueError("Not a PNG file")
+        f.seek(-len(_PNG_IEND), os.SEEK_END)
+        if f.read(len(_PNG_IEND)) != _PNG_IEND:
+            raise ValueError("PNG file does not end with an IEND chunk")
+        f.seek(-len(_PNG_IEND), os.SEEK_END)
+        f.write(b"".join(chunks) + _PNG_IEND)
+
+
+def _same_key(a: Optional[str], b: Optional[str]) -> bool:
+    """Compare two API keys in constant time.
+    
+    Args:
+        a: First key, None counts as empty
+        b: Second key, None counts as empty
+        
+    Returns:
+        True if the keys are equal
+    """
+    return hmac.compare_digest((a or "").encode(), (b or "").encode())
+
+
+def _reserve_path(directory: str, filename: str) -> str:
+    """Create an empty file under a name that isn't taken yet.
+    
+    Tries the file name as is, then with _1, _2, ... appended to its stem.
+    Creating the file with O_EXCL claims the name, so downloads started
+    back to back can't pick the same one.
+    
+    Args:
+        directory: Directory to create the file in
+        filename: Preferred file name
+        
+    Returns:
+        Path of the created file
+        
+    Raises:
+        OSError: If the file can't be created
+    """
+    base, ext = os.path.splitext(filename)
+    candidate = filename
+    existing = None
+    counter = 0
+    while True:
+        path = os.path.join(directory, candidate)
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return path
+        except FileExistsError:
+            # Read the directory once rather than stat-ing every candidate
+            if existing is None:
+                existing = set(os.listdir(directory))
+            counter += 1
+            while f"{base}_{counter}{ext}" in existing:
+                counter += 1
+            candidate = f"{base}_{counter}{ext}"
+
+
+def _set_origin(path: str, url: str):
+    """Record the URL a downloaded file came from.
+    
+    Skipped quietly where extended attributes aren't supported.
+    
+    Args:
+        path: Downloaded file
+        url: URL it was downloaded from
+    """
+    if hasattr(os, "setxattr"):
+        try:
+            os.setxattr(path, ORIGIN_XATTR, url.encode("utf-8"))
+        except OSError as e:
+            log.debug("Could not record origin of %s: %s", path, e)
+
+
+def _is_same_download(path: str, url: str) -> bool:
+    """Check whether a file is a complete earlier download of a URL.
+    
+    The origin recorded by _set_origin answers without any request. Files
+    without one are compared by size against a HEAD request, which only
+    works for files saved byte for byte, so PNGs (which get metadata
+    chunks added) never match that way.
+    
+    Args:
+        path: Existing file
+        url: URL about to be downloaded
+        
+    Returns:
+        True if downloading the URL again would give the same file
+    """
+    if hasattr(os, "getxattr"):
+        try:
+            return os.getxattr(path, ORIGIN_XATTR).decode("utf-8", "replace") == url
+        except OSError:
+            pass  # No origin recorded, or no xattr support
+    
+    if _is_png(path):
+        return False
+    try:
+        with _SESSION.head(url, allow_redirects=True, timeout=IMAGE_TIMEOUT) as head:
+            head.raise_for_status()
+            if "Content-Encoding" in head.headers:
+                return False
+            length = int(head.headers.get("Content-Length") or -1)
+        return length == os.path.getsize(path)
+    except (requests.RequestException, OSError, ValueError):
+        return False
+
+
+def _image_extension(image_data: Dict[str, Any]) -> str:
+    """Get the file extension to save an image with.
+    
+    Args:
+        image_data: Image data dictionary
+        
+    Returns:
+        One of ".gif", ".jpg" or ".png"
+    """
+    if image_data.get('is_gif', False):
+        return ".gif"
+    suffix = os.path.splitext(urlsplit(image_data.get("url", "")).path)[1].lower()
+    return IMAGE_EXTENSIONS.get(suffix, ".jpg")
+
+
+@functools.lru_cache(maxsize=None)
+def _find_wallpaper_setters() -> tuple:
+    """Find the installed wallpaper setters, looked up once per session.
+    
+    The setter matching the running desktop comes first, so an XFCE session
+    with the GNOME schemas installed still tries xfconf-query first.
+    
+    Returns:
+        Setters in the order they should be tried: "gnome" for the GNOME
+        background setting, otherwise keys into WALLPAPER_SETTERS
+    """
+    candidates = [cmd for cmd in WALLPAPER_SETTERS if shutil.which(cmd)]
+    # There is no default source when no schemas are installed at all
+    source = Gio.SettingsSchemaSource.get_default()
+    if source is not None and source.lookup(GNOME_BACKGROUND_SCHEMA, True) is not None:
+        candidates.insert(0, "gnome")
+    if "XFCE" in os.environ.get("XDG_CURRENT_DESKTOP", "").upper() and "xfconf-query" in candidates:
+        candidates.remove("xfconf-query")
+        candidates.insert(0, "xfconf-query")
+    return tuple(candidates)
+
+
+def _set_gnome_wallpaper(path: str) -> bool:
+    """Set the GNOME desktop background through GSettings.
+    
+    Writes the keys directly instead of running the gsettings CLI. Both the
+    light and, where the schema has it, dark style backgrounds are set.
+    
+    Args:
+        path: Path of the image file
+        
+    Returns:
+        False if the background setting is locked down
+    """
+    uri = Gio.File.new_for_path(path).get_uri()
+    background = Gio.Settings.new(GNOME_BACKGROUND_SCHEMA)
+    if not background.set_string("picture-uri", uri):
+        return False
+    if background.props.settings_schema.has_key("picture-uri-dark"):
+        background.set_string("picture-uri-dark", uri)
+    return True
+
+
+def _thumb_cache_path(url: str) -> Path:
+    """Get the on-disk cache location for a thumbnail URL.
+    
+    Files are fanned out over subdirectories named after the first two hex
+    digits of the key to keep directories small.
+    
+    Args:
+        url: Thumbnail URL
+        
+    Returns:
+        Path of the cache file
+    """
+    key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return THUMBNAIL_DISK_CACHE_DIR / key[:2] / key[2:]
+
+
+def _limit_chunks(chunks, max_bytes: int):
+    """Pass chunks through, failing once more than max_bytes have been read.
+    
+    Args:
+        chunks: Iterable of data chunks
+        max_bytes: Maximum total size
+        
+    Yields:
+        The chunks unchanged
+        
+    Raises:
+        ValueError: If the data exceeds max_bytes
+    """
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f"Image larger than {max_bytes // (1024 * 1024)} MB")
+        yield chunk
+
+
+def _read_chunks(f):
+    """Iterate over a binary file in streaming-sized chunks."""
+    return iter(lambda: f.read(STREAM_CHUNK_SIZE), b"")
+
+
+def _tee_chunks(chunks, f):
+    """Pass chunks through while writing a copy of them to a file.
+    
+    If a write fails the file is closed and copying stops, so a full disk
+    only costs the cache entry; callers check f.closed to spot this.
+    
+    Args:
+        chunks: Iterable of data chunks
+        f: Binary file to copy the chunks to
+        
+    Yields:
+        The chunks unchanged
+    """
+    for chunk in chunks:
+        if not f.closed:
+            try:
+                f.write(chunk)
+            except OSError as e:
+                log.debug("Could not write thumbnail cache file: %s", e)
+                f.close()
+        yield chunk
+
+
+def _prune_thumb_cache(cache_dir: Path, max_bytes: int):
+    """Delete the least recently used cache files until under the size cap.
+    
+    Cache hits refresh a file's modification time, so the oldest files are
+    the least recently used ones.
+    
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Maximum total size of the cache
+    """
+    entries = []
+    total = 0
+    for root, _dirs, files in os.walk(cache_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    
+    if total <= max_bytes:
+        return
+    
+    entries.sort()
+    for _mtime, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+def _split_animation(loader, image_data: Dict[str, Any]):
+    """Get the decoded result of a loader as a pixbuf or an animation.
+    
+    Marks the image data as a GIF when it turned out to be an animated GIF.
+    
+    Args:
+        loader: A closed PixbufLoader
+        image_data: Image data dictionary
+        
+    Returns:
+        Tuple of (pixbuf, animation); exactly one of them is set
+    """
+    animation = loader.get_animation()
+    if animation is not None and not animation.is_static_image():
+        if loader.get_format().get_name() == "gif":
+            image_data['is_gif'] = True
+        return None, animation
+    return loader.get_pixbuf(), None
+
+
+class ImageItem(GObject.Object):
+    """List model item wrapping one image's data dictionary."""
+    
+    def __init__(self, image: Dict[str, Any]):
+        """Initialize the item.
+        
+        Args:
+            image: Image data dictionary
+        """
+        super().__init__()
+        self.image = image
+
 
 class MainWindow(Gtk.Window):
     """Main window for the PixelVault application."""
@@ -23,46 +961,92 @@ class MainWindow(Gtk.Window):
         """Initialize the main window."""
         Gtk.Window.__init__(self, title="PixelVault")
         self.set_default_size(1000, 700)
-        self.connect("destroy", Gtk.main_quit)
-        
-        # Apply CSS to fix label sizing issues
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            label {
-                min-width: 50px;
-                min-height: 20px;
-            }
-            
-            .info-label {
-                min-width: 100px;
-            }
-            
-            .placeholder-label {
-                min-width: 100px;
-                min-height: 30px;
-            }
-        """)
-        
-        # Apply the CSS to all widgets
-        screen = Gdk.Screen.get_default()
-        style_context = Gtk.StyleContext()
-        style_context.add_provider_for_screen(
-            screen, 
-            css_provider, 
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self.connect("destroy", self._on_destroy)
+        
+        # Warm up DNS for the image hosts while the UI is being built
+        threading.Thread(target=_preresolve_hosts, args=(PRERESOLVE_HOSTS,), daemon=True).start()
+        
+        # Keep the thumbnail disk cache under its size cap
+        threading.Thread(
+            target=_prune_thumb_cache,
+            args=(THUMBNAIL_DISK_CACHE_DIR, THUMBNAIL_DISK_CACHE_MAX_BYTES),
+            daemon=True
+        ).start()
+        
+        # Install the application style sheet
+        _install_css()
         
         # Initialize API source manager
         self.source_manager = SourceManager()
         
-        # Current images list
-        self.images = []
+        # Bounded pool for thumbnail downloads instead of a thread per image;
+        # loads near the viewport are moved to the front of its queue
+        self._thumb_pool = PriorityThreadPool(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumb")
+        self._thumb_index = 0
+        
+        # Full-size downloads and wallpaper fetches share a bounded pool
+        # instead of starting a thread per click
+        self._io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
+        
+        # Thumbnails whose load is not started yet, in grid order
+        self._unloaded_thumbs: List[Gtk.Box] = []
+        self._loaded_thumbs: List[Gtk.Box] = []
+        
+        # LRU of decoded thumbnails, shared by the loader threads
+        self._thumb_cache = OrderedDict()
+        self._thumb_cache_lock = threading.Lock()
+        
+        # LRU of decoded dialog previews by image URL, under the same lock
+        self._preview_cache = OrderedDict()
+        
+        # Thumbnail fetches in progress by cache key, joined by other loads
+        # of the same preview
+        self._thumb_fetches: Dict[tuple, Future] = {}
+        self._thumb_fetch_lock = threading.Lock()
+        
+        # Bumped whenever the grid is cleared so stale loads can be discarded
+        self._thumb_generation = 0
+        
+        # Finished thumbnails waiting to be shown, applied in batches
+        self._pending_thumb_updates = []
+        self._pending_thumb_lock = threading.Lock()
+        
+        # Give the decoded thumbnails back when the system runs low on memory
+        # (Gio.MemoryMonitor needs GLib 2.64)
+        if hasattr(Gio, "MemoryMonitor"):
+            self._memory_monitor = Gio.MemoryMonitor.dup_default()
+            self._memory_monitor.connect("low-memory-warning", self._on_low_memory)
         
         # Pagination state
         self.current_page = 1
         self.has_next_page = True
         self.is_loading = False
         
+        # Result pages are fetched on a small pool so the next few pages
+        # can be requested while the current one is still being browsed.
+        # Futures are keyed by page number and dropped on every reload.
+        self._page_executor = ThreadPoolExecutor(
+            max_workers=PAGE_PREFETCH_DEPTH, thread_name_prefix="page"
+        )
+        self._page_futures: Dict[int, Future] = {}
+        self._page_generation = 0
+        
+        # Unfinished page requests by query, shared by identical requests
+        # such as a refresh clicked while the first one is still loading
+        self._inflight_pages: Dict[tuple, Future] = {}
+        
+        # Wallhaven random-sort seed of the current query, taken from its
+        # first page so later pages continue the same shuffle
+        self._wallhaven_seed: Optional[str] = None
+        
+        # Builders for each source's get_images keyword arguments
+        self._fetch_param_builders: Dict[ImageSource, Callable[[], Dict[str, Any]]] = {
+            ImageSource.WALLHAVEN: self._wallhaven_fetch_params,
+            ImageSource.WAIFUIM: self._nsfw_fetch_params,
+            ImageSource.WAIFUPICS: self._nsfw_fetch_params,
+            ImageSource.NEKOSMOE: self._nekosmoe_fetch_params,
+        }
+        
         # Search query
         self.search_query = ""
         
@@ -73,6 +1057,30 @@ class MainWindow(Gtk.Window):
         # Initialize nekos.moe sort parameter
         self.nekosmoe_sort = "newest"  # Default sort for nekos.moe
         
+        # Pending throttled scroll handler, if any
+        self._scroll_tick_id = 0
+        
+        # Advanced options dialog, built on first use
+        self._advanced_dialog = None
+        self._advanced_features = {}
+        
+        # Pending sort change reload, if any
+        self._sort_debounce_id = 0
+        
+        # Pending search reload, if any
+        self._search_debounce_id = 0
+        
+        # Pending reload queued by _queue_reload, if any
+        self._reload_idle_id = 0
+        
+        # Latest status text waiting to be shown by _flush_status
+        self._pending_status = None
+        self._status_flush_id = 0
+        self._status_lock = threading.Lock()
+        
+        # Message dialogs by message type, reused by _show_message
+        self._message_dialogs = {}
+        
         # Additional filters for Wallhaven
         self.wallhaven_category = WallhavenCategory.from_list(settings.get("wallhaven_categories", ["general", "anime", "people"]))
         self.wallhaven_purity = WallhavenPurity.from_list(settings.get("wallhaven_purity", ["sfw"]))
@@ -90,29 +1098,10 @@ class MainWindow(Gtk.Window):
         self._load_images(reset=True)
     
     def _initialize_ui_state(self):
-        """Initialize UI state variables."""
-        # Initialize source manager
-        self.source_manager = SourceManager()
-        
-        # Initialize wallhaven specific settings
-        self.wallhaven_category = WallhavenCategory.from_list(settings.get("wallhaven_categories", ["general", "anime", "people"]))
-        self.wallhaven_purity = WallhavenPurity.from_list(settings.get("wallhaven_purity", ["sfw"]))
-        self.wallhaven_sorting = WallhavenSorting(settings.get("wallhaven_sorting", "date_added"))
-        self.wallhaven_method = "latest"  # Default method for sorting
-        
-        # Initialize search state
-        self.search_query = ""
-        self.selected_tags = []
-        self.selected_purity = ["sfw"]  # Default to SFW content
-        
-        # Initialize pagination state
-        self.current_page = 1
-        self.has_next_page = True
-        self.is_loading = False
-        
-        # Initialize images list
-        self.images = []
+        """Show the controls that apply to the current source.
         
+        The state itself is set up in __init__ before the widgets are built.
+        """
         # Set search bar visibility based on current source
         if self.source_manager.current_source == ImageSource.WALLHAVEN:
             self.wallhaven_search_box.show_all()  # Show search bar for Wallhaven
@@ -151,8 +1140,7 @@ class MainWindow(Gtk.Window):
         
         # Create settings button
         settings_button = Gtk.Button()
-        settings_icon = Gio.ThemedIcon(name="preferences-system-symbolic")
-        settings_image = Gtk.Image.new_from_gicon(settings_icon, Gtk.IconSize.BUTTON)
+        settings_image = Gtk.Image.new_from_gicon(themed_icon("preferences-system-symbolic"), Gtk.IconSize.BUTTON)
         settings_button.add(settings_image)
         settings_button.connect("clicked", self._on_settings_clicked)
         
@@ -214,8 +1202,7 @@ class MainWindow(Gtk.Window):
         
         # Refresh button
         refresh_button = Gtk.Button.new_with_label("Refresh Images")
-        refresh_icon = Gio.ThemedIcon(name="view-refresh-symbolic")
-        refresh_image = Gtk.Image.new_from_gicon(refresh_icon, Gtk.IconSize.BUTTON)
+        refresh_image = Gtk.Image.new_from_gicon(themed_icon("view-refresh-symbolic"), Gtk.IconSize.BUTTON)
         refresh_button.set_image(refresh_image)
         refresh_button.connect("clicked", self._on_refresh_clicked)
         
@@ -233,11 +1220,6 @@ class MainWindow(Gtk.Window):
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         self.add(main_box)
         
-        # Apply a modern dark theme if available
-        screen = Gtk.Settings.get_default()
-        if hasattr(screen, 'set_property'):
-            screen.set_property("gtk-application-prefer-dark-theme", True)
-        
         # Status bar with modern styling
         status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         status_box.set_margin_start(16)
@@ -284,25 +1266,20 @@ class MainWindow(Gtk.Window):
         self.flowbox.set_margin_bottom(16)
         self.flowbox.connect("child-activated", self._on_image_activated)
         
-        # Set CSS styling for the flowbox
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            flowboxchild {
-                border-radius: 8px;
-                transition: all 200ms ease;
-                background-color: alpha(#000, 0.0);
-            }
-            flowboxchild:hover {
-                background-color: alpha(#fff, 0.05);
-                box-shadow: 0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.24);
-            }
-            flowboxchild:selected {
-                background-color: alpha(#fff, 0.1);
-                box-shadow: 0 3px 6px rgba(0,0,0,0.16), 0 3px 6px rgba(0,0,0,0.23);
-            }
-        """)
-        context = self.flowbox.get_style_context()
-        context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        # New thumbnails and resizes move items into view without scrolling
+        self.flowbox.connect(
+            "size-allocate",
+            lambda _flowbox, _allocation: self._on_scroll_changed(self.scrolled_window.get_vadjustment())
+        )
+        
+        # The grid is bound to a list model: a page of results is added with
+        # one splice and a reset is one remove_all, instead of one container
+        # call per thumbnail
+        self.image_store = Gio.ListStore.new(ImageItem)
+        self.flowbox.bind_model(self.image_store, self._create_image_card)
+        
+        # Styled by the grid rules in APP_CSS
+        self.flowbox.get_style_context().add_class("pixelvault-grid")
         
         self.scrolled_window.add(self.flowbox)
         main_box.pack_start(self.scrolled_window, True, True, 0)
@@ -326,40 +1303,171 @@ class MainWindow(Gtk.Window):
         # Hide loading indicator initially
         self.loading_box.hide()
     
+    def _on_destroy(self, widget):
+        """Handle window destruction.
+        
+        Args:
+            widget: The destroyed window
+        """
+        try:
+            self._thumb_pool.shutdown()
+            self._page_executor.shutdown(wait=False)
+            self._io_executor.shutdown(wait=False)
+        finally:
+            Gtk.main_quit()
+    
+    def _clear_flowbox(self):
+        """Remove all thumbnails and cancel their pending or running loads."""
+        # Results from loads started before this point are stale
+        self._thumb_generation += 1
+        self._thumb_index = 0
+        self._unloaded_thumbs = []
+        self._loaded_thumbs = []
+        
+        for child in self.flowbox.get_children():
+            container = child.get_child()
+            cancel = getattr(container, '_thumb_cancel', None)
+            if cancel is not None:
+                cancel.set()
+            task = getattr(container, '_thumb_task', None)
+            if task is not None:
+                task.cancel()
+        
+        self.image_store.remove_all()
+    
     def _on_scroll_changed(self, adjustment):
         """Handle scroll events to implement infinite scrolling.
         
+        The adjustment changes for every pixel scrolled, so the work is
+        throttled to one _on_scroll_tick per SCROLL_THROTTLE_MS.
+        
         Args:
             adjustment: The value adjustment that triggered the event
         """
-        # If already loading more images, do nothing
-        if self.is_loading:
-            return
-            
-        # Check if we've scrolled near the bottom
-        max_value = adjustment.get_upper() - adjustment.get_page_size()
-        current_value = adjustment.get_value()
+        if not self._scroll_tick_id:
+            self._scroll_tick_id = GLib.timeout_add(SCROLL_THROTTLE_MS, self._on_scroll_tick, adjustment)
+    
+    def _on_scroll_tick(self, adjustment):
+        """Load visible thumbnails and more images for the scroll position.
         
-        # If we're near the bottom (within 200px) and there are more pages
-        if current_value > max_value - 200 and self.has_next_page:
+        Args:
+            adjustment: Vertical adjustment of the results scroller
+        """
+        self._scroll_tick_id = 0
+        self._load_visible_thumbnails(adjustment)
+        self._release_offscreen_thumbnails(adjustment)
+        
+        # If already loading more images, or there are none, do nothing
+        if self.is_loading or not self.has_next_page:
+            return False  # Remove timeout
+        
+        # Load the next page once the bottom of the viewport is far enough
+        # down; a ratio keeps the lead time in step with the page length
+        upper = adjustment.get_upper()
+        bottom = adjustment.get_value() + adjustment.get_page_size()
+        if upper > 0 and bottom >= upper * SCROLL_LOAD_RATIO:
             self._load_more_images()
-    
-    def _load_more_images(self):
-        """Load the next page of images."""
-        # Show loading indicator
-        self.loading_spinner.start()
-        self.loading_box.show_all()
         
-        # Set loading flag
-        self.is_loading = True
+        return False  # Remove timeout
+    
+    def _load_visible_thumbnails(self, adjustment):
+        """Start thumbnail loads near the viewport and reorder queued ones.
         
-        # Increment page number
-        self.current_page += 1
+        Thumbnails are only requested once they come within half a page of
+        the visible area, so long result lists don't download images that
+        are never looked at. Loads already queued run nearest first: the
+        ones near the viewport, then the ones below it in grid order, and
+        last the ones already scrolled past.
         
-        # Fetch next page in a background thread
-        thread = threading.Thread(target=self._fetch_images, args=(False,))
-        thread.daemon = True
-        thread.start()
+        Args:
+            adjustment: Vertical adjustment of the results scroller
+        """
+        page_size = adjustment.get_page_size()
+        top = adjustment.get_value() - page_size / 2
+        bottom = adjustment.get_value() + page_size * 1.5
+        
+        # Only thumbnails whose load hasn't started are looked at, so the
+        # pass gets cheaper as the grid fills in rather than longer
+        unloaded = []
+        for container in self._unloaded_thumbs:
+            task = container._thumb_task
+            if task is not None and not task.pending():
+                continue
+            unloaded.append(container)
+            
+            # Not laid out yet; the allocation that follows schedules
+            # another pass
+            allocation = container.get_parent().get_allocation()
+            if allocation.y < 0:
+                continue
+            
+            if allocation.y + allocation.height < top:
+                priority = (2, -container._thumb_index)
+            elif allocation.y <= bottom:
+                priority = (0, container._thumb_index)
+            else:
+                priority = (1, container._thumb_index)
+            
+            if task is not None:
+                task.set_priority(priority)
+            elif priority[0] == 0:
+                container._thumb_task = self._thumb_pool.submit(
+                    priority, self._load_image_thumbnail, container._thumb_image,
+                    container, container._thumb_cancel, self._thumb_generation
+                )
+        
+        self._unloaded_thumbs = unloaded
+    
+    def _release_offscreen_thumbnails(self, adjustment):
+        """Swap thumbnails far outside the viewport back to placeholders.
+        
+        Every grid card holds its decoded pixbuf, so a long scroll session
+        would otherwise keep hundreds of megabytes of pixels alive. Once more
+        than THUMBNAIL_LIVE_LIMIT cards are loaded, the ones more than
+        THUMBNAIL_RELEASE_PAGES viewport heights away drop their image and
+        go back on the unloaded list; scrolling back reloads them from the
+        memory or disk cache.
+        
+        Args:
+            adjustment: Vertical adjustment of the results scroller
+        """
+        if len(self._loaded_thumbs) <= THUMBNAIL_LIVE_LIMIT:
+            return
+        
+        page_size = adjustment.get_page_size()
+        top = adjustment.get_value() - page_size * THUMBNAIL_RELEASE_PAGES
+        bottom = adjustment.get_value() + page_size * (THUMBNAIL_RELEASE_PAGES + 1)
+        
+        loaded = []
+        for container in self._loaded_thumbs:
+            allocation = container.get_allocation()
+            if top <= allocation.y + allocation.height and allocation.y <= bottom:
+                loaded.append(container)
+                continue
+            
+            # Pin the current size so rows above the viewport don't shrink
+            # and shift the scroll position
+            container.set_size_request(allocation.width, allocation.height)
+            self._set_thumb_placeholder(container, container._thumb_image)
+            container._thumb_task = None
+            self._unloaded_thumbs.append(container)
+        
+        self._loaded_thumbs = loaded
+    
+    def _load_more_images(self):
+        """Load the next page of images."""
+        # Show loading indicator
+        self.loading_spinner.start()
+        self.loading_box.show_all()
+        
+        # Set loading flag
+        self.is_loading = True
+        
+        # Increment page number
+        self.current_page += 1
+        
+        # Use the prefetched page if there is one, otherwise fetch it now
+        self._request_page(self.current_page, reset=False)
     
     def _on_source_changed(self, combo):
         """Handle source change event.
@@ -372,7 +1480,7 @@ class MainWindow(Gtk.Window):
         if tree_iter is not None:
             model = combo.get_model()
             source_text = model[tree_iter][0]
-            print(f"Selected source: {source_text}")
+            log.debug("Selected source: %s", source_text)
             
             # Map to enum
             if source_text == "Wallhaven":
@@ -388,13 +1496,13 @@ class MainWindow(Gtk.Window):
                 # Hide sort options for Waifu.im
                 self.sort_combo.set_sensitive(False)
             elif source_text == "Waifu.pics":
-                print("Setting source to Waifu.pics")
+                log.debug("Setting source to Waifu.pics")
                 self.source_manager.set_source(ImageSource.WAIFUPICS)
                 self.wallhaven_search_box.hide()  # Hide search bar for Waifu.pics
                 # Hide sort options for Waifu.pics
                 self.sort_combo.set_sensitive(False)
             elif source_text == "Nekos.moe":
-                print("Setting source to Nekos.moe")
+                log.debug("Setting source to Nekos.moe")
                 self.source_manager.set_source(ImageSource.NEKOSMOE)
                 # Show search bar for Nekos.moe since it supports search
                 self.wallhaven_search_box.show_all()
@@ -413,14 +1521,8 @@ class MainWindow(Gtk.Window):
             self.search_query = ""
             self.wallhaven_search_entry.set_text("")
             
-            # Reset pagination
-            self.current_page = 1
-            
-            # Clear the current flowbox
-            for child in self.flowbox.get_children():
-                self.flowbox.remove(child)
-            
-            # Load images for the new source
+            # Load images for the new source; the reset also clears the
+            # grid and pagination
             self._load_images(reset=True)
     
     def _on_advanced_button_clicked(self, button):
@@ -429,155 +1531,27 @@ class MainWindow(Gtk.Window):
         Args:
             button: The Button widget
         """
-        # Create a dialog for advanced options
-        dialog = Gtk.Dialog(
-            title="Advanced Options",
-            parent=self,
-            flags=0,
-            buttons=(
-                "Cancel", Gtk.ResponseType.CANCEL,
-                "Apply", Gtk.ResponseType.OK
-            )
-        )
-        dialog.set_default_size(400, 300)
+        # The dialog is built once and hidden between uses; only its state
+        # is refreshed for the current source and options
+        if self._advanced_dialog is None:
+            self._build_advanced_dialog()
+        dialog = self._advanced_dialog
         
         # Get available features for the current source
-        features = self.source_manager.get_source_features()
-        
-        # Create content area
-        content_area = dialog.get_content_area()
-        content_area.set_margin_top(10)
-        content_area.set_margin_bottom(10)
-        content_area.set_margin_start(10)
-        content_area.set_margin_end(10)
-        content_area.set_spacing(10)
-        
-        # Create options based on available features
-        if features.get("categories", False):
-            # Add category selection for Wallhaven
-            category_frame = Gtk.Frame(label="Categories")
-            category_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            category_box.set_margin_top(10)
-            category_box.set_margin_bottom(10)
-            category_box.set_margin_start(10)
-            category_box.set_margin_end(10)
-            
-            # Category checkboxes
-            self.general_check = Gtk.CheckButton.new_with_label("General")
-            self.general_check.set_active(self.wallhaven_category.value[0] == "1")
-            
-            self.anime_check = Gtk.CheckButton.new_with_label("Anime")
-            self.anime_check.set_active(self.wallhaven_category.value[1] == "1")
-            
-            self.people_check = Gtk.CheckButton.new_with_label("People")
-            self.people_check.set_active(self.wallhaven_category.value[2] == "1")
-            
-            category_box.pack_start(self.general_check, False, False, 0)
-            category_box.pack_start(self.anime_check, False, False, 0)
-            category_box.pack_start(self.people_check, False, False, 0)
-            
-            category_frame.add(category_box)
-            content_area.pack_start(category_frame, False, False, 0)
-        
-        if features.get("purity_levels", False):
-            # Add purity selection for Wallhaven
-            purity_frame = Gtk.Frame(label="Content Filter")
-            purity_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            purity_box.set_margin_top(10)
-            purity_box.set_margin_bottom(10)
-            purity_box.set_margin_start(10)
-            purity_box.set_margin_end(10)
-            
-            # Purity checkboxes
-            self.sfw_check = Gtk.CheckButton.new_with_label("Safe For Work")
-            self.sfw_check.set_active(self.wallhaven_purity.value[0] == "1")
-            
-            self.sketchy_check = Gtk.CheckButton.new_with_label("Sketchy")
-            self.sketchy_check.set_active(self.wallhaven_purity.value[1] == "1")
-            
-            # Check if API key is needed for Sketchy content
-            has_api_key = self.source_manager.wallhaven_api_key != ""
-            if not has_api_key:
-                self.sketchy_check.set_tooltip_text("API key required for Sketchy content")
-            
-            self.nsfw_check = Gtk.CheckButton.new_with_label("NSFW")
-            self.nsfw_check.set_active(self.wallhaven_purity.value[2] == "1")
-            
-            # Connect handlers to show warnings when trying to deselect all options
-            self.sfw_check.connect("toggled", self._on_purity_check_toggled)
-            self.sketchy_check.connect("toggled", self._on_purity_check_toggled)
-            self.nsfw_check.connect("toggled", self._on_purity_check_toggled)
-            
-            # Check if API key is needed for NSFW content
-            if not has_api_key:
-                self.nsfw_check.set_tooltip_text("API key required for NSFW content")
-            
-            # Add API key warning if needed
-            if self.source_manager.current_source == ImageSource.WALLHAVEN and not has_api_key:
-                api_key_warning = Gtk.Label()
-                api_key_warning.set_markup(
-                    "<span foreground='red'>⚠️ API key required for Sketchy/NSFW content</span>"
-                )
-                api_key_warning.set_line_wrap(True)
-                api_key_warning.set_xalign(0)
-                api_key_warning.set_margin_top(5)
-                api_key_warning.set_margin_bottom(5)
-                
-                # Add button to open settings
-                settings_button = Gtk.Button.new_with_label("Add API Key")
-                settings_button.connect("clicked", self._on_api_key_button_clicked, dialog)
-                
-                api_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-                api_box.pack_start(api_key_warning, True, True, 0)
-                api_box.pack_start(settings_button, False, False, 0)
-                
-                purity_box.pack_start(self.sfw_check, False, False, 0)
-                purity_box.pack_start(self.sketchy_check, False, False, 0)
-                purity_box.pack_start(self.nsfw_check, False, False, 0)
-                purity_box.pack_start(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), False, False, 5)
-                purity_box.pack_start(api_box, False, False, 0)
-            else:
-                purity_box.pack_start(self.sfw_check, False, False, 0)
-                purity_box.pack_start(self.sketchy_check, False, False, 0)
-                purity_box.pack_start(self.nsfw_check, False, False, 0)
-            
-            purity_frame.add(purity_box)
-            content_area.pack_start(purity_frame, False, False, 0)
-        
-        if features.get("sorting_options", []):
-            # Add sorting options
-            sorting_frame = Gtk.Frame(label="Sorting")
-            sorting_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-            sorting_box.set_margin_top(10)
-            sorting_box.set_margin_bottom(10)
-            sorting_box.set_margin_start(10)
-            sorting_box.set_margin_end(10)
-            
-            # Sorting combo box
-            sorting_options = features.get("sorting_options", [])
-            self.sorting_combo = Gtk.ComboBoxText()
-            
-            for option in sorting_options:
-                self.sorting_combo.append_text(option["name"])
-            
-            # Set active sorting option
-            current_sorting = self.wallhaven_sorting.value
-            active_index = 0  # default to latest
-            for i, option in enumerate(sorting_options):
-                if option["id"] == current_sorting:
-                    active_index = i
-                    break
-            
-            self.sorting_combo.set_active(active_index)
-            
-            sorting_box.pack_start(self.sorting_combo, False, False, 0)
-            sorting_frame.add(sorting_box)
-            content_area.pack_start(sorting_frame, False, False, 0)
+        self._advanced_features = self.source_manager.get_source_features()
+        self._sync_advanced_dialog(self._advanced_features)
         
-        # Show the dialog and handle response
-        dialog.show_all()
-        response = dialog.run()
+        # The response is handled by _on_advanced_response
+        dialog.present()
+    
+    def _on_advanced_response(self, dialog, response):
+        """Apply the advanced options when the dialog is confirmed.
         
+        Args:
+            dialog: The advanced options dialog
+            response: Response ID of the pressed button
+        """
+        features = self._advanced_features
         if response == Gtk.ResponseType.OK:
             # Apply settings
             if features.get("categories", False):
@@ -591,21 +1565,7 @@ class MainWindow(Gtk.Window):
                 
                 category_value = f"{general}{anime}{people}"
                 
-                # Set the corresponding enum value
-                if category_value == "100":
-                    self.wallhaven_category = WallhavenCategory.GENERAL
-                elif category_value == "010":
-                    self.wallhaven_category = WallhavenCategory.ANIME
-                elif category_value == "001":
-                    self.wallhaven_category = WallhavenCategory.PEOPLE
-                elif category_value == "110":
-                    self.wallhaven_category = WallhavenCategory.GENERAL_ANIME
-                elif category_value == "101":
-                    self.wallhaven_category = WallhavenCategory.GENERAL_PEOPLE
-                elif category_value == "011":
-                    self.wallhaven_category = WallhavenCategory.ANIME_PEOPLE
-                else:
-                    self.wallhaven_category = WallhavenCategory.ALL
+                self.wallhaven_category = _CATEGORY_BY_BITS.get(category_value, WallhavenCategory.ALL)
             
             if features.get("purity_levels", False):
                 sfw = "1" if self.sfw_check.get_active() else "0"
@@ -618,43 +1578,18 @@ class MainWindow(Gtk.Window):
                 
                 purity_value = f"{sfw}{sketchy}{nsfw}"
                 
-                # Set the corresponding enum value based on the combination
-                if purity_value == "100":
-                    self.wallhaven_purity = WallhavenPurity.SFW
-                elif purity_value == "010":
-                    self.wallhaven_purity = WallhavenPurity.SKETCHY
-                elif purity_value == "001":
-                    self.wallhaven_purity = WallhavenPurity.NSFW
-                elif purity_value == "110":
-                    self.wallhaven_purity = WallhavenPurity.SFW_SKETCHY
-                elif purity_value == "101":
-                    self.wallhaven_purity = WallhavenPurity.SFW_NSFW
-                elif purity_value == "011":
-                    self.wallhaven_purity = WallhavenPurity.SKETCHY_NSFW
-                elif purity_value == "111":
-                    self.wallhaven_purity = WallhavenPurity.ALL
-                else:
-                    # This should never happen, but as a fallback
-                    self.wallhaven_purity = WallhavenPurity.SFW
+                self.wallhaven_purity = _PURITY_BY_BITS.get(purity_value, WallhavenPurity.SFW)
                 
-                print(f"Selected purity level: {purity_value} -> {self.wallhaven_purity.name}")
+                log.debug("Selected purity level: %s -> %s", purity_value, self.wallhaven_purity.name)
                 
                 # Show warning if NSFW/Sketchy selected without API key
                 has_api_key = self.source_manager.wallhaven_api_key != ""
                 if (sketchy == "1" or nsfw == "1") and not has_api_key:
-                    dialog = Gtk.MessageDialog(
-                        transient_for=self,
-                        flags=0,
-                        message_type=Gtk.MessageType.WARNING,
-                        buttons=Gtk.ButtonsType.OK,
-                        text="API Key Required"
-                    )
-                    dialog.format_secondary_text(
+                    self._show_message(
+                        Gtk.MessageType.WARNING, "API Key Required",
                         "You've selected Sketchy or NSFW content without having a Wallhaven API key set.\n\n"
                         "Your selection will be saved, but you may not see any results until you add an API key."
                     )
-                    dialog.run()
-                    dialog.destroy()
             
             if features.get("sorting_options", []):
                 active_index = self.sorting_combo.get_active()
@@ -662,25 +1597,183 @@ class MainWindow(Gtk.Window):
                 
                 if 0 <= active_index < len(sorting_options):
                     sorting_id = sorting_options[active_index]["id"]
-                    
-                    # Set the corresponding enum value
-                    if sorting_id == "latest":
-                        self.wallhaven_sorting = WallhavenSorting.DATE_ADDED
-                    elif sorting_id == "toplist":
-                        self.wallhaven_sorting = WallhavenSorting.TOPLIST
-                    elif sorting_id == "random":
-                        self.wallhaven_sorting = WallhavenSorting.RANDOM
-                    elif sorting_id == "views":
-                        self.wallhaven_sorting = WallhavenSorting.VIEWS
-                    elif sorting_id == "favorites":
-                        self.wallhaven_sorting = WallhavenSorting.FAVORITES
-                    elif sorting_id == "relevance":
-                        self.wallhaven_sorting = WallhavenSorting.RELEVANCE
-            
-            # Reset and load images with new settings
-            self._load_images(reset=True)
+                    self.wallhaven_sorting = _SORTING_BY_ID.get(sorting_id, self.wallhaven_sorting)
+            
+            # Reset and load images with new settings once the dialog is gone
+            self._queue_reload()
         
-        dialog.destroy()
+        dialog.hide()
+    
+    def _build_advanced_dialog(self):
+        """Create the advanced options dialog.
+        
+        All option groups are created up front; _sync_advanced_dialog shows
+        the ones the current source supports.
+        """
+        # Create a dialog for advanced options
+        dialog = Gtk.Dialog(
+            title="Advanced Options",
+            parent=self,
+            flags=0,
+            buttons=(
+                "Cancel", Gtk.ResponseType.CANCEL,
+                "Apply", Gtk.ResponseType.OK
+            )
+        )
+        dialog.set_default_size(400, 300)
+        dialog.set_modal(True)
+        dialog.connect("response", self._on_advanced_response)
+        
+        # Keep the dialog for reuse when its window is closed
+        dialog.connect("delete-event", Gtk.Widget.hide_on_delete)
+        
+        # Create content area
+        content_area = dialog.get_content_area()
+        content_area.set_margin_top(10)
+        content_area.set_margin_bottom(10)
+        content_area.set_margin_start(10)
+        content_area.set_margin_end(10)
+        content_area.set_spacing(10)
+        
+        # Add category selection for Wallhaven
+        self._category_frame = Gtk.Frame(label="Categories")
+        category_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        category_box.set_margin_top(10)
+        category_box.set_margin_bottom(10)
+        category_box.set_margin_start(10)
+        category_box.set_margin_end(10)
+        
+        # Category checkboxes
+        self.general_check = Gtk.CheckButton.new_with_label("General")
+        self.anime_check = Gtk.CheckButton.new_with_label("Anime")
+        self.people_check = Gtk.CheckButton.new_with_label("People")
+        
+        category_box.pack_start(self.general_check, False, False, 0)
+        category_box.pack_start(self.anime_check, False, False, 0)
+        category_box.pack_start(self.people_check, False, False, 0)
+        
+        self._category_frame.add(category_box)
+        content_area.pack_start(self._category_frame, False, False, 0)
+        
+        # Add purity selection for Wallhaven
+        self._purity_frame = Gtk.Frame(label="Content Filter")
+        purity_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        purity_box.set_margin_top(10)
+        purity_box.set_margin_bottom(10)
+        purity_box.set_margin_start(10)
+        purity_box.set_margin_end(10)
+        
+        # Purity checkboxes
+        self.sfw_check = Gtk.CheckButton.new_with_label("Safe For Work")
+        self.sketchy_check = Gtk.CheckButton.new_with_label("Sketchy")
+        self.nsfw_check = Gtk.CheckButton.new_with_label("NSFW")
+        
+        # The checked boxes are tracked as a bitmask (SFW, Sketchy, NSFW from
+        # the lowest bit) so a toggle only has to read its own button
+        self._purity_mask = 0
+        
+        # Connect handlers to show warnings when trying to deselect all options
+        self.sfw_check.connect("toggled", self._on_purity_check_toggled, 1 << 0)
+        self.sketchy_check.connect("toggled", self._on_purity_check_toggled, 1 << 1)
+        self.nsfw_check.connect("toggled", self._on_purity_check_toggled, 1 << 2)
+        
+        purity_box.pack_start(self.sfw_check, False, False, 0)
+        purity_box.pack_start(self.sketchy_check, False, False, 0)
+        purity_box.pack_start(self.nsfw_check, False, False, 0)
+        
+        # API key warning, shown while Wallhaven has no key
+        api_key_warning = Gtk.Label()
+        api_key_warning.set_markup(
+            "<span foreground='red'>⚠️ API key required for Sketchy/NSFW content</span>"
+        )
+        api_key_warning.set_line_wrap(True)
+        api_key_warning.set_xalign(0)
+        api_key_warning.set_margin_top(5)
+        api_key_warning.set_margin_bottom(5)
+        
+        # Add button to open settings
+        settings_button = Gtk.Button.new_with_label("Add API Key")
+        settings_button.connect("clicked", self._on_api_key_button_clicked, dialog)
+        
+        api_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        api_box.pack_start(api_key_warning, True, True, 0)
+        api_box.pack_start(settings_button, False, False, 0)
+        
+        self._api_key_section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+        self._api_key_section.pack_start(Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL), False, False, 5)
+        self._api_key_section.pack_start(api_box, False, False, 0)
+        purity_box.pack_start(self._api_key_section, False, False, 0)
+        
+        self._purity_frame.add(purity_box)
+        content_area.pack_start(self._purity_frame, False, False, 0)
+        
+        # Add sorting options
+        self._sorting_frame = Gtk.Frame(label="Sorting")
+        sorting_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        sorting_box.set_margin_top(10)
+        sorting_box.set_margin_bottom(10)
+        sorting_box.set_margin_start(10)
+        sorting_box.set_margin_end(10)
+        
+        # Sorting combo box, filled by _sync_advanced_dialog
+        self.sorting_combo = Gtk.ComboBoxText()
+        self._sorting_combo_ids = None
+        
+        sorting_box.pack_start(self.sorting_combo, False, False, 0)
+        self._sorting_frame.add(sorting_box)
+        content_area.pack_start(self._sorting_frame, False, False, 0)
+        
+        content_area.show_all()
+        self._advanced_dialog = dialog
+    
+    def _sync_advanced_dialog(self, features: Dict[str, Any]):
+        """Update the advanced options dialog from the current options.
+        
+        Args:
+            features: Features of the current source
+        """
+        # Categories
+        self._category_frame.set_visible(features.get("categories", False))
+        self.general_check.set_active(self.wallhaven_category.value[0] == "1")
+        self.anime_check.set_active(self.wallhaven_category.value[1] == "1")
+        self.people_check.set_active(self.wallhaven_category.value[2] == "1")
+        
+        # Purity; set the mask first so the toggles below never see all
+        # boxes unchecked
+        self._purity_frame.set_visible(features.get("purity_levels", False))
+        self._purity_mask = sum(
+            1 << i for i, flag in enumerate(self.wallhaven_purity.value) if flag == "1"
+        )
+        self.sfw_check.set_active(self.wallhaven_purity.value[0] == "1")
+        self.sketchy_check.set_active(self.wallhaven_purity.value[1] == "1")
+        self.nsfw_check.set_active(self.wallhaven_purity.value[2] == "1")
+        
+        # Check if API key is needed for Sketchy and NSFW content
+        has_api_key = self.source_manager.wallhaven_api_key != ""
+        self.sketchy_check.set_tooltip_text(None if has_api_key else "API key required for Sketchy content")
+        self.nsfw_check.set_tooltip_text(None if has_api_key else "API key required for NSFW content")
+        self._api_key_section.set_visible(
+            self.source_manager.current_source == ImageSource.WALLHAVEN and not has_api_key
+        )
+        
+        # Sorting; the options only need refilling when the source's differ
+        sorting_options = features.get("sorting_options", [])
+        self._sorting_frame.set_visible(bool(sorting_options))
+        sorting_ids = [option["id"] for option in sorting_options]
+        if sorting_ids != self._sorting_combo_ids:
+            self.sorting_combo.remove_all()
+            for option in sorting_options:
+                self.sorting_combo.append_text(option["name"])
+            self._sorting_combo_ids = sorting_ids
+        
+        # Set active sorting option
+        active_index = 0  # default to latest
+        for i, sorting_id in enumerate(sorting_ids):
+            if _SORTING_BY_ID.get(sorting_id) == self.wallhaven_sorting:
+                active_index = i
+                break
+        
+        self.sorting_combo.set_active(active_index)
     
     def _on_tag_button_clicked(self, button):
         """Handle tag selection button click.
@@ -762,20 +1855,19 @@ class MainWindow(Gtk.Window):
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_min_content_height(300)
         
-        # Create a list box for tags
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.NONE)
+        # Lay tags out in a grid: check buttons in the first column and
+        # preview badges in the second, with category headers spanning both
+        tag_grid = Gtk.Grid()
+        tag_grid.set_column_spacing(6)
+        tag_grid.set_row_spacing(0)
         
         # Create a dictionary to store references to check buttons
         check_buttons = {}
         
         # Group tags by category
-        categories = {}
+        categories = defaultdict(list)
         for tag in available_tags:
-            category = tag.get("category", "other")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(tag)
+            categories[tag.get("category", "other")].append(tag)
         
         # Sort categories for better organization
         sorted_categories = sorted(categories.keys())
@@ -785,38 +1877,34 @@ class MainWindow(Gtk.Window):
             search_text = entry.get_text().lower()
             for category, tags in categories.items():
                 # Get the category header
-                header_row = category_headers.get(category)
-                if header_row:
+                header_label = category_headers.get(category)
+                if header_label:
                     # Hide/show category based on if any children match
                     any_visible = False
                     
                     # Check each tag in this category
                     for tag in tags:
                         tag_name = tag.get("name", "").lower()
-                        row = tag_rows.get(tag_name)
+                        row_widgets = tag_rows.get(tag_name, ())
+                        visible = not search_text or search_text in tag_name
                         
-                        if search_text and search_text not in tag_name:
-                            if row:
-                                row.hide()
-                        else:
-                            if row:
-                                row.show()
-                                any_visible = True
+                        for widget in row_widgets:
+                            widget.set_visible(visible)
+                        if visible and row_widgets:
+                            any_visible = True
                     
                     # Show/hide header based on if any tags are visible
-                    if any_visible:
-                        header_row.show()
-                    else:
-                        header_row.hide()
+                    header_label.set_visible(any_visible)
         
         # Connect search entry to filter function
         search_entry.connect("search-changed", filter_tags)
         
-        # Dictionary to store references to rows for filtering
+        # Dictionary to store references to grid cells for filtering
         category_headers = {}
         tag_rows = {}
         
-        # Add tags to the list box, grouped by category
+        # Add tags to the grid, grouped by category
+        grid_row = 0
         for category in sorted_categories:
             tags = categories[category]
             
@@ -831,14 +1919,11 @@ class MainWindow(Gtk.Window):
             category_label.set_margin_top(15)
             category_label.set_margin_bottom(5)
             category_label.set_margin_start(5)
-            
-            category_row = Gtk.ListBoxRow()
-            category_row.add(category_label)
-            category_row.set_selectable(False)
-            list_box.add(category_row)
+            tag_grid.attach(category_label, 0, grid_row, 2, 1)
+            grid_row += 1
             
             # Store reference to category header
-            category_headers[category] = category_row
+            category_headers[category] = category_label
             
             # Sort tags by name within category
             sorted_tags = sorted(tags, key=lambda x: x.get("name", "").lower())
@@ -848,16 +1933,13 @@ class MainWindow(Gtk.Window):
                 tag_name = tag.get("name", "")
                 tag_description = tag.get("description", "")
                 
-                # Create a box for the tag
-                tag_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-                tag_box.set_margin_start(10)
-                tag_box.set_margin_end(10)
-                tag_box.set_margin_top(5)
-                tag_box.set_margin_bottom(5)
-                
                 # Create a check button for the tag
                 check_button = Gtk.CheckButton.new_with_label(tag_name)
                 check_button.set_tooltip_text(tag_description or f"{tag_name} tag")
+                check_button.set_margin_start(10)
+                check_button.set_margin_top(5)
+                check_button.set_margin_bottom(5)
+                check_button.set_hexpand(True)
                 
                 # Set check button state based on selected tags
                 if tag_name in self.selected_tags:
@@ -866,19 +1948,18 @@ class MainWindow(Gtk.Window):
                 # Store reference to the check button
                 check_buttons[tag_name] = check_button
                 
-                tag_box.pack_start(check_button, False, False, 0)
-                
                 # Add preview badge to show what the tag will look like
                 preview_badge = self._create_tag_badge(tag_name, removable=False, mini=True, check_buttons_ref=check_buttons)
-                tag_box.pack_end(preview_badge, False, False, 0)
+                preview_badge.set_halign(Gtk.Align.END)
+                preview_badge.set_valign(Gtk.Align.CENTER)
+                preview_badge.set_margin_end(10)
                 
-                tag_row = Gtk.ListBoxRow()
-                tag_row.add(tag_box)
-                tag_row.set_selectable(False)
-                list_box.add(tag_row)
+                tag_grid.attach(check_button, 0, grid_row, 1, 1)
+                tag_grid.attach(preview_badge, 1, grid_row, 1, 1)
+                grid_row += 1
                 
-                # Store reference to row for filtering
-                tag_rows[tag_name.lower()] = tag_row
+                # Store reference to the row's cells for filtering
+                tag_rows[tag_name.lower()] = (check_button, preview_badge)
         
         # Add action buttons
         buttons_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -931,8 +2012,8 @@ class MainWindow(Gtk.Window):
         main_box.pack_start(search_box, False, False, 0)
         main_box.pack_start(selected_frame, False, False, 10)
         
-        # Add the list box to the scrolled window
-        scrolled.add(list_box)
+        # Add the tag grid to the scrolled window
+        scrolled.add(tag_grid)
         main_box.pack_start(scrolled, True, True, 0)
         main_box.pack_start(buttons_box, False, False, 0)
         
@@ -955,11 +2036,20 @@ class MainWindow(Gtk.Window):
         for tag_name, button in check_buttons.items():
             button.connect("toggled", on_check_button_toggled, tag_name)
         
+        dialog.set_modal(True)
+        dialog.connect("response", self._on_tag_dialog_response, check_buttons)
+        
         # Show all widgets
         dialog.show_all()
+    
+    def _on_tag_dialog_response(self, dialog, response, check_buttons):
+        """Apply the selected tags when the tag dialog is confirmed.
         
-        # Handle response
-        response = dialog.run()
+        Args:
+            dialog: The tag selection dialog
+            response: Response ID of the pressed button
+            check_buttons: Tag check buttons by tag name
+        """
         if response == Gtk.ResponseType.OK:
             # Get selected tags
             self.selected_tags = []
@@ -970,25 +2060,18 @@ class MainWindow(Gtk.Window):
             # Special handling for Waifu.pics when multiple tags are selected
             if self.source_manager.current_source == ImageSource.WAIFUPICS and len(self.selected_tags) > 1:
                 active_tag = self.selected_tags[0]
-                info_dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.INFO,
-                    buttons=Gtk.ButtonsType.OK,
-                    text="Multiple Tags Selected"
-                )
-                info_dialog.format_secondary_text(
+                self._show_message(
+                    Gtk.MessageType.INFO, "Multiple Tags Selected",
                     f"Waifu.pics only supports one tag/category at a time.\n\n"
                     f"Only the first tag '{active_tag}' will be used for searching images."
                 )
-                info_dialog.run()
-                info_dialog.destroy()
             
             # Update tag display in the header
             self._update_tag_display()
             
-            # Refresh images with the selected tags (reset to page 1)
-            self._load_images(reset=True)
+            # Refresh images with the selected tags (reset to page 1) once
+            # the dialog is gone
+            self._queue_reload()
         
         dialog.destroy()
     
@@ -1011,10 +2094,10 @@ class MainWindow(Gtk.Window):
             self.tag_display.show()
             
             # Also update status label
-            self.status_label.set_text(f"Tags: {tag_str}")
+            self._set_status(f"Tags: {tag_str}")
         else:
             self.tag_display.hide()
-            self.status_label.set_text("Ready")
+            self._set_status("Ready")
     
     def _create_tag_badge(self, tag_name, removable=False, mini=False, check_buttons_ref=None):
         """Create a visual badge for a tag.
@@ -1060,121 +2143,8 @@ class MainWindow(Gtk.Window):
                         category_class = f"tag-{category.lower()}"
                         break
         
-        # Create CSS for the badge
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            box {
-                background-color: rgba(60, 60, 70, 0.3);
-                border-radius: 12px;
-                padding: 2px 8px;
-                margin: 2px;
-                transition: all 0.2s ease;
-            }
-            
-            box:hover {
-                background-color: rgba(70, 70, 90, 0.4);
-            }
-            
-            button.tag-remove-button {
-                padding: 0;
-                margin: 0;
-                min-height: 16px;
-                min-width: 16px;
-                opacity: 0.7;
-                transition: opacity 0.2s ease;
-            }
-            
-            button.tag-remove-button:hover {
-                opacity: 1.0;
-            }
-            
-            .tag-label {
-                color: #eee;
-                font-size: 12px;
-            }
-            
-            .mini-tag {
-                padding: 1px 4px;
-                margin: 1px;
-            }
-            
-            .mini-tag .tag-label {
-                font-size: 10px;
-            }
-            
-            /* NSFW tags */
-            .tag-nsfw {
-                background-color: rgba(231, 76, 60, 0.3);
-                border-left: 3px solid rgba(231, 76, 60, 0.8);
-            }
-            
-            /* Category-specific colors */
-            .tag-anime {
-                background-color: rgba(230, 126, 34, 0.3);
-                border-left: 3px solid rgba(230, 126, 34, 0.8);
-            }
-            
-            .tag-nature {
-                background-color: rgba(46, 204, 113, 0.3);
-                border-left: 3px solid rgba(46, 204, 113, 0.8);
-            }
-            
-            .tag-urban {
-                background-color: rgba(52, 152, 219, 0.3);
-                border-left: 3px solid rgba(52, 152, 219, 0.8);
-            }
-            
-            .tag-art {
-                background-color: rgba(155, 89, 182, 0.3);
-                border-left: 3px solid rgba(155, 89, 182, 0.8);
-            }
-            
-            .tag-fiction {
-                background-color: rgba(241, 196, 15, 0.3);
-                border-left: 3px solid rgba(241, 196, 15, 0.8);
-            }
-            
-            .tag-science {
-                background-color: rgba(41, 128, 185, 0.3);
-                border-left: 3px solid rgba(41, 128, 185, 0.8);
-            }
-            
-            .tag-technology {
-                background-color: rgba(52, 73, 94, 0.3);
-                border-left: 3px solid rgba(52, 73, 94, 0.8);
-            }
-            
-            .tag-design {
-                background-color: rgba(231, 76, 60, 0.3);
-                border-left: 3px solid rgba(231, 76, 60, 0.8);
-            }
-            
-            .tag-vehicles {
-                background-color: rgba(192, 57, 43, 0.3);
-                border-left: 3px solid rgba(192, 57, 43, 0.8);
-            }
-            
-            .tag-photography {
-                background-color: rgba(127, 140, 141, 0.3);
-                border-left: 3px solid rgba(127, 140, 141, 0.8);
-            }
-            
-            .tag-seasons {
-                background-color: rgba(26, 188, 156, 0.3);
-                border-left: 3px solid rgba(26, 188, 156, 0.8);
-            }
-            
-            .tag-other {
-                background-color: rgba(189, 195, 199, 0.3);
-                border-left: 3px solid rgba(189, 195, 199, 0.8);
-            }
-        """)
-        
-        # Apply CSS
-        badge_box.get_style_context().add_provider(
-            css_provider, 
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # Styled by the tag badge rules in APP_CSS
+        badge_box.get_style_context().add_class("tag-badge")
         
         # Add category class
         badge_box.get_style_context().add_class(category_class)
@@ -1257,6 +2227,77 @@ class MainWindow(Gtk.Window):
         """
         self._load_images(reset=True)
     
+    def _set_status(self, text: str):
+        """Set the status bar text.
+        
+        Safe to call from any thread. The label is updated from a single
+        idle callback that runs before the next relayout, so several
+        updates in one main loop iteration cost one layout pass.
+        
+        Args:
+            text: Status text
+        """
+        with self._status_lock:
+            self._pending_status = text
+            if self._status_flush_id:
+                return
+            self._status_flush_id = GLib.idle_add(self._flush_status, priority=GLib.PRIORITY_HIGH_IDLE)
+    
+    def _flush_status(self):
+        """Show the latest status text set by _set_status."""
+        with self._status_lock:
+            text = self._pending_status
+            self._pending_status = None
+            self._status_flush_id = 0
+        self.status_label.set_text(text)
+        return False  # Remove idle callback
+    
+    def _submit_io(self, fn: Callable, *args) -> Future:
+        """Run a task on the I/O pool and report it if it fails.
+        
+        Args:
+            fn: Task to run
+            *args: Arguments for the task
+            
+        Returns:
+            Future for the task
+        """
+        future = self._io_executor.submit(fn, *args)
+        future.add_done_callback(self._on_io_task_done)
+        return future
+    
+    def _on_io_task_done(self, future: Future):
+        """Log an I/O task that raised and show the error in the status bar.
+        
+        Tasks report their expected failures themselves; this catches the
+        rest so the status bar isn't left on the task's progress message.
+        
+        Args:
+            future: The finished task
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            log.error("Error in background task", exc_info=error)
+            self._set_status(f"Error: {error}")
+    
+    def _queue_reload(self):
+        """Reload the images from page 1 on the next main loop iteration.
+        
+        Lets the UI repaint (e.g. a closing dialog) before the grid is
+        cleared and the fetch starts. Several requests in a row coalesce
+        into a single reload.
+        """
+        if not self._reload_idle_id:
+            self._reload_idle_id = GLib.idle_add(self._run_queued_reload)
+    
+    def _run_queued_reload(self):
+        """Run a reload queued by _queue_reload."""
+        self._reload_idle_id = 0
+        self._load_images(reset=True)
+        return False  # Remove idle callback
+    
     def _load_images(self, reset=False):
         """Load images from the selected source.
         
@@ -1268,142 +2309,225 @@ class MainWindow(Gtk.Window):
             self.current_page = 1
             
             # Clear the current flowbox
-            for child in self.flowbox.get_children():
-                self.flowbox.remove(child)
+            self._clear_flowbox()
+            
+            # Pages fetched for the previous query are no longer wanted
+            self._page_generation += 1
+            self._wallhaven_seed = None
+            for future in self._page_futures.values():
+                future.cancel()
+            self._page_futures.clear()
         
         # Show loading indicator
-        self.status_label.set_text("Loading images...")
+        self._set_status("Loading images...")
         
-        # Start a thread to fetch images
-        thread = threading.Thread(target=self._fetch_images, args=(reset,))
-        thread.daemon = True
-        thread.start()
+        self._request_page(self.current_page, reset)
     
-    def _fetch_images(self, reset=False):
-        """Fetch images from the current source.
+    def _request_page(self, page: int, reset: bool = False):
+        """Show a page of results once it has been fetched.
         
         Args:
-            reset: Whether to reset the view
+            page: Page number to show
+            reset: Whether this is the first page of a new search
         """
-        # If there are no more pages, don't fetch
-        if not reset and not self.has_next_page:
-            self.is_loading = False
-            return
+        future = self._page_futures.get(page)
+        if future is None:
+            future = self._submit_page(page, reset)
         
-        # Default parameters
-        params = {}
-        
-        # Get source name
-        source_name = self.source_manager.get_source_name()
-        print(f"Fetching images from source: {source_name}")
-        
-        # Source-specific parameters
-        if source_name == "Wallhaven":
-            # Add Wallhaven-specific parameters
-            params["categories"] = self.wallhaven_category
-            params["purity"] = self.wallhaven_purity
-            params["sorting"] = self.wallhaven_sorting
-            params["method"] = self.wallhaven_method
-            
-            # Add search query if available
-            if self.search_query:
-                params["query"] = self.search_query
-            
-        elif source_name == "Waifu.im":
-            # For Waifu.im, we need to specify whether to include NSFW content
-            params["is_nsfw"] = "nsfw" in self.selected_purity
-            
-        elif source_name == "Waifu.pics":
-            # For Waifu.pics, we need to specify whether to include NSFW content
-            print(f"Fetching Waifu.pics images with tags: {self.selected_tags}")
-            params["is_nsfw"] = "nsfw" in self.selected_purity
-        
-        elif source_name == "Nekos.moe":
-            # For Nekos.moe, add specific parameters
-            params["is_nsfw"] = "nsfw" in self.selected_purity
-            
-            # Add search query if available
-            if self.search_query:
-                params["query"] = self.search_query
-                
-            # Add sort parameter
-            if self.nekosmoe_sort == "random":
-                params["method"] = "random"
-            else:
-                params["sort"] = self.nekosmoe_sort
-        
-        # Get images based on parameters
-        response = self.source_manager.get_images(
-            tags=self.selected_tags, 
-            page=self.current_page,
-            reset_seed=reset,
-            **params
+        generation = self._page_generation
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._on_page_fetched, f, page, generation, reset)
         )
-
+    
+    def _submit_page(self, page: int, reset: bool = False) -> Future:
+        """Start fetching a page of results on the page pool.
+        
+        The request parameters are captured here, on the main thread, so
+        a page fetched ahead of time matches the query it was started for.
+        
+        Args:
+            page: Page number to fetch
+            reset: Whether this is the first page of a new search
+            
+        Returns:
+            Future for the source's response
+        """
+        params = self._get_fetch_params()
+        tags = list(self.selected_tags)
+        
+        # Reuse an identical request that is still running; queued ones
+        # cancelled by a reset are submitted again
+        key = (self.source_manager.current_source, tuple(sorted(params.items())), tuple(tags), page, reset)
+        future = self._inflight_pages.get(key)
+        if future is None or future.cancelled():
+            future = self._page_executor.submit(
+                self.source_manager.get_images,
+                tags=tags,
+                page=page,
+                reset_seed=reset,
+                **params
+            )
+            self._inflight_pages[key] = future
+            future.add_done_callback(
+                lambda f: GLib.idle_add(self._forget_inflight_page, key, f)
+            )
+        
+        self._page_futures[page] = future
+        return future
+    
+    def _forget_inflight_page(self, key: tuple, future: Future):
+        """Drop a finished page request from the in-flight requests.
+        
+        Args:
+            key: Query key the request was stored under
+            future: The finished request
+        """
+        if self._inflight_pages.get(key) is future:
+            del self._inflight_pages[key]
+        return False  # Remove idle callback
+    
+    def _prefetch_pages(self):
+        """Start fetching the pages after the current one."""
+        if not self.has_next_page:
+            return
+        
+        for page in range(self.current_page + 1, self.current_page + 1 + PAGE_PREFETCH_DEPTH):
+            if page not in self._page_futures:
+                self._submit_page(page)
+    
+    def _get_fetch_params(self) -> Dict[str, Any]:
+        """Get the source-specific parameters for fetching images.
+        
+        Returns:
+            Keyword arguments for SourceManager.get_images
+        """
+        builder = self._fetch_param_builders.get(self.source_manager.current_source)
+        return builder() if builder is not None else {}
+    
+    def _wallhaven_fetch_params(self) -> Dict[str, Any]:
+        """Get the Wallhaven parameters for fetching images.
+        
+        Returns:
+            Keyword arguments for SourceManager.get_images
+        """
+        params = {
+            "categories": self.wallhaven_category,
+            "purity": self.wallhaven_purity,
+            "sorting": self.wallhaven_sorting,
+            "method": self.wallhaven_method,
+            # Passed explicitly so fetches for a replaced query running on
+            # the page pool can't change the seed of the current one
+            "seed": self._wallhaven_seed,
+        }
+        
+        # Add search query if available
+        if self.search_query:
+            params["query"] = self.search_query
+        return params
+    
+    def _nsfw_fetch_params(self) -> Dict[str, Any]:
+        """Get the parameters for sources that only filter on NSFW content.
+        
+        Used for Waifu.im and Waifu.pics; their tags are passed to
+        get_images separately.
+        
+        Returns:
+            Keyword arguments for SourceManager.get_images
+        """
+        return {"is_nsfw": "nsfw" in self.selected_purity}
+    
+    def _nekosmoe_fetch_params(self) -> Dict[str, Any]:
+        """Get the Nekos.moe parameters for fetching images.
+        
+        Returns:
+            Keyword arguments for SourceManager.get_images
+        """
+        params = {"is_nsfw": "nsfw" in self.selected_purity}
+        
+        # Add search query if available
+        if self.search_query:
+            params["query"] = self.search_query
+        
+        # Add sort parameter
+        if self.nekosmoe_sort == "random":
+            params["method"] = "random"
+        else:
+            params["sort"] = self.nekosmoe_sort
+        return params
+    
+    def _on_page_fetched(self, future: Future, page: int, generation: int, reset: bool):
+        """Show a fetched page of results.
+        
+        Args:
+            future: Finished future for the page
+            page: Page number the future was fetched for
+            generation: Value of _page_generation when the page was requested
+            reset: Whether this is the first page of a new search
+        """
+        # Ignore pages for a query that has since been replaced
+        if generation != self._page_generation or future.cancelled():
+            return False
+        
+        # Clear loading flag
+        self.is_loading = False
+        
         try:
+            response = future.result()
+            
             # Get images and pagination info
             new_images = response.get("images", [])
             pagination = response.get("pagination", {})
             
             # Update pagination state
             self.has_next_page = pagination.get("has_next_page", False)
-            
-            # If this is a reset, replace the images list
-            # Otherwise, append to the existing list
-            if reset:
-                self.images = new_images
-            else:
-                self.images.extend(new_images)
-            
-            # Update UI in the main thread
-            GLib.idle_add(self._display_images, reset)
-            
-        except Exception as e:
-            print(f"Error fetching images: {e}")
-            GLib.idle_add(self._show_error, str(e))
+            if pagination.get("seed"):
+                self._wallhaven_seed = pagination["seed"]
         
-        finally:
-            # Clear loading flag
-            self.is_loading = False
-            
-            # Hide loading indicator
-            GLib.idle_add(lambda: self.loading_box.hide())
-            
-            # Stop spinner
-            GLib.idle_add(lambda: self.loading_spinner.stop())
+        except Exception as e:
+            log.error("Error fetching images: %s", e)
+            self._page_futures.pop(page, None)
+            self._show_error(str(e))
+            return False
+        
+        # The thumbnails keep their own image data, so earlier pages
+        # aren't held here as well
+        self._page_futures.pop(page, None)
+        self._display_images(new_images, reset)
+        
+        # Overlap the requests for the next pages with browsing this one
+        self._prefetch_pages()
+        return False  # Remove idle callback
     
-    def _display_images(self, reset=False):
+    def _display_images(self, images: List[Dict[str, Any]], reset=False):
         """Display fetched images in the UI.
         
         Args:
+            images: Newly fetched images to add to the grid
             reset: Whether this is a reset (new search) or pagination
         """
-        if not self.images:
-            self.status_label.set_text(f"No images found from {self.source_manager.get_source_name()}")
+        if not images:
+            if reset or self._thumb_index == 0:
+                self._set_status(f"No images found from {self.source_manager.get_source_name()}")
             
             # Hide loading indicator
             self.loading_box.hide()
             self.loading_spinner.stop()
             return
         
-        # If this is a pagination (not reset), only add the new images
-        start_index = 0 if reset else len(self.flowbox.get_children())
-        
-        # Get the new images to add
-        images_to_add = self.images[start_index:]
+        # Append the whole page in one model change; the flowbox builds the
+        # thumbnails through _create_image_card
+        position = self.image_store.get_n_items()
+        self.image_store.splice(position, 0, [ImageItem(image) for image in images])
         
-        # Update status text
+        # Update status text from the number of thumbnails in the grid
         pagination_text = f" (Page {self.current_page})" if self.has_next_page else ""
-        self.status_label.set_text(
-            f"Showing {len(self.images)} images from {self.source_manager.get_source_name()}{pagination_text}"
+        self._set_status(
+            f"Showing {self._thumb_index} images from {self.source_manager.get_source_name()}{pagination_text}"
         )
         
-        # Add images to the flowbox
-        for image in images_to_add:
-            self._add_image_thumbnail(image)
-        
-        # Show all widgets
-        self.show_all()
+        # Show the new thumbnails; showing the whole window would also
+        # re-show widgets hidden for the current source
+        self.flowbox.show_all()
         
         # Hide loading indicator
         self.loading_box.hide()
@@ -1415,29 +2539,81 @@ class MainWindow(Gtk.Window):
         Args:
             error_message: Error message to display
         """
-        self.status_label.set_text(f"Error: {error_message}")
+        self._set_status(f"Error: {error_message}")
         
         # Hide loading indicator
         self.loading_box.hide()
         self.loading_spinner.stop()
         
         # Create a dialog to show the error
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.ERROR,
-            buttons=Gtk.ButtonsType.OK,
-            text="Error loading images"
-        )
-        dialog.format_secondary_text(error_message)
-        dialog.run()
-        dialog.destroy()
+        self._show_message(Gtk.MessageType.ERROR, "Error loading images", error_message)
+    
+    def _show_message(self, message_type: Gtk.MessageType, text: str,
+                      secondary: Optional[str] = None, on_close: Optional[Callable[[], None]] = None):
+        """Show a modal message dialog without blocking in a nested main loop.
+        
+        One dialog per message type is built on first use and hidden rather
+        than destroyed when dismissed, so later messages only swap its text.
+        A new message replaces one of the same type that is still showing.
+        
+        Args:
+            message_type: Kind of message, e.g. Gtk.MessageType.ERROR
+            text: Primary text
+            secondary: Optional secondary text
+            on_close: Optional callback run after the dialog is dismissed
+        """
+        dialog = self._message_dialogs.get(message_type)
+        if dialog is None:
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                modal=True,
+                message_type=message_type,
+                buttons=Gtk.ButtonsType.OK
+            )
+            # Closing the window also arrives as a response, so this covers it;
+            # the window must only be hidden so it can be reused
+            dialog.connect("response", self._on_message_response)
+            dialog.connect("delete-event", Gtk.Widget.hide_on_delete)
+            self._message_dialogs[message_type] = dialog
+        
+        dialog.props.text = text
+        dialog.props.secondary_text = secondary
+        dialog.on_close = on_close
+        dialog.show()
+    
+    def _on_message_response(self, dialog, response):
+        """Hide a message dialog and run its close callback, if any.
+        
+        Args:
+            dialog: The message dialog
+            response: Response ID of the pressed button
+        """
+        dialog.hide()
+        on_close, dialog.on_close = dialog.on_close, None
+        if on_close is not None:
+            on_close()
+    
+    def _create_image_card(self, item: ImageItem) -> Gtk.Box:
+        """Create the flowbox widget for an item of the image store.
+        
+        Args:
+            item: Item added to the image store
+            
+        Returns:
+            The thumbnail container
+        """
+        return self._create_image_thumbnail(item.image)
     
-    def _add_image_thumbnail(self, image: Dict[str, Any]):
-        """Add image thumbnail to the flowbox with modern styling.
+    def _create_image_thumbnail(self, image: Dict[str, Any]) -> Gtk.Box:
+        """Create an image thumbnail for the flowbox with modern styling.
+        
+        The image loads once the thumbnail nears the viewport.
         
         Args:
             image: Image data dictionary
+            
+        Returns:
+            The thumbnail container
         """
         # Create a wrapper for the thumbnail that includes padding
         thumbnail_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
@@ -1450,96 +2626,329 @@ class MainWindow(Gtk.Window):
         thumbnail_container.set_property("width-request", 200)
         thumbnail_container.set_property("height-request", 180)
         
-        # Load image in background thread
-        thread = threading.Thread(target=self._load_image_thumbnail, args=(image, thumbnail_container))
-        thread.daemon = True
-        thread.start()
-        
-        self.flowbox.add(thumbnail_container)
+        # Show a placeholder until the thumbnail is ready
+        self._set_thumb_placeholder(thumbnail_container, image)
+        
+        # The image is loaded on the thumbnail pool once the thumbnail nears
+        # the viewport (see _load_visible_thumbnails); keep the task and a
+        # cancel event so the load can be re-prioritized or dropped later
+        index = self._thumb_index
+        self._thumb_index += 1
+        setattr(thumbnail_container, '_thumb_index', index)
+        setattr(thumbnail_container, '_thumb_image', image)
+        setattr(thumbnail_container, '_thumb_cancel', threading.Event())
+        setattr(thumbnail_container, '_thumb_task', None)
+        self._unloaded_thumbs.append(thumbnail_container)
+        
+        return thumbnail_container
     
-    def _load_image_thumbnail(self, image: Dict[str, Any], box: Gtk.Box):
-        """Load image thumbnail from URL.
+    def _set_thumb_placeholder(self, container: Gtk.Box, image: Dict[str, Any]):
+        """Replace a thumbnail's contents with the loading placeholder.
+        
+        Sources that report a dominant color get a block of that color,
+        drawn without any download, so the grid shows the rough tone of
+        each image before its thumbnail arrives.
         
         Args:
+            container: The thumbnail container
             image: Image data dictionary
-            box: Box to add the image to
         """
-        # Create placeholder widgets first
-        placeholder_label = Gtk.Label.new("Loading...")
-        placeholder_label.set_markup("<span color='#888'>Loading...</span>")
-        placeholder_label.get_style_context().add_class("placeholder-label")
+        for child in container.get_children():
+            container.remove(child)
         
-        # Add the placeholder to the box and show all elements
-        GLib.idle_add(lambda: box.pack_start(placeholder_label, True, True, 0) or box.show_all())
+        rgba = Gdk.RGBA()
+        if image.get("color") and rgba.parse(image["color"]):
+            placeholder = Gtk.DrawingArea()
+            placeholder.connect("draw", _paint_placeholder, rgba)
+        else:
+            placeholder = Gtk.Label.new("Loading...")
+            placeholder.set_markup("<span color='#888'>Loading...</span>")
+            placeholder.get_style_context().add_class("placeholder-label")
+        container.pack_start(placeholder, True, True, 0)
+        placeholder.show()
+    
+    def _thumb_cache_get(self, key):
+        """Look up a decoded thumbnail and mark it as recently used.
         
-        try:
-            if not image.get("preview"):
-                raise ValueError("No preview URL available")
-                
-            # Use proper headers to ensure images load correctly
-            headers = {'User-Agent': 'PixelVault Image Downloader'}
-            response = requests.get(image["preview"], headers=headers)
-            if response.status_code != 200:
-                raise ValueError(f"Failed to load image: HTTP {response.status_code}")
-                
-            # Store response content directly
-            data_bytes = response.content
-            
-            # Helper function to check if data is a GIF
-            def is_gif(data):
-                return len(data) > 3 and data[:3] == b'GIF'
+        Args:
+            key: Cache key of (url, max_width, max_height)
             
-            def update_ui(image_data, data):
-                try:
-                    # Remove placeholders
-                    for child in box.get_children():
-                        box.remove(child)
+        Returns:
+            The cached (pixbuf, animation, width, height, source_size) entry, or None
+        """
+        with self._thumb_cache_lock:
+            entry = self._thumb_cache.get(key)
+            if entry is not None:
+                self._thumb_cache.move_to_end(key)
+            return entry
+    
+    def _thumb_cache_put(self, key, entry):
+        """Store a decoded thumbnail, evicting the least recently used one.
+        
+        Args:
+            key: Cache key of (url, max_width, max_height)
+            entry: Tuple of (pixbuf, animation, width, height, source_size)
+        """
+        with self._thumb_cache_lock:
+            self._thumb_cache[key] = entry
+            self._thumb_cache.move_to_end(key)
+            if len(self._thumb_cache) > THUMBNAIL_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+    
+    def _preview_cache_get(self, url: str):
+        """Look up a decoded dialog preview and mark it as recently used.
+        
+        Args:
+            url: Full image URL
+            
+        Returns:
+            The cached (pixbuf, animation) entry, or None
+        """
+        with self._thumb_cache_lock:
+            entry = self._preview_cache.get(url)
+            if entry is not None:
+                self._preview_cache.move_to_end(url)
+            return entry
+    
+    def _preview_cache_put(self, url: str, entry):
+        """Store a decoded dialog preview, evicting the least recently used one.
+        
+        Args:
+            url: Full image URL
+            entry: Tuple of (pixbuf, animation)
+        """
+        with self._thumb_cache_lock:
+            self._preview_cache[url] = entry
+            self._preview_cache.move_to_end(url)
+            if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+    
+    def _on_low_memory(self, monitor, level):
+        """Drop the in-memory thumbnail and preview caches on a low memory warning.
+        
+        Visible thumbnails keep their own references; evicted ones are
+        reloaded from the disk cache when needed again.
+        """
+        with self._thumb_cache_lock:
+            self._thumb_cache.clear()
+            self._preview_cache.clear()
+        log.debug("Cleared thumbnail cache on low memory warning (level %s)", level)
+    
+    def _fetch_thumbnail(self, image: Dict[str, Any], cancel: Optional[threading.Event] = None):
+        """Download and decode a thumbnail.
+        
+        Runs on a worker thread. Fills in missing dimensions and the GIF flag
+        on the image data.
+        
+        Args:
+            image: Image data dictionary
+            cancel: Optional event that aborts the download when set
+            
+        Returns:
+            Tuple of (pixbuf, animation, source_size); exactly one of pixbuf
+            and animation is set, source_size is the preview's own size
+        """
+        url = image["preview"]
+        cache_path = _thumb_cache_path(url)
+        
+        loaded = None
+        try:
+            with open(cache_path, 'rb') as f:
+                loaded = _load_scaled_image(_read_chunks(f), THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT)
+            # Refresh the mtime so the pruning sweep sees this as recently used
+            os.utime(cache_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, GLib.Error) as e:
+            log.debug("Discarding unreadable cached thumbnail %s: %s", cache_path, e)
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+        
+        if loaded is None:
+            loaded = self._download_thumbnail(url, cache_path, cancel)
+        loader, width, height = loaded
+        
+        pixbuf, animation = _split_animation(loader, image)
+        
+        # Fill in dimensions the source didn't provide
+        if not image.get('width') or not image.get('height'):
+            image['width'], image['height'] = width, height
+        
+        return pixbuf, animation, (width, height)
+    
+    def _fetch_thumbnail_shared(self, image: Dict[str, Any], cache_key: tuple,
+                                cancel: threading.Event) -> tuple:
+        """Fetch a thumbnail, sharing the work with loads of the same preview.
+        
+        Results often repeat a preview URL, so the first load of a URL does
+        the download and decode while later ones wait for its result rather
+        than fetching it again. Runs on a worker thread.
+        
+        Args:
+            image: Image data dictionary
+            cache_key: Decoded thumbnail cache key for the preview
+            cancel: Event set when this load's thumbnail leaves the grid
+            
+        Returns:
+            The thumbnail cache entry, which is also stored in the cache
+        """
+        while True:
+            with self._thumb_fetch_lock:
+                future = self._thumb_fetches.get(cache_key)
+                owner = future is None
+                if owner:
+                    future = self._thumb_fetches[cache_key] = Future()
+            
+            if not owner:
+                try:
+                    return future.result()
+                except LoadCancelled:
+                    # The load that started the fetch was dropped; take the
+                    # fetch over unless this one was dropped too
+                    if cancel.is_set():
+                        raise
+                    continue
+            
+            try:
+                pixbuf, animation, source_size = self._fetch_thumbnail(image, cancel)
+                entry = (pixbuf, animation, image.get('width'), image.get('height'), source_size)
+                self._thumb_cache_put(cache_key, entry)
+                future.set_result(entry)
+                return entry
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._thumb_fetch_lock:
+                    del self._thumb_fetches[cache_key]
+    
+    def _download_thumbnail(self, url: str, cache_path: Path, cancel: Optional[threading.Event] = None):
+        """Download and decode a thumbnail, storing a copy in the disk cache.
+        
+        The data is written to a temporary file next to the cache entry and
+        renamed into place once complete, so readers never see partial files.
+        
+        Args:
+            url: Thumbnail URL
+            cache_path: Where to store the downloaded file
+            cancel: Optional event that aborts the download when set
+            
+        Returns:
+            Tuple of (loader, original_width, original_height)
+        """
+        with _SESSION.get(url, stream=True, timeout=THUMBNAIL_TIMEOUT) as response:
+            response.raise_for_status()
+            
+            # Refuse oversized "thumbnails" before reading any of the body,
+            # and cap the body in case the header is missing or wrong
+            if int(response.headers.get("Content-Length") or 0) > THUMBNAIL_MAX_BYTES:
+                raise ValueError(f"Thumbnail larger than {THUMBNAIL_MAX_BYTES // (1024 * 1024)} MB")
+            chunks = _limit_chunks(response.iter_content(chunk_size=STREAM_CHUNK_SIZE), THUMBNAIL_MAX_BYTES)
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_file = tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False)
+            except OSError as e:
+                log.debug("Thumbnail disk cache unavailable: %s", e)
+                return _load_scaled_image(chunks, THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT, cancel=cancel)
+            
+            try:
+                with cache_file:
+                    loaded = _load_scaled_image(
+                        _tee_chunks(chunks, cache_file), THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT,
+                        cancel=cancel
+                    )
+                    complete = not cache_file.closed
+            except BaseException:
+                os.unlink(cache_file.name)
+                raise
+        
+        # The decode worked; a failure from here on only costs the cache entry
+        try:
+            if complete:
+                os.replace(cache_file.name, cache_path)
+            else:
+                os.unlink(cache_file.name)
+        except OSError as e:
+            log.debug("Could not store thumbnail %s: %s", cache_path, e)
+        return loaded
+    
+    def _queue_thumb_update(self, callback, *args):
+        """Schedule a thumbnail widget update on the main thread.
+        
+        Updates from all loader threads are collected and applied together
+        by a single low-priority idle callback, so a burst of finished
+        thumbnails costs one layout pass instead of one per thumbnail.
+        
+        Args:
+            callback: Function that updates the thumbnail widgets
+            *args: Arguments for the callback
+        """
+        with self._pending_thumb_lock:
+            self._pending_thumb_updates.append((callback, args))
+            if len(self._pending_thumb_updates) > 1:
+                return  # A flush is already scheduled
+        GLib.idle_add(self._flush_thumb_updates, priority=GLib.PRIORITY_LOW)
+    
+    def _flush_thumb_updates(self):
+        """Apply all queued thumbnail updates and show them in one pass."""
+        with self._pending_thumb_lock:
+            updates = self._pending_thumb_updates
+            self._pending_thumb_updates = []
+        
+        for callback, args in updates:
+            callback(*args)
+        
+        self.flowbox.show_all()
+        return False  # Remove idle callback
+    
+    def _load_image_thumbnail(self, image: Dict[str, Any], box: Gtk.Box,
+                              cancel: threading.Event, generation: int):
+        """Load image thumbnail from URL.
+        
+        Args:
+            image: Image data dictionary
+            box: Box to add the image to
+            cancel: Event set when the thumbnail is removed from the grid
+            generation: Value of the grid generation counter at submission
+        """
+        def is_stale():
+            return cancel.is_set() or generation != self._thumb_generation
+        
+        try:
+            if is_stale():
+                return
+            
+            if not image.get("preview"):
+                raise ValueError("No preview URL available")
+                
+            # Reuse an already decoded thumbnail if we have one
+            cache_key = (image["preview"], THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT)
+            cached = self._thumb_cache_get(cache_key)
+            if cached is None:
+                cached = self._fetch_thumbnail_shared(image, cache_key, cancel)
+            pixbuf, animation, width, height, _source_size = cached
+            if animation is not None:
+                image['is_gif'] = True
+            if not image.get('width') or not image.get('height'):
+                image['width'], image['height'] = width, height
+            
+            def update_ui(image_data, pixbuf, animation):
+                if is_stale():
+                    return False
+                
+                try:
+                    # Remove placeholders
+                    for child in box.get_children():
+                        box.remove(child)
                     
                     try:
-                        # Create pixbuf from data
-                        loader = GdkPixbuf.PixbufLoader()
-                        loader.write(data)
-                        loader.close()
-                        
-                        pixbuf = loader.get_pixbuf()
-                        is_animation = is_gif(data) and hasattr(loader, 'get_animation')
-                        animation = loader.get_animation() if is_animation else None
-                        
-                        # Get actual dimensions from pixbuf
-                        actual_width = pixbuf.get_width()
-                        actual_height = pixbuf.get_height()
-                        
-                        # Update image data with actual dimensions if not present
-                        if not image_data.get('width'):
-                            image_data['width'] = actual_width
-                        if not image_data.get('height'):
-                            image_data['height'] = actual_height
-                        
-                        # Scale the pixbuf
-                        max_width = 550
-                        max_height = 400
-                        width = pixbuf.get_width()
-                        height = pixbuf.get_height()
-                        
-                        if width > height:
-                            new_width = max_width
-                            new_height = int(height * (max_width / width))
-                        else:
-                            new_height = max_height
-                            new_width = int(width * (max_height / height))
-                        
                         # Create image widget - use animation if available
-                        if is_animation and animation and not animation.is_static_image():
-                            scaled_animation = animation  # GIF animations need special handling
-                            image_widget = Gtk.Image.new_from_animation(scaled_animation)
-                            # Mark this as a GIF in the image data
-                            image_data['is_gif'] = True
+                        if animation is not None:
+                            image_widget = Gtk.Image.new_from_animation(animation)
                         else:
-                            scaled_pixbuf = pixbuf.scale_simple(new_width, new_height, GdkPixbuf.InterpType.BILINEAR)
-                            image_widget = Gtk.Image.new_from_pixbuf(scaled_pixbuf)
-                        
-                        # Store the image data
-                        setattr(image_widget, 'image_data', image_data)
+                            image_widget = Gtk.Image.new_from_pixbuf(pixbuf)
                         
                         # Add the image
                         box.pack_start(image_widget, False, False, 0)
@@ -1566,42 +2975,43 @@ class MainWindow(Gtk.Window):
                         
                         # Add metadata box
                         box.pack_start(meta_box, False, False, 0)
-                        box.show_all()
+                        self._loaded_thumbs.append(box)
                     except Exception as e:
-                        print(f"Error processing image data: {e}")
+                        log.error("Error processing image data: %s", e)
                         error_label = Gtk.Label.new(f"Error: {str(e)}")
                         error_label.get_style_context().add_class("info-label")
                         box.pack_start(error_label, True, True, 0)
-                        box.show_all()
                     
                     return False  # Remove idle callback
                 except Exception as e:
-                    print(f"Error in update_ui: {e}")
+                    log.error("Error in update_ui: %s", e)
                     # Show error instead
                     error_label = Gtk.Label.new("Error")
                     error_label.get_style_context().add_class("info-label")
                     box.pack_start(error_label, True, True, 0)
-                    box.show_all()
                     return False  # Remove idle callback
             
-            GLib.idle_add(update_ui, image, data_bytes)
+            self._queue_thumb_update(update_ui, image, pixbuf, animation)
             
+        except LoadCancelled:
+            pass
         except Exception as e:
-            print(f"Error loading image: {e}")
+            log.error("Error loading image: %s", e)
             
             def show_error():
+                if is_stale():
+                    return False
+                
                 # Remove placeholders
                 for child in box.get_children():
-                    if child == placeholder_label:
-                        box.remove(child)
+                    box.remove(child)
                         
                 error_label = Gtk.Label.new("Error loading image")
                 error_label.get_style_context().add_class("info-label")
                 box.pack_start(error_label, True, True, 0)
-                box.show_all()
                 return False  # Remove idle callback
             
-            GLib.idle_add(show_error)
+            self._queue_thumb_update(show_error)
     
     def _on_image_activated(self, flowbox, child):
         """Handle image activation (click).
@@ -1611,15 +3021,9 @@ class MainWindow(Gtk.Window):
             child: The selected FlowBoxChild
         """
         try:
-            # Get the box and then find the image widget with image_data
-            box = child.get_child()
-            
-            # Find image widget with image_data
-            image_data = None
-            for widget in box.get_children():
-                if isinstance(widget, Gtk.Image) and hasattr(widget, 'image_data'):
-                    image_data = widget.image_data
-                    break
+            # The thumbnail container carries its image data, whether or not
+            # the thumbnail has loaded yet
+            image_data = getattr(child.get_child(), '_thumb_image', None)
             
             if not image_data:
                 raise ValueError("Could not find image data")
@@ -1630,19 +3034,20 @@ class MainWindow(Gtk.Window):
             
             # Ensure we have width/height (these might come from the preview)
             if not image_data.get('width') or not image_data.get('height'):
-                print("Image dimensions not available, will be filled when loading preview")
+                log.debug("Image dimensions not available, will be filled when loading preview")
             
             # Check if auto-download is enabled
-            if settings.get("auto_download", False):
+            auto_download = settings.get("auto_download", False)
+            if auto_download:
                 # Auto-download the image
                 self._auto_download_image(image_data)
             
             # Show the image dialog (passing auto-download status)
-            self._show_image_dialog(image_data, settings.get("auto_download", False))
+            self._show_image_dialog(image_data, auto_download)
         
         except Exception as e:
-            print(f"Error handling image activation: {e}")
-            self.status_label.set_text(f"Error: {str(e)}")
+            log.error("Error handling image activation: %s", e)
+            self._set_status(f"Error: {str(e)}")
     
     def _auto_download_image(self, image_data: Dict[str, Any]):
         """Automatically download the image to the configured directory.
@@ -1656,112 +3061,89 @@ class MainWindow(Gtk.Window):
         # Get download directory from settings
         download_dir = settings.get("download_directory", "")
         
-        print(f"Auto-download requested for image {image_data.get('id')}")
-        print(f"Auto-download setting: {settings.get('auto_download')}")
-        print(f"Download directory: {download_dir}")
+        log.debug("Auto-download requested for image %s", image_data.get('id'))
+        log.debug("Download directory: %s", download_dir)
         
         if not download_dir:
-            print("Download directory is empty, using default")
+            log.debug("Download directory is empty, using default")
             download_dir = str(Path.home() / "Pictures" / "Pixelvault")
             settings.set("download_directory", download_dir)
         
         # Check if we should organize by source
-        if settings.get("organize_by_source", True):
+        organize_by_source = settings.get("organize_by_source", True)
+        filename_format = settings.get("filename_format", "original")
+        if organize_by_source:
             # Get source name and create subdirectory
             source_name = image_data.get("provider", "").lower().replace(".", "_")
             if source_name:
                 download_dir = os.path.join(download_dir, source_name)
-                print(f"Using source subdirectory: {download_dir}")
+                log.debug("Using source subdirectory: %s", download_dir)
         
-        if not os.path.exists(download_dir):
-            # Try to create the directory
-            try:
-                print(f"Creating download directory: {download_dir}")
-                os.makedirs(download_dir, exist_ok=True)
-            except Exception as e:
-                print(f"Error creating download directory: {e}")
-                GLib.idle_add(lambda: self.status_label.set_text(f"Error: Could not create download directory"))
-                
-                # Show error dialog
-                def show_error_dialog():
-                    dialog = Gtk.MessageDialog(
-                        transient_for=self,
-                        flags=0,
-                        message_type=Gtk.MessageType.ERROR,
-                        buttons=Gtk.ButtonsType.OK,
-                        text="Auto-download Failed"
-                    )
-                    dialog.format_secondary_text(
-                        f"Could not create download directory: {download_dir}\n\n"
-                        f"Error: {str(e)}\n\n"
-                        f"Please check your auto-download settings."
-                    )
-                    dialog.run()
-                    dialog.destroy()
-                    
-                    # Open settings dialog to fix the issue
-                    settings_dialog = SettingsDialog(self)
-                    settings_response = settings_dialog.run()
-                    
-                    if settings_response == Gtk.ResponseType.OK:
-                        settings_dialog.save_settings()
-                    
-                    settings_dialog.destroy()
-                
-                GLib.idle_add(show_error_dialog)
-                return None
+        # Make sure the directory exists
+        try:
+            os.makedirs(download_dir, exist_ok=True)
+        except OSError as e:
+            error = str(e)
+            log.error("Error creating download directory: %s", error)
+            self._set_status(f"Error: Could not create download directory")
+            
+            # Show error dialog
+            def open_settings():
+                # Open settings dialog to fix the issue
+                self._on_settings_clicked(None)
+            
+            def show_error_dialog():
+                self._show_message(
+                    Gtk.MessageType.ERROR, "Auto-download Failed",
+                    f"Could not create download directory: {download_dir}\n\n"
+                    f"Error: {error}\n\n"
+                    f"Please check your auto-download settings.",
+                    on_close=open_settings
+                )
+                return False  # Remove idle callback
+            
+            GLib.idle_add(show_error_dialog)
+            return None
         
         # Get image ID
         image_id = image_data.get("id", "image")
         
         # Get file extension from URL or from is_gif flag
-        url = image_data.get("url", "")
-        if image_data.get('is_gif', False) or url.lower().endswith(".gif"):
-            ext = ".gif"
-        elif url.lower().endswith(".jpg") or url.lower().endswith(".jpeg"):
-            ext = ".jpg"
-        elif url.lower().endswith(".png"):
-            ext = ".png"
-        else:
-            ext = ".jpg"  # Default to jpg if unknown
+        ext = _image_extension(image_data)
         
         # Format filename according to settings
-        filename_format = settings.get("filename_format", "original")
-        provider = image_data.get("provider", "").lower()
-        
         if filename_format == "source_id":
             # Format: provider_id.ext
+            provider = image_data.get("provider", "").lower()
             filename = f"{provider}_{image_id}{ext}"
         elif filename_format == "date_id":
             # Format: YYYYMMDD_id.ext
-            import datetime
             date_str = datetime.datetime.now().strftime("%Y%m%d")
             filename = f"{date_str}_{image_id}{ext}"
         else:
             # Default format: just the ID
             filename = f"{image_id}{ext}"
         
-        # Create full path
-        save_path = os.path.join(download_dir, filename)
-        
-        # Check if file already exists
-        if os.path.exists(save_path):
-            # Add a number to avoid overwriting
-            base, ext = os.path.splitext(filename)
-            counter = 1
-            while os.path.exists(os.path.join(download_dir, f"{base}_{counter}{ext}")):
-                counter += 1
-            save_path = os.path.join(download_dir, f"{base}_{counter}{ext}")
+        # Claim the file name, adding a number to avoid overwriting
+        try:
+            save_path = _reserve_path(download_dir, filename)
+        except OSError as e:
+            log.error("Error creating download file: %s", e)
+            self._set_status(f"Error: Could not create {filename}")
+            return None
         
-        print(f"Auto-downloading image to: {save_path}")
+        log.debug("Auto-downloading image to: %s", save_path)
         
         # Update status
-        GLib.idle_add(lambda: self.status_label.set_text(f"Auto-downloading image to {os.path.basename(save_path)}..."))
+        self._set_status(f"Auto-downloading image to {os.path.basename(save_path)}...")
         
-        # Start download in a background thread
-        thread = threading.Thread(target=self._download_image_task, args=(image_data, save_path, True))
-        thread.daemon = True
-        thread.start()
+        # If the name was taken, the file there may be this same image from
+        # an earlier click; the task checks before downloading it again
+        preferred_path = os.path.join(download_dir, filename)
+        existing_path = preferred_path if save_path != preferred_path else None
+        
+        # Start download in the background
+        self._submit_io(self._download_image_task, image_data, save_path, True, existing_path)
         
         # Return the path for reference
         return save_path
@@ -1774,21 +3156,6 @@ class MainWindow(Gtk.Window):
             auto_download_enabled: Whether auto-download is enabled
         """
         try:
-            # Normalize tags - ensure they're strings
-            if 'tags' in image_data:
-                if isinstance(image_data['tags'], list):
-                    # Check if tags are dictionaries or strings
-                    normalized_tags = []
-                    for tag in image_data['tags']:
-                        if isinstance(tag, dict) and 'name' in tag:
-                            normalized_tags.append(tag['name'])
-                        elif isinstance(tag, str):
-                            normalized_tags.append(tag)
-                    image_data['tags'] = normalized_tags
-                elif not image_data['tags']:
-                    # If empty, use empty list
-                    image_data['tags'] = []
-            
             # Determine the buttons to show based on auto-download status
             if auto_download_enabled:
                 # If auto-download is enabled, show Download, Open Folder and Wallpaper buttons
@@ -1822,10 +3189,9 @@ class MainWindow(Gtk.Window):
             content_box.set_margin_end(12)
             content_area.add(content_box)
             
-            # Image preview
-            thread = threading.Thread(target=self._load_preview_image, args=(image_data, content_box))
-            thread.daemon = True
-            thread.start()
+            # Image preview, loaded on the thumbnail pool ahead of any
+            # queued thumbnails
+            self._thumb_pool.submit((-1, 0), self._load_preview_image, image_data, content_box)
             
             # Image details
             details_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
@@ -1886,7 +3252,7 @@ class MainWindow(Gtk.Window):
                 row += 1
             
             # Tags
-            if image_data.get('tags') and len(image_data.get('tags', [])) > 0:
+            if image_data.get('tags'):
                 tags_label = Gtk.Label.new("Tags:")
                 tags_label.set_halign(Gtk.Align.START)
                 
@@ -1925,77 +3291,44 @@ class MainWindow(Gtk.Window):
             
             content_box.pack_start(details_box, True, True, 0)
             
+            # Handle the buttons from the response signal instead of a nested
+            # dialog.run() loop, so browsing continues while the dialog is open
+            dialog.connect("response", self._on_image_dialog_response, image_data)
             dialog.show_all()
-            response = dialog.run()
-            
-            if response == Gtk.ResponseType.OK:
-                self._set_as_wallpaper(image_data)
-            elif response == Gtk.ResponseType.APPLY:
-                self._download_image(image_data)
-            elif response == Gtk.ResponseType.HELP:  # Open folder button
-                self._open_download_folder()
-            
-            dialog.destroy()
         except Exception as e:
-            print(f"Error in _show_image_dialog: {e}")
-            self.status_label.set_text(f"Error showing image details: {str(e)}")
+            log.error("Error in _show_image_dialog: %s", e)
+            self._set_status(f"Error showing image details: {str(e)}")
+    
+    def _on_image_dialog_response(self, dialog, response, image_data: Dict[str, Any]):
+        """Handle a button press in the image details dialog.
+        
+        Args:
+            dialog: The image details dialog
+            response: Response ID of the pressed button
+            image_data: Image data dictionary shown in the dialog
+        """
+        if response == Gtk.ResponseType.OK:
+            self._set_as_wallpaper(image_data)
+        elif response == Gtk.ResponseType.APPLY:
+            self._download_image(image_data)
+        elif response == Gtk.ResponseType.HELP:  # Open folder button
+            self._open_download_folder()
+        
+        dialog.destroy()
     
     def _open_download_folder(self):
         """Open the download folder in the file manager."""
         download_dir = settings.get("download_directory", "")
         if not download_dir or not os.path.exists(download_dir):
             # If download directory doesn't exist, show error
-            dialog = Gtk.MessageDialog(
-                transient_for=self,
-                flags=0,
-                message_type=Gtk.MessageType.ERROR,
-                buttons=Gtk.ButtonsType.OK,
-                text="Download directory not found"
+            self._show_message(
+                Gtk.MessageType.ERROR, "Download directory not found",
+                f"The directory {download_dir} does not exist."
             )
-            dialog.format_secondary_text(f"The directory {download_dir} does not exist.")
-            dialog.run()
-            dialog.destroy()
-            return
-        
-        # Try xdg-open first (most Linux distros)
-        try:
-            subprocess.Popen(["xdg-open", download_dir])
             return
-        except:
-            pass
-        
-        # Try nautilus (GNOME)
-        try:
-            subprocess.Popen(["nautilus", download_dir])
-            return
-        except:
-            pass
         
-        # Try thunar (XFCE)
-        try:
-            subprocess.Popen(["thunar", download_dir])
-            return
-        except:
-            pass
-        
-        # Try dolphin (KDE)
-        try:
-            subprocess.Popen(["dolphin", download_dir])
-            return
-        except:
-            pass
-        
-        # If we get here, none of the commands worked
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.ERROR,
-            buttons=Gtk.ButtonsType.OK,
-            text="Could not open folder"
-        )
-        dialog.format_secondary_text("No compatible file manager found.")
-        dialog.run()
-        dialog.destroy()
+        if not open_folder(download_dir):
+            self._show_message(Gtk.MessageType.ERROR, "Could not open folder", "No compatible file manager found.")
     
     def _download_image(self, image_data: Dict[str, Any]):
         """Download the image to a user-selected location.
@@ -2017,15 +3350,7 @@ class MainWindow(Gtk.Window):
         # Set suggested filename based on image id
         image_id = image_data.get("id", "image")
         # Add file extension based on URL or is_gif flag
-        url = image_data.get("url", "")
-        if image_data.get('is_gif', False) or url.lower().endswith(".gif"):
-            dialog.set_current_name(f"{image_id}.gif")
-        elif url.lower().endswith(".jpg") or url.lower().endswith(".jpeg"):
-            dialog.set_current_name(f"{image_id}.jpg")
-        elif url.lower().endswith(".png"):
-            dialog.set_current_name(f"{image_id}.png")
-        else:
-            dialog.set_current_name(f"{image_id}.jpg")
+        dialog.set_current_name(f"{image_id}{_image_extension(image_data)}")
         
         # Add filters for image types
         filter_images = Gtk.FileFilter()
@@ -2036,267 +3361,288 @@ class MainWindow(Gtk.Window):
         dialog.add_filter(filter_images)
         
         # Show the dialog
-        response = dialog.run()
+        dialog.set_modal(True)
+        dialog.connect("response", self._on_save_dialog_response, image_data)
+        dialog.show()
+    
+    def _on_save_dialog_response(self, dialog, response, image_data: Dict[str, Any]):
+        """Start downloading the image once a save location was chosen.
         
-        if response == Gtk.ResponseType.ACCEPT:
-            save_path = dialog.get_filename()
-            dialog.destroy()
-            
-            # Start download in a background thread
-            thread = threading.Thread(target=self._download_image_task, args=(image_data, save_path))
-            thread.daemon = True
-            thread.start()
+        Args:
+            dialog: The file chooser dialog
+            response: Response ID of the pressed button
+            image_data: Image data dictionary
+        """
+        save_path = dialog.get_filename() if response == Gtk.ResponseType.ACCEPT else None
+        dialog.destroy()
+        
+        if save_path:
+            # Start download in the background
+            self._submit_io(self._download_image_task, image_data, save_path)
+    
+    def _show_download_notification(self, image_data: Dict[str, Any], save_path: str, gif_info: str):
+        """Show the download complete notification.
+        
+        Args:
+            image_data: Image data dictionary
+            save_path: Path the image was saved to
+            gif_info: Extra line about GIF frames, or an empty string
+        """
+        notification_dialog = Gtk.MessageDialog(
+            transient_for=self,
+            flags=Gtk.DialogFlags.MODAL,
+            message_type=Gtk.MessageType.INFO,
+            buttons=Gtk.ButtonsType.OK_CANCEL,
+            text="Download Complete"
+        )
+        
+        # Add secondary text showing the path and metadata
+        if image_data.get('width') and image_data.get('height'):
+            notification_dialog.format_secondary_text(
+                f"Image saved to: {save_path}\n"
+                f"Resolution: {image_data.get('width')}x{image_data.get('height')}{gif_info}"
+            )
         else:
-            dialog.destroy()
+            notification_dialog.format_secondary_text(f"Image saved to: {save_path}{gif_info}")
+        
+        # Add button to open folder
+        notification_dialog.add_button("Open Folder", Gtk.ResponseType.HELP)
+        
+        # Show the dialog
+        notification_dialog.connect("response", self._on_download_notification_response)
+        notification_dialog.show()
+        return False  # Remove idle callback
+    
+    def _on_download_notification_response(self, dialog, response):
+        """Handle the download complete notification closing.
+        
+        Args:
+            dialog: The notification dialog
+            response: Response ID of the pressed button
+        """
+        dialog.destroy()
+        
+        if response == Gtk.ResponseType.HELP:
+            # Open the containing folder
+            self._open_download_folder()
     
-    def _download_image_task(self, image_data: Dict[str, Any], save_path: str, is_auto_download=False):
+    def _download_image_task(self, image_data: Dict[str, Any], save_path: str, is_auto_download=False,
+                             existing_path: Optional[str] = None):
         """Background task to download and save the image.
         
         Args:
             image_data: Image data dictionary
             save_path: Path to save the image to
             is_auto_download: Whether this is an automatic download
+            existing_path: Optional file that may already hold this image;
+                if it does, nothing is downloaded and save_path is removed
         """
+        if existing_path is not None and _is_same_download(existing_path, image_data["url"]):
+            try:
+                os.remove(save_path)
+            except OSError:
+                pass
+            self._set_status(f"Image already downloaded as {os.path.basename(existing_path)}")
+            return
+        
+        part_path = save_path + ".part"
         try:
             # Update status if not auto-download (auto-download already updated status)
             if not is_auto_download:
-                GLib.idle_add(lambda: self.status_label.set_text(f"Downloading image..."))
+                self._set_status(f"Downloading image...")
             
             # Download the full-size image with stream=True to avoid loading entire image in memory
-            headers = {'User-Agent': 'PixelVault Image Downloader'}
-            response = requests.get(image_data["url"], stream=True, headers=headers)
+            response = _SESSION.get(image_data["url"], stream=True, timeout=IMAGE_TIMEOUT)
             response.raise_for_status()
             
             # Print debug info about the image being downloaded
-            print(f"Downloading image: {image_data.get('id', 'unknown')} from {image_data.get('provider', 'unknown')}")
-            print(f"URL: {image_data.get('url', 'unknown')}")
-            print(f"Resolution: {image_data.get('width', 'unknown')}x{image_data.get('height', 'unknown')}")
+            log.debug("Downloading image: %s from %s", image_data.get('id', 'unknown'), image_data.get('provider', 'unknown'))
+            log.debug("URL: %s", image_data.get('url', 'unknown'))
+            log.debug("Resolution: %sx%s", image_data.get('width', 'unknown'), image_data.get('height', 'unknown'))
             
             # Check if it's a GIF based on either the path or is_gif flag
             is_gif = image_data.get('is_gif', False) or save_path.lower().endswith('.gif')
             
             # Save to file preserving original quality
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            def report_progress(written, total):
+                if total:
+                    text = f"Downloading image... {written * 100 // total}%"
+                else:
+                    text = f"Downloading image... {written / (1024 * 1024):.1f} MB"
+                self._set_status(text)
+            
+            # Write to a side file and move it into place once complete, so
+            # a failed download never leaves a truncated image at save_path
+            with open(part_path, 'wb') as f:
+                _save_response(response, f, report_progress)
             
             # Try to add metadata to image
             try:
-                # Open image with PIL to update metadata
-                img = Image.open(save_path)
-                
-                # Extract actual dimensions from the file
-                width, height = img.size
-                
-                # Update image_data with actual dimensions if they weren't set
-                if not image_data.get('width') or not image_data.get('height'):
-                    image_data['width'] = width
-                    image_data['height'] = height
-                    print(f"Updated dimensions from file: {width}x{height}")
-                
-                # Get frame count for GIFs
-                frame_count = 1
-                if is_gif:
-                    try:
-                        # Count frames in GIF
-                        frame_count = 0
-                        for frame in ImageSequence.Iterator(img):
-                            frame_count += 1
-                        print(f"GIF has {frame_count} frames")
-                        image_data['frames'] = frame_count
-                    except Exception as e:
-                        print(f"Error counting GIF frames: {e}")
-                
-                # Create metadata dictionary for PNG files
-                metadata = PngImagePlugin.PngInfo() if save_path.lower().endswith('.png') else None
+                # Only open the file with PIL for what the source didn't
+                # report: missing dimensions, or a GIF's frame count
+                needs_size = not image_data.get('width') or not image_data.get('height')
+                if needs_size or is_gif:
+                    with Image.open(part_path) as img:
+                        # Update image_data with actual dimensions if they weren't set
+                        if needs_size:
+                            image_data['width'], image_data['height'] = img.size
+                            log.debug("Updated dimensions from file: %sx%s", *img.size)
+                        
+                        # Get frame count for GIFs
+                        if is_gif:
+                            try:
+                                # Count frames in GIF
+                                frame_count = 0
+                                for frame in ImageSequence.Iterator(img):
+                                    frame_count += 1
+                                log.debug("GIF has %s frames", frame_count)
+                                image_data['frames'] = frame_count
+                            except Exception as e:
+                                log.error("Error counting GIF frames: %s", e)
                 
                 # If PNG, we can add metadata
-                if metadata:
-                    # Normalize tags
-                    tag_list = []
-                    if 'tags' in image_data:
-                        if isinstance(image_data['tags'], list):
-                            for tag in image_data['tags']:
-                                if isinstance(tag, dict) and 'name' in tag:
-                                    tag_list.append(tag['name'])
-                                elif isinstance(tag, str):
-                                    tag_list.append(tag)
-                        image_data['tags'] = tag_list
-                    
-                    # Add image information as metadata
-                    if image_data.get('id'):
-                        metadata.add_text("ID", str(image_data.get('id')))
-                    if image_data.get('provider'):
-                        metadata.add_text("Provider", str(image_data.get('provider')))
-                    if image_data.get('source'):
-                        metadata.add_text("Source", str(image_data.get('source')))
-                    if image_data.get('width') and image_data.get('height'):
-                        metadata.add_text("Resolution", f"{image_data.get('width')}x{image_data.get('height')}")
-                    # Add frame count metadata for GIFs
-                    if is_gif and image_data.get('frames'):
-                        metadata.add_text("Frames", str(image_data.get('frames')))
-                    if tag_list:
-                        metadata.add_text("Tags", ", ".join(tag_list))
-                    
-                    # Save the PNG with metadata
-                    img.save(save_path, pnginfo=metadata)
-                    print(f"Added metadata to PNG file")
-                
-                # Close the image
-                img.close()
+                if _is_png(part_path):
+                    # Append the metadata to the downloaded PNG
+                    _png_add_text(part_path, _png_metadata(image_data))
+                    log.debug("Added metadata to PNG file")
             except Exception as e:
-                print(f"Error adding metadata to image: {e}")
+                log.error("Error adding metadata to image: %s", e)
                 # Continue even if metadata addition fails
             
+            os.replace(part_path, save_path)
+            _set_origin(save_path, image_data["url"])
+            
             # Show success message
             filename = os.path.basename(save_path)
             message = f"Image auto-downloaded to {filename}" if is_auto_download else f"Image downloaded to {filename}"
-            GLib.idle_add(lambda: self.status_label.set_text(message))
+            self._set_status(message)
             
             # Add GIF frame info to notification if applicable
             gif_info = ""
             if is_gif and image_data.get('frames', 0) > 1:
                 gif_info = f"\nGIF Animation: {image_data.get('frames')} frames"
             
-            # Show notification of successful download
-            def show_success_notification():
-                notification_dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=Gtk.DialogFlags.MODAL,
-                    message_type=Gtk.MessageType.INFO,
-                    buttons=Gtk.ButtonsType.OK_CANCEL,
-                    text="Download Complete"
-                )
-                
-                # Add secondary text showing the path and metadata
-                if image_data.get('width') and image_data.get('height'):
-                    notification_dialog.format_secondary_text(
-                        f"Image saved to: {save_path}\n"
-                        f"Resolution: {image_data.get('width')}x{image_data.get('height')}{gif_info}"
-                    )
-                else:
-                    notification_dialog.format_secondary_text(f"Image saved to: {save_path}{gif_info}")
-                
-                # Add button to open folder
-                notification_dialog.add_button("Open Folder", Gtk.ResponseType.HELP)
-                
-                # Show the dialog
-                response = notification_dialog.run()
-                
-                if response == Gtk.ResponseType.HELP:
-                    # Open the containing folder
-                    self._open_download_folder()
-                
-                notification_dialog.destroy()
-                return False  # Remove idle callback
-            
             # Show notification for manual downloads, or if auto-download setting requests it
             if not is_auto_download or settings.get("show_auto_download_notification", True):
-                GLib.idle_add(show_success_notification)
+                GLib.idle_add(self._show_download_notification, image_data, save_path, gif_info)
         
         except Exception as e:
-            print(f"Error downloading image: {e}")
+            error = str(e)
+            log.error("Error downloading image: %s", error)
             
-            def show_error_dialog():
-                dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.ERROR,
-                    buttons=Gtk.ButtonsType.OK,
-                    text="Download Failed"
-                )
-                dialog.format_secondary_text(str(e))
-                dialog.run()
-                dialog.destroy()
-                return False  # Remove idle callback
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
             
-            GLib.idle_add(lambda: self.status_label.set_text(f"Error: {str(e)}"))
-            GLib.idle_add(show_error_dialog)
+            # Don't leave the file reserved by _auto_download_image behind
+            if is_auto_download:
+                try:
+                    os.remove(save_path)
+                except OSError:
+                    pass
+            
+            self._set_status(f"Error: {error}")
+            GLib.idle_add(self._show_message, Gtk.MessageType.ERROR, "Download Failed", error)
     
     def _load_preview_image(self, image_data: Dict[str, Any], box: Gtk.Box):
         """Load preview image for the dialog.
         
+        A preview decoded for an earlier dialog is reused as is. Otherwise,
+        if the grid thumbnail is still in memory it is shown straight away
+        and swapped for the full image once that has loaded. The full image
+        is only downloaded when the thumbnail's source is smaller than the
+        preview.
+        
         Args:
             image_data: Image data dictionary
             box: Box to add the image to
         """
-        # Create placeholder
-        placeholder_label = Gtk.Label.new("Loading preview...")
-        placeholder_label.set_markup("<span color='#888'>Loading preview...</span>")
-        placeholder_label.get_style_context().add_class("placeholder-label")
+        full = self._preview_cache_get(image_data["url"])
+        cached = full
+        if cached is None and image_data.get("preview"):
+            cached = self._thumb_cache_get((image_data["preview"], THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT))
+        
+        # Widgets may only be created on the main thread, so the placeholder
+        # is built there and handed back through this list
+        placeholder = []
+        
+        def show_placeholder():
+            if cached is not None:
+                # Show the cached preview, or the thumbnail as a first frame
+                pixbuf, animation = cached[0], cached[1]
+                if animation is not None:
+                    placeholder_widget = Gtk.Image.new_from_animation(animation)
+                else:
+                    placeholder_widget = Gtk.Image.new_from_pixbuf(pixbuf)
+            else:
+                placeholder_widget = Gtk.Label.new("Loading preview...")
+                placeholder_widget.set_markup("<span color='#888'>Loading preview...</span>")
+                placeholder_widget.get_style_context().add_class("placeholder-label")
+            box.pack_start(placeholder_widget, False, False, 0)
+            box.reorder_child(placeholder_widget, 0)
+            box.show_all()
+            placeholder.append(placeholder_widget)
+            return False  # Remove idle callback
         
         # Add placeholder to UI immediately
-        GLib.idle_add(lambda: box.pack_start(placeholder_label, False, False, 0) or box.reorder_child(placeholder_label, 0) or box.show_all())
+        GLib.idle_add(show_placeholder)
+        if full is not None:
+            return
+        
+        # Nothing better to fetch if the thumbnail was decoded from the full
+        # image, or its source already covers the preview size
+        if cached is not None:
+            preview_width, preview_height = cached[4]
+            fitted = _fit_size(preview_width, preview_height, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT, upscale=False)
+            if image_data["preview"] == image_data["url"] or fitted != (preview_width, preview_height):
+                return
         
         try:
-            # Load the image in the background with headers
-            headers = {'User-Agent': 'PixelVault Image Downloader'}
-            response = requests.get(image_data["url"], headers=headers, stream=True)
-            response.raise_for_status()
+            # Load the image in the background, decoding straight to preview size
+            with _SESSION.get(image_data["url"], stream=True, timeout=IMAGE_TIMEOUT) as response:
+                response.raise_for_status()
+                loader, width, height = _load_scaled_image(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT, upscale=False
+                )
             
-            # Read the data
-            data_bytes = response.content
+            pixbuf, animation = _split_animation(loader, image_data)
+            self._preview_cache_put(image_data["url"], (pixbuf, animation))
             
-            # Helper function to check if data is a GIF
-            def is_gif(data):
-                return len(data) > 3 and data[:3] == b'GIF'
+            # Update image data with actual dimensions if not present
+            if not image_data.get('width'):
+                image_data['width'] = width
+            if not image_data.get('height'):
+                image_data['height'] = height
             
             # Update the image in the main thread
-            def update_image(data, placeholder):
+            def update_image(pixbuf, animation):
                 try:
+                    # Swap the full image into the thumbnail's widget
+                    if cached is not None:
+                        if animation is not None:
+                            placeholder[0].set_from_animation(animation)
+                        else:
+                            placeholder[0].set_from_pixbuf(pixbuf)
+                        return False  # Remove idle callback
+                    
                     # Remove placeholders
-                    for child in box.get_children():
-                        if child == placeholder:
-                            box.remove(child)
+                    for child in placeholder:
+                        box.remove(child)
                     
                     try:
-                        # Create pixbuf from data
-                        loader = GdkPixbuf.PixbufLoader()
-                        loader.write(data)
-                        loader.close()
-                        
-                        pixbuf = loader.get_pixbuf()
-                        is_animation = is_gif(data) and hasattr(loader, 'get_animation')
-                        animation = loader.get_animation() if is_animation else None
-                        
-                        # Get actual dimensions from pixbuf
-                        actual_width = pixbuf.get_width()
-                        actual_height = pixbuf.get_height()
-                        
-                        # Update image data with actual dimensions if not present
-                        if not image_data.get('width'):
-                            image_data['width'] = actual_width
-                        if not image_data.get('height'):
-                            image_data['height'] = actual_height
-                        
-                        # Scale the pixbuf
-                        max_width = 550
-                        max_height = 400
-                        width = pixbuf.get_width()
-                        height = pixbuf.get_height()
-                        
-                        if width > height:
-                            new_width = min(width, max_width)
-                            new_height = int(height * (new_width / width))
-                        else:
-                            new_height = min(height, max_height)
-                            new_width = int(width * (new_height / height))
-                        
                         # Create and add image widget - use animation if available
-                        if is_animation and animation and not animation.is_static_image():
-                            # For GIF animations
-                            image_data['is_gif'] = True
+                        if animation is not None:
                             image_widget = Gtk.Image.new_from_animation(animation)
                         else:
-                            scaled_pixbuf = pixbuf.scale_simple(new_width, new_height, GdkPixbuf.InterpType.BILINEAR)
-                            image_widget = Gtk.Image.new_from_pixbuf(scaled_pixbuf)
+                            image_widget = Gtk.Image.new_from_pixbuf(pixbuf)
                         
                         box.pack_start(image_widget, False, False, 0)
                         box.reorder_child(image_widget, 0)
                         box.show_all()
                     except Exception as e:
-                        print(f"Error processing preview image: {e}")
+                        log.error("Error processing preview image: %s", e)
                         error_label = Gtk.Label.new(f"Error: {str(e)}")
                         error_label.set_size_request(100, 30)  # Set minimum size for error label
                         box.pack_start(error_label, True, True, 0)
@@ -2304,7 +3650,7 @@ class MainWindow(Gtk.Window):
                     
                     return False  # Remove idle callback
                 except Exception as e:
-                    print(f"Error in update_image: {e}")
+                    log.error("Error in update_image: %s", e)
                     error_label = Gtk.Label.new("Error loading full image")
                     error_label.set_size_request(100, 30)  # Set minimum size for error label
                     box.pack_start(error_label, False, False, 0)
@@ -2312,16 +3658,19 @@ class MainWindow(Gtk.Window):
                     box.show_all()
                     return False  # Remove idle callback
             
-            GLib.idle_add(update_image, data_bytes, placeholder_label)
+            GLib.idle_add(update_image, pixbuf, animation)
             
         except Exception as e:
-            print(f"Error loading preview image: {e}")
+            log.error("Error loading preview image: %s", e)
             
             def show_error():
+                # Keep the thumbnail if there is one
+                if cached is not None:
+                    return False
+                
                 # Remove placeholders
-                for child in box.get_children():
-                    if child == placeholder_label:
-                        box.remove(child)
+                for child in placeholder:
+                    box.remove(child)
                         
                 error_label = Gtk.Label.new("Error loading full image")
                 error_label.get_style_context().add_class("info-label")
@@ -2334,176 +3683,214 @@ class MainWindow(Gtk.Window):
     def _set_as_wallpaper(self, image_data: Dict[str, Any]):
         """Set the image as desktop wallpaper.
         
+        Confirms GIFs with the user, then downloads and applies the image on
+        a background thread so the UI stays responsive.
+        
+        Args:
+            image_data: Image data dictionary
+        """
+        # Determine appropriate file extension
+        ext = _image_extension(image_data)
+        
+        # Handle GIF files
+        if ext == ".gif":
+            # For GIFs, we might want to warn the user they'll only see the first frame as wallpaper
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                flags=0,
+                message_type=Gtk.MessageType.INFO,
+                buttons=Gtk.ButtonsType.OK_CANCEL,
+                text="GIF Animation Warning"
+            )
+            dialog.format_secondary_text(
+                "Setting an animated GIF as wallpaper will only use its first frame.\n"
+                "Do you want to continue?"
+            )
+            dialog.set_modal(True)
+            dialog.connect("response", self._on_gif_wallpaper_response, image_data, ext)
+            dialog.show()
+            return
+        
+        self._start_wallpaper_task(image_data, ext)
+    
+    def _on_gif_wallpaper_response(self, dialog, response, image_data: Dict[str, Any], ext: str):
+        """Set a GIF as wallpaper if the user confirmed the warning.
+        
+        Args:
+            dialog: The warning dialog
+            response: Response ID of the pressed button
+            image_data: Image data dictionary
+            ext: File extension for the image
+        """
+        dialog.destroy()
+        if response == Gtk.ResponseType.OK:
+            self._start_wallpaper_task(image_data, ext)
+    
+    def _start_wallpaper_task(self, image_data: Dict[str, Any], ext: str):
+        """Download and apply the wallpaper on a background thread.
+        
         Args:
             image_data: Image data dictionary
+            ext: File extension for the image
         """
+        self._set_status("Setting wallpaper...")
+        self._submit_io(self._set_as_wallpaper_task, image_data, ext)
+    
+    def _set_as_wallpaper_task(self, image_data: Dict[str, Any], ext: str):
+        """Download the image and apply it as wallpaper.
+        
+        Runs on a background thread; status updates are passed back to the
+        main thread.
+        
+        Args:
+            image_data: Image data dictionary
+            ext: File extension for the downloaded image
+        """
+        # Stream the image straight to a temporary file with correct extension
         try:
-            # Download the image with stream=True to preserve quality
-            headers = {'User-Agent': 'PixelVault Image Downloader'}
-            response = requests.get(image_data["url"], stream=True, headers=headers)
-            response.raise_for_status()
-            
-            # Determine appropriate file extension
-            url = image_data["url"].lower()
-            ext = ".jpg"  # Default extension
-            
-            # Handle GIF files
-            if image_data.get('is_gif', False) or url.endswith(".gif"):
-                ext = ".gif"
-                # For GIFs, we might want to warn the user they'll only see the first frame as wallpaper
-                dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.INFO,
-                    buttons=Gtk.ButtonsType.OK_CANCEL,
-                    text="GIF Animation Warning"
-                )
-                dialog.format_secondary_text(
-                    "Setting an animated GIF as wallpaper will only use its first frame.\n"
-                    "Do you want to continue?"
-                )
-                response = dialog.run()
-                dialog.destroy()
-                
-                if response != Gtk.ResponseType.OK:
-                    return  # User canceled
-            elif url.endswith(".png"):
-                ext = ".png"
-            elif url.endswith(".jpeg"):
-                ext = ".jpg"
-            
-            # Save to a temporary file with correct extension
             temp_fd, temp_path = tempfile.mkstemp(suffix=ext)
-            with os.fdopen(temp_fd, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            # Try to add metadata to wallpaper image
-            try:
-                # Get dimensions from the file
-                img = Image.open(temp_path)
-                width, height = img.size
-                
-                # Update image_data with actual dimensions if they weren't set
-                if not image_data.get('width') or not image_data.get('height'):
-                    image_data['width'] = width
-                    image_data['height'] = height
-                
-                # Create metadata for PNG files
-                if temp_path.lower().endswith('.png'):
-                    metadata = PngImagePlugin.PngInfo()
-                    
-                    # Normalize tags
-                    tag_list = []
-                    if 'tags' in image_data:
-                        if isinstance(image_data['tags'], list):
-                            for tag in image_data['tags']:
-                                if isinstance(tag, dict) and 'name' in tag:
-                                    tag_list.append(tag['name'])
-                                elif isinstance(tag, str):
-                                    tag_list.append(tag)
-                        image_data['tags'] = tag_list
-                    
-                    # Add image information as metadata
-                    if image_data.get('id'):
-                        metadata.add_text("ID", str(image_data.get('id')))
-                    if image_data.get('provider'):
-                        metadata.add_text("Provider", str(image_data.get('provider')))
-                    if image_data.get('source'):
-                        metadata.add_text("Source", str(image_data.get('source')))
-                    if image_data.get('width') and image_data.get('height'):
-                        metadata.add_text("Resolution", f"{image_data.get('width')}x{image_data.get('height')}")
-                    if tag_list:
-                        metadata.add_text("Tags", ", ".join(tag_list))
-                    
-                    # Save the PNG with metadata
-                    img.save(temp_path, pnginfo=metadata)
-                
-                # Close the image
-                img.close()
-            except Exception as e:
-                print(f"Error adding metadata to wallpaper image: {e}")
-                # Continue even if metadata addition fails
-            
-            # Set as wallpaper using gsettings (GNOME)
-            try:
-                subprocess.call([
-                    "gsettings", "set", "org.gnome.desktop.background",
-                    "picture-uri", f"file://{temp_path}"
-                ])
-                self.status_label.set_text(f"Wallpaper set successfully")
-                return
-            except:
-                pass
-            
-            # Try xfconf-query (XFCE)
             try:
-                subprocess.call([
-                    "xfconf-query", "-c", "xfce4-desktop", "-p",
-                    "/backdrop/screen0/monitor0/workspace0/last-image", "-s", temp_path
-                ])
-                self.status_label.set_text(f"Wallpaper set successfully")
-                return
-            except:
-                pass
-            
-            # Try feh (for minimal window managers)
-            try:
-                subprocess.call(["feh", "--bg-fill", temp_path])
-                self.status_label.set_text(f"Wallpaper set successfully")
-                return
-            except:
-                pass
+                with os.fdopen(temp_fd, 'wb') as f, \
+                        _SESSION.get(image_data["url"], stream=True, timeout=IMAGE_TIMEOUT) as response:
+                    response.raise_for_status()
+                    _save_response(response, f)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except (requests.RequestException, OSError) as e:
+            log.error("Error setting wallpaper: %s", e)
+            self._set_status(f"Error setting wallpaper: {str(e)}")
+            return
+        
+        # Try to add metadata to wallpaper image
+        try:
+            # Get dimensions from the file header if the source didn't report them
+            if not image_data.get('width') or not image_data.get('height'):
+                with Image.open(temp_path) as img:
+                    image_data['width'], image_data['height'] = img.size
+            
+            # If PNG, we can add metadata
+            if _is_png(temp_path):
+                # Append the metadata to the downloaded PNG
+                _png_add_text(temp_path, _png_metadata(image_data))
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            log.error("Error adding metadata to wallpaper image: %s", e)
+            # Continue even if metadata addition fails
+        
+        # Hand over to the main loop, which runs the setters asynchronously
+        GLib.idle_add(self._run_wallpaper_setter, list(_find_wallpaper_setters()), temp_path)
+
+    def _run_wallpaper_setter(self, candidates: List[str], path: str):
+        """Start the next wallpaper setter without waiting for it to finish.
+        
+        If the setter fails, the next candidate is tried from its completion
+        callback.
+        
+        Args:
+            candidates: Remaining setters from _find_wallpaper_setters, in order
+            path: Path of the image file
+        """
+        while candidates:
+            setter = candidates.pop(0)
+            if setter == "gnome":
+                if _set_gnome_wallpaper(path):
+                    self._set_status("Wallpaper set successfully")
+                    return False  # Remove idle callback
+                log.debug("GNOME background setting is not writable")
+                continue
             
-            # Try nitrogen
+            argv = [arg.format(path=path) for arg in WALLPAPER_SETTERS[setter]]
             try:
-                subprocess.call(["nitrogen", "--set-zoom-fill", temp_path])
-                self.status_label.set_text(f"Wallpaper set successfully")
-                return
-            except:
-                pass
-                
-            # If we got here, none of the wallpaper setters worked
-            self.status_label.set_text("Failed to set wallpaper - no compatible wallpaper setter found")
-            
-        except Exception as e:
-            print(f"Error setting wallpaper: {e}")
-            self.status_label.set_text(f"Error setting wallpaper: {str(e)}")
-
+                proc = Gio.Subprocess.new(argv, Gio.SubprocessFlags.NONE)
+            except GLib.Error as e:
+                log.debug("Could not start %s: %s", setter, e.message)
+                continue
+            proc.wait_async(None, self._on_wallpaper_setter_done, (setter, candidates, path))
+            return False  # Remove idle callback
+        
+        # If we got here, none of the wallpaper setters worked
+        self._set_status("Failed to set wallpaper - no compatible wallpaper setter found")
+        return False  # Remove idle callback
+    
+    def _on_wallpaper_setter_done(self, proc, result, data):
+        """Handle a wallpaper setter exiting.
+        
+        Args:
+            proc: The setter's Gio.Subprocess
+            result: Async result for the wait
+            data: Tuple of (setter, remaining candidates, image path)
+        """
+        setter, candidates, path = data
+        try:
+            proc.wait_finish(result)
+        except GLib.Error as e:
+            log.debug("Waiting for %s failed: %s", setter, e.message)
+        
+        if proc.get_successful():
+            self._set_status("Wallpaper set successfully")
+        else:
+            log.debug("Wallpaper setter %s failed", setter)
+            self._run_wallpaper_setter(candidates, path)
+    
     def _on_sort_changed(self, combo):
         """Handle sort method change.
         
+        The reload is delayed briefly so clicking through several options
+        only fetches the last one, and skipped if the sorting is unchanged.
+        
         Args:
             combo: The ComboBox widget
         """
         active = combo.get_active()
         
+        # A newer selection replaces any reload still waiting to run
+        if self._sort_debounce_id:
+            GLib.source_remove(self._sort_debounce_id)
+            self._sort_debounce_id = 0
+        
+        source = self.source_manager.current_source
+        if active < 0:
+            return  # Nothing selected
+        
         # Handle Wallhaven source
-        if self.source_manager.current_source == ImageSource.WALLHAVEN:
-            # Update sorting based on selection
-            if active == 0:  # Latest
-                self.wallhaven_sorting = WallhavenSorting.DATE_ADDED
-                self.wallhaven_method = "latest"
-            elif active == 1:  # Top
-                self.wallhaven_sorting = WallhavenSorting.TOPLIST
-                self.wallhaven_method = "top"
-            elif active == 2:  # Random
-                self.wallhaven_sorting = WallhavenSorting.RANDOM
-                self.wallhaven_method = "random"
+        if source == ImageSource.WALLHAVEN:
+            new_sort = WALLHAVEN_SORT_OPTIONS[active]
+            current_sort = (self.wallhaven_sorting, self.wallhaven_method)
         
         # Handle Nekos.moe source
-        elif self.source_manager.current_source == ImageSource.NEKOSMOE:
-            # Map sort options to nekos.moe sort methods
-            if active == 0:  # Latest
-                self.nekosmoe_sort = "newest"
-            elif active == 1:  # Top
-                self.nekosmoe_sort = "likes"
-            elif active == 2:  # Random
-                self.nekosmoe_sort = "random"
+        elif source == ImageSource.NEKOSMOE:
+            new_sort = NEKOSMOE_SORT_OPTIONS[active]
+            current_sort = self.nekosmoe_sort
+        
+        else:
+            return
+        
+        if new_sort == current_sort:
+            return
+        
+        self._sort_debounce_id = GLib.timeout_add(SORT_DEBOUNCE_MS, self._apply_sort, source, new_sort)
+    
+    def _apply_sort(self, source, new_sort):
+        """Apply a sort selection and reload the images.
+        
+        Args:
+            source: Image source the selection was made for
+            new_sort: Entry from WALLHAVEN_SORT_OPTIONS or NEKOSMOE_SORT_OPTIONS
+        """
+        self._sort_debounce_id = 0
+        
+        # The source changed while the reload was pending
+        if source != self.source_manager.current_source:
+            return False
+        
+        if source == ImageSource.WALLHAVEN:
+            self.wallhaven_sorting, self.wallhaven_method = new_sort
+        else:
+            self.nekosmoe_sort = new_sort
         
         # Reset and load images with new sorting
         self._load_images(reset=True)
+        return False  # Remove timeout
 
     def _on_settings_clicked(self, button):
         """Handle settings button click.
@@ -2511,130 +3898,132 @@ class MainWindow(Gtk.Window):
         Args:
             button: The Button widget
         """
+        # SettingsDialog shows itself; handle its buttons from the response
+        # signal so the main loop isn't nested while it's open
         dialog = SettingsDialog(self)
-        response = dialog.run()
+        dialog.set_modal(True)
+        dialog.connect("response", self._on_settings_response)
+    
+    def _on_settings_response(self, dialog, response):
+        """Handle the settings dialog closing.
         
+        Args:
+            dialog: The SettingsDialog
+            response: Response ID of the pressed button
+        """
         if response == Gtk.ResponseType.OK:
-            # Get the previous API keys before saving
-            previous_wallhaven_key = settings.get("wallhaven_api_key", "")
-            previous_nekosmoe_key = settings.get("nekosmoe_api_key", "")
-            
             # Save settings
-            dialog.save_settings()
-            
-            # Check if Wallhaven API key changed
-            new_wallhaven_key = settings.get("wallhaven_api_key", "")
-            if new_wallhaven_key != previous_wallhaven_key:
-                # Update the API client
-                self.source_manager.update_wallhaven_api_key(new_wallhaven_key)
-                
-                # Refresh images if currently using Wallhaven
-                if self.source_manager.current_source == ImageSource.WALLHAVEN:
-                    self._load_images(reset=True)
-                    
-                    # Show a status message
-                    if new_wallhaven_key:
-                        self.status_label.set_text("Wallhaven API key updated. Refreshing images.")
-                    else:
-                        self.status_label.set_text("Wallhaven API key removed. Refreshing images.")
-            
-            # Check if Nekos.moe API key changed
-            new_nekosmoe_key = settings.get("nekosmoe_api_key", "")
-            if new_nekosmoe_key != previous_nekosmoe_key:
-                # Update the API client
-                self.source_manager.update_nekosmoe_api_key(new_nekosmoe_key)
-                
-                # Refresh images if currently using Nekos.moe
-                if self.source_manager.current_source == ImageSource.NEKOSMOE:
-                    self._load_images(reset=True)
-                    
-                    # Show a status message
-                    if new_nekosmoe_key:
-                        self.status_label.set_text("Nekos.moe API token updated. Refreshing images.")
-                    else:
-                        self.status_label.set_text("Nekos.moe API token removed. Refreshing images.")
+            changes = dialog.save_settings()
+            self._apply_api_key_settings(changes, refresh=True)
         
         dialog.destroy()
+    
+    def _apply_api_key_settings(self, changes: Dict[str, tuple], refresh: bool):
+        """Hand saved API keys that differ from the ones in use to the API clients.
+        
+        Only keys the dialog changed are looked at, and those are compared
+        with the ones the clients actually hold, so a key saved while
+        another source was active still reaches its client.
+        
+        Args:
+            changes: Changed settings as returned by SettingsDialog.save_settings
+            refresh: Whether to reload the images if the current source's key changed
+        """
+        current_source = self.source_manager.current_source
+        
+        # Check if Wallhaven API key changed
+        new_wallhaven_key = changes.get("wallhaven_api_key", (None, None))[1]
+        if new_wallhaven_key is not None and \
+                not _same_key(new_wallhaven_key, self.source_manager.wallhaven_api_key):
+            # Update the API client
+            self.source_manager.update_wallhaven_api_key(new_wallhaven_key)
+            
+            # Refresh images if currently using Wallhaven
+            if refresh and current_source == ImageSource.WALLHAVEN:
+                self._queue_reload()
+                
+                # Show a status message
+                if new_wallhaven_key:
+                    self._set_status("Wallhaven API key updated. Refreshing images.")
+                else:
+                    self._set_status("Wallhaven API key removed. Refreshing images.")
+        
+        # Check if Nekos.moe API key changed
+        new_nekosmoe_key = changes.get("nekosmoe_api_key", (None, None))[1]
+        if new_nekosmoe_key is not None and \
+                not _same_key(new_nekosmoe_key, self.source_manager.nekosmoe_api_key):
+            # Update the API client
+            self.source_manager.update_nekosmoe_api_key(new_nekosmoe_key)
+            
+            # Refresh images if currently using Nekos.moe
+            if refresh and current_source == ImageSource.NEKOSMOE:
+                self._queue_reload()
+                
+                # Show a status message
+                if new_nekosmoe_key:
+                    self._set_status("Nekos.moe API token updated. Refreshing images.")
+                else:
+                    self._set_status("Nekos.moe API token removed. Refreshing images.")
 
     def _on_api_key_button_clicked(self, button, parent_dialog):
         """Open the settings dialog to add an API key from the advanced options dialog.
         
         Args:
             button: The Button widget
-            parent_dialog: The parent dialog to hide
+            parent_dialog: The advanced options dialog the button is in
         """
-        # Hide the parent dialog temporarily
-        parent_dialog.hide()
-        
-        # Open settings dialog
+        # Open settings dialog on top of the advanced options, which stay
+        # open underneath
         settings_dialog = SettingsDialog(self)
+        settings_dialog.set_transient_for(parent_dialog)
+        settings_dialog.set_modal(True)
         
-        # Determine which API tab to select based on current source
-        tab_index = 2  # Default to Wallhaven API tab (index 2)
+        # Select the API tab for the current source
+        tab_index = SettingsDialog.WALLHAVEN_TAB
         if self.source_manager.current_source == ImageSource.NEKOSMOE:
-            tab_index = 3  # Nekos.moe API tab (index 3)
-        
-        # Select the appropriate API tab
-        notebook = None
-        for child in settings_dialog.get_content_area().get_children():
-            if isinstance(child, Gtk.Notebook):
-                notebook = child
-                break
+            tab_index = SettingsDialog.NEKOSMOE_TAB
+        settings_dialog.notebook.set_current_page(tab_index)
         
-        if notebook:
-            notebook.set_current_page(tab_index)
+        settings_dialog.connect("response", self._on_api_key_settings_response)
+    
+    def _on_api_key_settings_response(self, settings_dialog, response):
+        """Handle the settings dialog opened from the advanced options closing.
         
-        response = settings_dialog.run()
+        The images aren't reloaded here; applying the advanced options does that.
         
+        Args:
+            settings_dialog: The SettingsDialog
+            response: Response ID of the pressed button
+        """
         if response == Gtk.ResponseType.OK:
-            # Get the previous API keys before saving
-            previous_wallhaven_key = settings.get("wallhaven_api_key", "")
-            previous_nekosmoe_key = settings.get("nekosmoe_api_key", "")
-            
             # Save settings
-            settings_dialog.save_settings()
-            
-            # Update the appropriate API client based on current source
-            if self.source_manager.current_source == ImageSource.WALLHAVEN:
-                # Check if Wallhaven API key changed
-                new_wallhaven_key = settings.get("wallhaven_api_key", "")
-                if new_wallhaven_key != previous_wallhaven_key:
-                    # Update the API client
-                    self.source_manager.update_wallhaven_api_key(new_wallhaven_key)
-            elif self.source_manager.current_source == ImageSource.NEKOSMOE:
-                # Check if Nekos.moe API key changed
-                new_nekosmoe_key = settings.get("nekosmoe_api_key", "")
-                if new_nekosmoe_key != previous_nekosmoe_key:
-                    # Update the API client
-                    self.source_manager.update_nekosmoe_api_key(new_nekosmoe_key)
+            changes = settings_dialog.save_settings()
+            self._apply_api_key_settings(changes, refresh=False)
         
         settings_dialog.destroy()
-        
-        # Show the parent dialog again
-        parent_dialog.show()
 
-    def _on_purity_check_toggled(self, button):
+    def _on_purity_check_toggled(self, button, bit):
         """Handle purity checkbox toggled to prevent all being unchecked.
         
         Args:
             button: The CheckButton that was toggled
+            bit: The button's bit in the purity mask
         """
+        if button.get_active():
+            self._purity_mask |= bit
+        else:
+            self._purity_mask &= ~bit
+        
         # Check if all purity checkboxes would be unchecked
-        if not self.sfw_check.get_active() and not self.sketchy_check.get_active() and not self.nsfw_check.get_active():
+        if self._purity_mask == 0:
             # Revert the toggle that would lead to all being unchecked
             button.set_active(True)
             
             # Show a warning to the user
-            dialog = Gtk.MessageDialog(
-                transient_for=self,
-                flags=0,
-                message_type=Gtk.MessageType.WARNING,
-                buttons=Gtk.ButtonsType.OK,
-                text="At least one content filter must be selected"
+            self._show_message(
+                Gtk.MessageType.WARNING, "At least one content filter must be selected",
+                "Please select at least one of: SFW, Sketchy, or NSFW"
             )
-            dialog.format_secondary_text("Please select at least one of: SFW, Sketchy, or NSFW")
-            dialog.run()
-            dialog.destroy()
 
     def _on_wallhaven_search_activated(self, entry):
         """Handle search entry activation.
@@ -2642,8 +4031,7 @@ class MainWindow(Gtk.Window):
         Args:
             entry: The SearchEntry widget
         """
-        self.search_query = entry.get_text()
-        self._load_images(reset=True)
+        self._queue_search(entry.get_text())
 
     def _on_wallhaven_search_clicked(self, button):
         """Handle search button click.
@@ -2651,8 +4039,7 @@ class MainWindow(Gtk.Window):
         Args:
             button: The Button widget
         """
-        self.search_query = self.wallhaven_search_entry.get_text()
-        self._load_images(reset=True)
+        self._queue_search(self.wallhaven_search_entry.get_text())
 
     def _on_wallhaven_clear_clicked(self, button):
         """Handle clear search button click.
@@ -2661,5 +4048,29 @@ class MainWindow(Gtk.Window):
             button: The Button widget
         """
         self.wallhaven_search_entry.set_text("")
-        self.search_query = ""
+        self._queue_search("")
+    
+    def _queue_search(self, query: str):
+        """Search for a query once the search controls settle.
+        
+        Enter, the search button and clear all reload from page 1; a short
+        delay lets a burst of them (held Enter, search-clear-search) run a
+        single fetch for the last query.
+        
+        Args:
+            query: Search query, empty for none
+        """
+        if self._search_debounce_id:
+            GLib.source_remove(self._search_debounce_id)
+        self._search_debounce_id = GLib.timeout_add(SEARCH_DEBOUNCE_MS, self._apply_search, query)
+    
+    def _apply_search(self, query: str):
+        """Apply a queued search and reload the images.
+        
+        Args:
+            query: Search query, empty for none
+        """
+        self._search_debounce_id = 0
+        self.search_query = query
         self._load_images(reset=True)
+        return False  # Remove timeout
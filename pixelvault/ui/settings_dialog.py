@@ -1,16 +1,26 @@
 import gi
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, Gio
+from gi.repository import Gtk
+import logging
 import os
 from pathlib import Path
-import subprocess
 import threading
 
 from ..settings import settings
+from .desktop import open_folder
+from .icons import themed_icon
+
+log = logging.getLogger("pixelvault.ui")
 
 class SettingsDialog(Gtk.Dialog):
     """Dialog for managing application settings."""
     
+    # Notebook page indices, in the order the tabs are created
+    GENERAL_TAB = 0
+    AUTO_DOWNLOAD_TAB = 1
+    WALLHAVEN_TAB = 2
+    NEKOSMOE_TAB = 3
+    
     def __init__(self, parent):
         """Initialize the settings dialog.
         
@@ -30,7 +40,7 @@ class SettingsDialog(Gtk.Dialog):
         self.set_resizable(True)
         
         # Create notebook for tabbed interface
-        notebook = Gtk.Notebook()
+        notebook = self.notebook = Gtk.Notebook()
         content_area = self.get_content_area()
         content_area.set_margin_top(10)
         content_area.set_margin_bottom(10)
@@ -230,8 +240,7 @@ class SettingsDialog(Gtk.Dialog):
         
         # Show/Hide toggle button for API key
         show_button = Gtk.ToggleButton()
-        show_icon = Gio.ThemedIcon(name="view-reveal-symbolic")
-        show_image = Gtk.Image.new_from_gicon(show_icon, Gtk.IconSize.BUTTON)
+        show_image = Gtk.Image.new_from_gicon(themed_icon("view-reveal-symbolic"), Gtk.IconSize.BUTTON)
         show_button.add(show_image)
         show_button.set_tooltip_text("Show/Hide API Key")
         show_button.connect("toggled", self._on_show_api_key_toggled)
@@ -317,8 +326,7 @@ class SettingsDialog(Gtk.Dialog):
         
         # Show/Hide toggle button for API key
         show_button = Gtk.ToggleButton()
-        show_icon = Gio.ThemedIcon(name="view-reveal-symbolic")
-        show_image = Gtk.Image.new_from_gicon(show_icon, Gtk.IconSize.BUTTON)
+        show_image = Gtk.Image.new_from_gicon(themed_icon("view-reveal-symbolic"), Gtk.IconSize.BUTTON)
         show_button.add(show_image)
         show_button.set_tooltip_text("Show/Hide API Token")
         show_button.connect("toggled", self._on_show_nekosmoe_api_key_toggled)
@@ -373,8 +381,9 @@ class SettingsDialog(Gtk.Dialog):
                         buttons=Gtk.ButtonsType.OK,
                         text=f"Could not create download directory: {e}"
                     )
-                    dialog.run()
-                    dialog.destroy()
+                    dialog.set_modal(True)
+                    dialog.connect("response", lambda d, _r: d.destroy())
+                    dialog.show()
                     
                     # Turn off the switch
                     switch.set_active(False)
@@ -426,33 +435,23 @@ class SettingsDialog(Gtk.Dialog):
                 text="Directory does not exist"
             )
             dialog.format_secondary_text(f"The directory '{download_dir}' does not exist.")
-            dialog.run()
-            dialog.destroy()
+            dialog.set_modal(True)
+            dialog.connect("response", lambda d, _r: d.destroy())
+            dialog.show()
             return
         
-        # Try to open the directory using various file managers
-        try:
-            subprocess.Popen(["xdg-open", download_dir])
-        except:
-            try:
-                subprocess.Popen(["nautilus", download_dir])
-            except:
-                try:
-                    subprocess.Popen(["thunar", download_dir])
-                except:
-                    try:
-                        subprocess.Popen(["dolphin", download_dir])
-                    except:
-                        dialog = Gtk.MessageDialog(
-                            transient_for=self,
-                            flags=0,
-                            message_type=Gtk.MessageType.ERROR,
-                            buttons=Gtk.ButtonsType.OK,
-                            text="Could not open folder"
-                        )
-                        dialog.format_secondary_text("No compatible file manager found.")
-                        dialog.run()
-                        dialog.destroy()
+        if not open_folder(download_dir):
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                flags=0,
+                message_type=Gtk.MessageType.ERROR,
+                buttons=Gtk.ButtonsType.OK,
+                text="Could not open folder"
+            )
+            dialog.format_secondary_text("No compatible file manager found.")
+            dialog.set_modal(True)
+            dialog.connect("response", lambda d, _r: d.destroy())
+            dialog.show()
     
     def _on_reset_clicked(self, button):
         """Handle reset button click.
@@ -622,16 +621,15 @@ class SettingsDialog(Gtk.Dialog):
             GLib.idle_add(lambda: button.set_sensitive(True))
     
     def save_settings(self):
-        """Save settings from the dialog."""
-        # Get previous auto-download setting to check if it changed
-        previous_auto_download = settings.get("auto_download", False)
+        """Save settings from the dialog.
         
-        # Auto download
-        auto_download = self.auto_download_switch.get_active()
-        settings.set("auto_download", auto_download)
+        Returns:
+            Dict mapping each setting that changed to its (old, new) values
+        """
+        values = {}
         
-        # Log the auto-download setting change for debugging
-        print(f"Auto-download setting changed: {previous_auto_download} -> {auto_download}")
+        # Auto download
+        values["auto_download"] = self.auto_download_switch.get_active()
         
         # Download directory
         download_dir = self.download_dir_entry.get_text()
@@ -639,35 +637,32 @@ class SettingsDialog(Gtk.Dialog):
             # Create directory if it doesn't exist
             try:
                 os.makedirs(download_dir, exist_ok=True)
-                settings.set("download_directory", download_dir)
-                print(f"Download directory set to: {download_dir}")
+                values["download_directory"] = download_dir
             except Exception as e:
-                print(f"Error creating download directory: {e}")
+                log.error("Error creating download directory: %s", e)
                 # Keep old value
                 self.download_dir_entry.set_text(settings.get("download_directory", ""))
         
         # Show notifications
-        settings.set("show_auto_download_notification", self.notification_switch.get_active())
+        values["show_auto_download_notification"] = self.notification_switch.get_active()
         
         # Organize by source
-        settings.set("organize_by_source", self.organize_switch.get_active())
+        values["organize_by_source"] = self.organize_switch.get_active()
         
         # Filename format
         active_format = self.filename_combo.get_active()
         if active_format == 0:
-            settings.set("filename_format", "original")
+            values["filename_format"] = "original"
         elif active_format == 1:
-            settings.set("filename_format", "source_id")
+            values["filename_format"] = "source_id"
         elif active_format == 2:
-            settings.set("filename_format", "date_id")
+            values["filename_format"] = "date_id"
         
         # Wallhaven API key
-        api_key = self.api_key_entry.get_text().strip()
-        settings.set("wallhaven_api_key", api_key)
+        values["wallhaven_api_key"] = self.api_key_entry.get_text().strip()
         
         # Nekos.moe API key
-        nekosmoe_api_key = self.nekosmoe_api_key_entry.get_text().strip()
-        settings.set("nekosmoe_api_key", nekosmoe_api_key)
+        values["nekosmoe_api_key"] = self.nekosmoe_api_key_entry.get_text().strip()
         
-        # Force save the settings to ensure they're written to disk
-        settings.save() 
\ No newline at end of file
+        # Write everything to disk in one go
+        return settings.update(values) 
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""Background worker pools for the PixelVault UI."""
+
+import itertools
+import logging
+import queue
+import threading
+from typing import Any, Callable
+
+log = logging.getLogger("pixelvault.ui")
+
+
+class PriorityTask:
+    """Handle for a callable queued on a PriorityThreadPool."""
+
+    def __init__(self, pool: "PriorityThreadPool", fn: Callable, args: tuple):
+        self._pool = pool
+        self._fn = fn
+        self._args = args
+        self._lock = threading.Lock()
+        self._started = False
+        self._cancelled = False
+        self.priority = None
+
+    def cancel(self) -> bool:
+        """Cancel the task if it hasn't started running.
+
+        Returns:
+            True if the task will not run, False if it already started
+        """
+        with self._lock:
+            if not self._started:
+                self._cancelled = True
+            return self._cancelled
+
+    def pending(self) -> bool:
+        """Check whether the task is still waiting in the queue."""
+        with self._lock:
+            return not self._started and not self._cancelled
+
+    def set_priority(self, priority: Any):
+        """Move the task to a new position in the queue.
+
+        Args:
+            priority: New priority; lower values run first
+        """
+        if priority != self.priority and self.pending():
+            self._pool._push(self, priority)
+
+    def _claim(self) -> bool:
+        with self._lock:
+            if self._started or self._cancelled:
+                return False
+            self._started = True
+            return True
+
+
+class PriorityThreadPool:
+    """Fixed-size thread pool that runs queued tasks lowest priority first.
+
+    Unlike ThreadPoolExecutor, tasks can be re-prioritized while they wait,
+    so work for widgets scrolled into view can jump ahead of the rest. Ties
+    are broken by submission order.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker"):
+        """Start the worker threads.
+
+        Args:
+            max_workers: Number of worker threads
+            thread_name_prefix: Prefix for the worker thread names
+        """
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._shutdown = False
+        self._threads = []
+        for i in range(max_workers):
+            thread = threading.Thread(
+                target=self._worker, name=f"{thread_name_prefix}_{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, priority: Any, fn: Callable, *args) -> PriorityTask:
+        """Queue a callable.
+
+        Args:
+            priority: Task priority; lower values run first
+            fn: Callable to run on a worker thread
+            *args: Arguments for the callable
+
+        Returns:
+            Handle that can cancel or re-prioritize the task
+        """
+        if self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        task = PriorityTask(self, fn, args)
+        self._push(task, priority)
+        return task
+
+    def shutdown(self):
+        """Stop the workers once their current tasks finish.
+
+        Queued tasks are dropped.
+        """
+        self._shutdown = True
+        for _ in self._threads:
+            # Sentinels sort ahead of any real task; the leading flag keeps
+            # them from being compared with task priorities
+            self._queue.put((False, (), next(self._seq), None))
+
+    def _push(self, task: PriorityTask, priority: Any):
+        # Re-prioritizing leaves the old entry in the heap; it is skipped when
+        # popped because its priority no longer matches the task's
+        task.priority = priority
+        self._queue.put((True, priority, next(self._seq), task))
+
+    def _worker(self):
+        while True:
+            _is_task, priority, _seq, task = self._queue.get()
+            if task is None:
+                return
+            if priority != task.priority or not task._claim():
+                continue
+            try:
+                task._fn(*task._args)
+            except Exception:
+                log.exception("Error in worker task")